@@ -0,0 +1,401 @@
+""" Module contains the streaming aggregation of operand columns: count, sum, mean,
+    variance, min/max and quantiles computed in a single pass over iterators or chunked
+    arrays, in constant memory, with numerically stable algorithms.
+"""
+
+# Importing modules
+import itertools
+import math
+
+from .calculator import _numpy, convert_number_array, parse_operand
+
+# Number of values of an iterator converted and aggregated at once
+CHUNK_SIZE = 65536
+
+
+class NeumaierSum:
+    """ Compensated sum, keeping the low-order bits lost by each addition in a separate
+        compensation term (Kahan-Babuska-Neumaier), so that the error does not grow with
+        the number of values
+    """
+    __slots__ = ('total', 'compensation')
+
+    def __init__(self):
+        self.total = 0.0
+        self.compensation = 0.0
+
+    def add(self, value):
+        """ Add a value to the sum
+        """
+        total = self.total + value
+        if abs(self.total) >= abs(value):
+            self.compensation += (self.total - total) + value
+        else:
+            self.compensation += (value - total) + self.total
+        self.total = total
+
+    def add_array(self, values):
+        """ Add an array of values with a vectorized compensated pairwise summation:
+            the values are added pairwise level by level, and the rounding error of
+            each pair, given exactly by the TwoSum transformation, is summed separately
+        """
+        while len(values) > 1:
+            if len(values) % 2:
+                self.add(float(values[-1]))
+                values = values[:-1]
+            first, second = values[0::2], values[1::2]
+            total = first + second
+            virtual = total - first
+            errors = (first - (total - virtual)) + (second - virtual)
+            self.add(float(errors.sum()))
+            values = total
+        if len(values):
+            self.add(float(values[0]))
+
+    @property
+    def value(self):
+        """ Compensated value of the sum
+        """
+        # The compensation of an infinite sum is not a number
+        return self.total + self.compensation if math.isfinite(self.total) else self.total
+
+
+class RunningMoments:
+    """ Count, mean and sum of the squared deviations of a stream of values, updated
+        with Welford's algorithm for single values and merged with Chan's formula for
+        chunks and other instances, avoiding the cancellation of the sum of squares
+    """
+    __slots__ = ('count', 'mean', 'squares')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.squares = 0.0
+
+    def add(self, value):
+        """ Add a value (Welford)
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.squares += delta * (value - self.mean)
+
+    def add_array(self, values):
+        """ Add an array of values, whose moments are computed in two passes
+        """
+        count = len(values)
+        if count:
+            mean = float(values.mean())
+            deviations = values - mean
+            self.merge(count, mean, float(deviations @ deviations))
+
+    def merge(self, count, mean, squares):
+        """ Merge the moments of another set of values (Chan)
+
+            Args:
+                count(int): number of values
+                mean(float): mean of the values
+                squares(float): sum of the squared deviations from the mean
+        """
+        if not count:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.squares += squares + delta * delta * self.count * count / total
+        self.count = total
+
+
+class QuantileSketch:
+    """ Approximate quantiles of a stream with a relative accuracy guarantee: the values
+        are counted in logarithmic buckets [gamma**(i-1), gamma**i], so that any quantile
+        is returned within the relative accuracy of the exact one. The number of buckets
+        is bounded, the lowest ones being merged beyond the maximum.
+    """
+    def __init__(self, relative_accuracy=0.01, max_buckets=4096):
+        """ Args:
+                relative_accuracy(float): maximum relative error of the quantiles
+                max_buckets(int): maximum number of buckets per sign
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError('The relative accuracy must be between 0 and 1')
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self._positive = {}
+        self._negative = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def _key(self, magnitude):
+        """ Index of the bucket of a positive value
+        """
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def add(self, value):
+        """ Count a finite value
+        """
+        if value > 0:
+            key = self._key(value)
+            self._positive[key] = self._positive.get(key, 0) + 1
+            self._collapse(self._positive)
+        elif value < 0:
+            key = self._key(-value)
+            self._negative[key] = self._negative.get(key, 0) + 1
+            self._collapse(self._negative)
+        else:
+            self.zero_count += 1
+        self.count += 1
+
+    def add_array(self, values):
+        """ Count an array of finite values
+        """
+        np = _numpy()
+        zeros = values == 0
+        zero_count = int(np.count_nonzero(zeros))
+        if zero_count:
+            values = values[~zeros]
+        if len(values):
+            # Bucket index and sign of each value in a single code, 2 * key + negative,
+            # counted at once without splitting the values by sign
+            codes = np.ceil(np.log(np.abs(values)) * (1 / self._log_gamma))
+            codes *= 2
+            codes += values < 0
+            codes = codes.astype(np.int64)
+            low = int(codes.min())
+            counts = np.bincount(codes - low)
+            present = counts.nonzero()[0]
+            for code, count in zip((present + low).tolist(), counts[present].tolist()):
+                store = self._negative if code & 1 else self._positive
+                store[code >> 1] = store.get(code >> 1, 0) + count
+            self._collapse(self._positive)
+            self._collapse(self._negative)
+        self.zero_count += zero_count
+        self.count += len(values) + zero_count
+
+    def _collapse(self, store):
+        """ Merge the buckets of the smallest magnitudes beyond the maximum number
+        """
+        if len(store) > self.max_buckets:
+            keys = sorted(store)
+            excess = keys[:len(keys) - self.max_buckets + 1]
+            store[excess[-1]] = sum(store.pop(key) for key in excess)
+
+    def merge(self, other):
+        """ Add the counts of another sketch of the same relative accuracy
+        """
+        if other.gamma != self.gamma:
+            raise ValueError('Only sketches of the same relative accuracy can be merged')
+        for store, other_store in ((self._positive, other._positive),
+                                   (self._negative, other._negative)):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+            self._collapse(store)
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def _value(self, key):
+        """ Value representing a bucket, within the relative accuracy of its bounds
+        """
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def quantile(self, fraction):
+        """ Get the approximate quantile, None when no value was counted
+
+            Args:
+                fraction(float): quantile between 0 and 1, e.g. 0.5 for the median
+        """
+        if not 0 <= fraction <= 1:
+            raise ValueError('The quantile must be between 0 and 1')
+        if not self.count:
+            return None
+        rank = fraction * (self.count - 1)
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._value(key)
+        return self._value(max(self._positive))
+
+
+class StreamingStatistics:
+    """ Single-pass statistics of a stream of operands: count, compensated sum, mean,
+        variance, min/max and approximate quantiles, in memory independent of the number
+        of values. The operands which are not valid numbers (or nan) are counted as
+        invalid and skipped.
+    """
+    def __init__(self, relative_accuracy=0.01, chunk_size=CHUNK_SIZE):
+        """ Args:
+                relative_accuracy(float): maximum relative error of the quantiles
+                chunk_size(int): number of values of an iterator aggregated at once
+        """
+        self.chunk_size = chunk_size
+        self.invalid = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._sum = NeumaierSum()
+        self._moments = RunningMoments()
+        self._sketch = QuantileSketch(relative_accuracy)
+
+    def update(self, value):
+        """ Aggregate a single operand
+
+            Args:
+                value(str/int/float): operand text or number
+        """
+        try:
+            value = float(parse_operand(value) if isinstance(value, str) else value)
+        except (TypeError, ValueError, OverflowError):
+            self.invalid += 1
+            return
+        if math.isnan(value):
+            self.invalid += 1
+            return
+        self._sum.add(value)
+        self._moments.add(value)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        if math.isfinite(value):
+            self._sketch.add(value)
+
+    def update_array(self, values):
+        """ Aggregate a chunk of operands
+
+            Args:
+                values(sequence/ndarray): operands given as numbers or strings
+        """
+        np = _numpy()
+        array, valid = convert_number_array(values)
+        array = array.reshape(-1)
+        valid = valid.reshape(-1)
+        if not valid.all():
+            self.invalid += len(valid) - int(np.count_nonzero(valid))
+            array = array[valid]
+        if not len(array):
+            return
+        self._sum.add_array(array)
+        self._moments.add_array(array)
+        self.minimum = min(self.minimum, float(array.min()))
+        self.maximum = max(self.maximum, float(array.max()))
+        finite = np.isfinite(array)
+        self._sketch.add_array(array if finite.all() else array[finite])
+
+    def consume(self, values):
+        """ Aggregate the operands of an iterable, e.g. a generator or a file column,
+            chunk by chunk
+
+            Args:
+                values(iterable): operands given as numbers or strings
+        """
+        iterator = iter(values)
+        while True:
+            chunk = list(itertools.islice(iterator, self.chunk_size))
+            if not chunk:
+                break
+            self.update_array(chunk)
+        return self
+
+    def merge(self, other):
+        """ Merge the statistics of another instance, e.g. computed on another shard
+        """
+        self.invalid += other.invalid
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self._sum.add(other._sum.total)
+        self._sum.add(other._sum.compensation)
+        self._moments.merge(other._moments.count, other._moments.mean, other._moments.squares)
+        self._sketch.merge(other._sketch)
+        return self
+
+    @property
+    def count(self):
+        """ Number of valid operands
+        """
+        return self._moments.count
+
+    @property
+    def sum(self):
+        """ Compensated sum of the operands
+        """
+        return self._sum.value
+
+    @property
+    def mean(self):
+        """ Mean of the operands, None without operand
+        """
+        return self._moments.mean if self.count else None
+
+    def variance(self, ddof=0):
+        """ Variance of the operands, None without enough operands
+
+            Args:
+                ddof(int): 0 for the population variance, 1 for the sample variance
+        """
+        if self.count <= ddof:
+            return None
+        return self._moments.squares / (self.count - ddof)
+
+    def std(self, ddof=0):
+        """ Standard deviation of the operands, None without enough operands
+
+            Args:
+                ddof(int): 0 for the population deviation, 1 for the sample deviation
+        """
+        variance = self.variance(ddof)
+        return None if variance is None else math.sqrt(variance)
+
+    def quantile(self, fraction):
+        """ Approximate quantile of the finite operands, within the relative accuracy
+
+            Args:
+                fraction(float): quantile between 0 and 1, e.g. 0.5 for the median
+        """
+        return self._sketch.quantile(fraction)
+
+    def percentile(self, percent):
+        """ Approximate percentile of the finite operands, e.g. 99 for p99
+        """
+        return self.quantile(percent / 100)
+
+    def summary(self):
+        """ Get the statistics as a dictionary
+        """
+        return {
+            'count': self.count,
+            'invalid': self.invalid,
+            'sum': self.sum,
+            'mean': self.mean,
+            'variance': self.variance(),
+            'std': self.std(),
+            'min': self.minimum if self.count else None,
+            'max': self.maximum if self.count else None,
+            'p50': self.quantile(0.5),
+            'p90': self.quantile(0.9),
+            'p99': self.quantile(0.99),
+        }
+
+
+def aggregate(values, relative_accuracy=0.01, chunk_size=CHUNK_SIZE):
+    """ Compute the streaming statistics of the operands of an iterable or array
+
+        Args:
+            values(iterable/ndarray): operands given as numbers or strings
+            relative_accuracy(float): maximum relative error of the quantiles
+            chunk_size(int): number of values of an iterator aggregated at once
+    """
+    statistics = StreamingStatistics(relative_accuracy, chunk_size)
+    np = _numpy()
+    if isinstance(values, np.ndarray):
+        flat_values = values.reshape(-1)
+        for start in range(0, len(flat_values), chunk_size):
+            statistics.update_array(flat_values[start:start + chunk_size])
+        return statistics
+    return statistics.consume(values)
@@ -0,0 +1,205 @@
+""" Module contains the headless batch processing of calculator operations, which
+    streams rows of "operator,first,second[,arith_operator]" from CSV or JSON lines
+    input through the calculator and writes the results incrementally.
+"""
+
+# Importing modules
+import csv
+import itertools
+import json
+import math
+import sys
+import time
+
+from .calculator import INVALID_INPUT_MESSAGE, NUMERIC_MODES, ScientificCalculator
+
+# Columns of the input rows and of the written results
+INPUT_FIELDS = ('operator', 'first', 'second', 'arith_operator')
+OUTPUT_FIELDS = INPUT_FIELDS + ('output', 'message')
+
+
+def read_csv_rows(stream):
+    """ Generator yielding the rows of a CSV input as tuples of strings,
+        skipping an optional header row
+
+        Args:
+            stream(file): text stream of the CSV input
+    """
+    for row in csv.reader(stream):
+        row = tuple(field.strip() for field in row)
+        if not row or row == INPUT_FIELDS[:len(row)]:
+            continue
+        yield row
+
+
+def read_jsonl_rows(stream):
+    """ Generator yielding the rows of a JSON lines input as tuples of strings,
+        each line being an object with the operator, first, second and
+        arith_operator keys
+
+        Args:
+            stream(file): text stream of the JSON lines input
+    """
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            yield tuple('' if record.get(field) is None else str(record[field])
+                        for field in INPUT_FIELDS)
+        except (ValueError, AttributeError):
+            # Keep the invalid line, so it is reported in the output
+            yield (line.strip(),)
+
+
+def process_row(calculator, row):
+    """ Perform the operation of a single input row
+
+        Args:
+            calculator(ScientificCalculator): calculator performing the operation
+            row(tuple): operator, first operand, second operand and optional
+                        arithmetic operator of the row
+
+        Returns:
+            tuple: output data and display message of the operation
+    """
+    if not 3 <= len(row) <= 4:
+        return '', INVALID_INPUT_MESSAGE
+    operator, first_num, second_num = row[:3]
+    arith_operator = row[3] if len(row) == 4 and row[3] else None
+
+    if operator in calculator.get_scientific_operators():
+        if first_num and second_num and arith_operator not in calculator.get_operators():
+            return '', INVALID_INPUT_MESSAGE
+        return calculator.perform_scientific_operation(operator, first_num, second_num,
+                                                       arith_operator)
+    if operator in calculator.get_operators() and arith_operator is None:
+        return calculator.perform_operation(operator, first_num, second_num)
+    return '', INVALID_INPUT_MESSAGE
+
+
+class CsvResultWriter:
+    """ Writer of the results as CSV rows
+    """
+    def __init__(self, stream):
+        self.writer = csv.writer(stream, lineterminator='\n')
+        self.writer.writerow(OUTPUT_FIELDS)
+
+    def write(self, row, output_data, message):
+        """ Write the input row along with its output data and message
+        """
+        padded_row = (tuple(row) + ('',) * len(INPUT_FIELDS))[:len(INPUT_FIELDS)]
+        self.writer.writerow(padded_row + (output_data, message))
+
+
+class JsonlResultWriter:
+    """ Writer of the results as JSON lines
+    """
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, row, output_data, message):
+        """ Write the input row along with its output data and message
+        """
+        record = dict(itertools.zip_longest(INPUT_FIELDS, row[:len(INPUT_FIELDS)]))
+        if isinstance(output_data, float) and not math.isfinite(output_data):
+            # JSON has no infinity nor nan
+            record['output'] = None
+        elif isinstance(output_data, (int, float)):
+            record['output'] = output_data
+        else:
+            record['output'] = str(output_data)
+        record['message'] = message
+        self.stream.write(json.dumps(record, allow_nan=False) + '\n')
+
+
+READERS = {'csv': read_csv_rows, 'jsonl': read_jsonl_rows}
+WRITERS = {'csv': CsvResultWriter, 'jsonl': JsonlResultWriter}
+
+
+def run_batch(input_stream, output_stream, input_format='csv', output_format=None,
+              chunk_size=1000, calculator=None):
+    """ Stream the input rows through the calculator and write the results chunk by
+        chunk, so the memory use does not depend on the size of the input
+
+        Args:
+            input_stream(file): text stream of the input rows
+            output_stream(file): text stream receiving the results
+            input_format(str): 'csv' or 'jsonl'
+            output_format(str): 'csv' or 'jsonl', same as the input format by default
+            chunk_size(int): number of rows processed between two writes
+            calculator(ScientificCalculator): calculator performing the operations
+
+        Returns:
+            int: number of processed rows
+    """
+    calculator = calculator or ScientificCalculator()
+    rows = READERS[input_format](input_stream)
+    writer = WRITERS[output_format or input_format](output_stream)
+
+    processed_rows = 0
+    while True:
+        chunk = list(itertools.islice(rows, chunk_size))
+        if not chunk:
+            break
+        for row in chunk:
+            writer.write(row, *process_row(calculator, row))
+        output_stream.flush()
+        processed_rows += len(chunk)
+    return processed_rows
+
+
+def add_arguments(parser):
+    """ Add the arguments of the batch command to the parser
+
+        Args:
+            parser(argparse.ArgumentParser): parser of the batch command
+    """
+    parser.add_argument('input', nargs='?', default='-',
+                        help='input file of operator,first,second[,arith_operator] rows '
+                             '(default: stdin)')
+    parser.add_argument('-o', '--output', default='-', help='output file (default: stdout)')
+    parser.add_argument('-f', '--format', choices=sorted(READERS),
+                        help='input format, guessed from the file extension by default')
+    parser.add_argument('--output-format', choices=sorted(WRITERS),
+                        help='output format, same as the input format by default')
+    parser.add_argument('-c', '--chunk-size', type=int, default=1000,
+                        help='number of rows processed between two writes')
+    parser.add_argument('--numeric-mode', default='float',
+                        choices=tuple(NUMERIC_MODES),
+                        help='numeric type of the arithmetic operations')
+    parser.set_defaults(handler=run_command)
+
+
+def run_command(args):
+    """ Run the batch command for the parsed command line arguments
+
+        Args:
+            args(argparse.Namespace): parsed arguments of the batch command
+    """
+    input_format = args.format or ('jsonl' if args.input.endswith(('.jsonl', '.json'))
+                                   else 'csv')
+    input_stream = (sys.stdin if args.input == '-'
+                    else open(args.input, newline='', encoding='utf-8'))
+    output_stream = (sys.stdout if args.output == '-'
+                     else open(args.output, 'w', newline='', encoding='utf-8'))
+
+    start_time = time.perf_counter()
+    try:
+        processed_rows = run_batch(
+            input_stream,
+            output_stream,
+            input_format,
+            args.output_format,
+            args.chunk_size,
+            ScientificCalculator(numeric_mode=args.numeric_mode),
+        )
+    finally:
+        for stream in (input_stream, output_stream):
+            if stream not in (sys.stdin, sys.stdout):
+                stream.close()
+    elapsed = time.perf_counter() - start_time
+
+    print('Processed {} rows in {:.3f} s ({:,.0f} rows/sec)'.format(
+        processed_rows, elapsed, processed_rows / elapsed if elapsed else 0), file=sys.stderr)
+    return 0
@@ -0,0 +1,170 @@
+""" Module contains the bulk processing of binary operand columns, which memory-maps
+    raw float64/int64 or .npy files, evaluates a calculator operation chunk by chunk
+    and writes the outputs into a memory-mapped result file, so that the memory use
+    is bounded by the chunk size and not by the number of rows.
+"""
+
+# Importing modules
+import sys
+import time
+from collections import namedtuple
+
+from .calculator import ScientificCalculator, _numpy
+from .results import STATUS_CODES
+
+# Error code written for each row in the optional errors file (the status code of the
+# row), 0 when the row succeeded
+ERROR_CODES = STATUS_CODES
+
+# Memory of the calculator working arrays per row of a chunk: the float operands and
+# output, the masks, the status codes and the temporary arrays
+ROW_BYTES = 64
+
+# Default bound of the memory used by the chunks
+DEFAULT_MEMORY_LIMIT = 64 * 2 ** 20
+
+BulkResult = namedtuple('BulkResult', ['rows', 'failed_rows'])
+
+
+def open_operands(path, dtype='float64'):
+    """ Memory-map a column of operands without reading it
+
+        Args:
+            path(str): .npy file, or raw binary file of the values of dtype
+            dtype(str): type of the values of a raw file, e.g. 'float64' or 'int64'
+    """
+    np = _numpy()
+    if path.endswith('.npy'):
+        column = np.load(path, mmap_mode='r')
+    else:
+        column = np.memmap(path, dtype=dtype, mode='r')
+    if column.ndim != 1 or column.dtype.kind not in 'biuf':
+        raise ValueError('Operands must be a column of numbers: {}'.format(path))
+    return column
+
+
+def create_output(path, rows, dtype='float64'):
+    """ Create a memory-mapped column receiving the results
+
+        Args:
+            path(str): .npy file, or raw binary file of the values of dtype
+            rows(int): number of rows of the column
+            dtype(str): type of the values
+    """
+    np = _numpy()
+    if path.endswith('.npy'):
+        return np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(rows,))
+    return np.memmap(path, dtype=dtype, mode='w+', shape=(rows,))
+
+
+def run_bulk(operator, first_path, second_path=None, output_path=None, arith_operator=None,
+             errors_path=None, dtype='float64', memory_limit=DEFAULT_MEMORY_LIMIT,
+             calculator=None):
+    """ Evaluate an operation over memory-mapped operand columns, chunk by chunk, and
+        write the outputs (nan for the failed rows) into a memory-mapped result file
+
+        Args:
+            operator(str): arithmetic operator or scientific function
+            first_path(str): file of the first operands
+            second_path(str): file of the second operands, required by the arithmetic
+                              operators and combined with arith_operator by the functions
+            output_path(str): file receiving the float64 outputs
+            arith_operator(str): operator combining both columns of a scientific function
+            errors_path(str): optional file receiving the uint8 error code of each row
+                              (see ERROR_CODES)
+            dtype(str): type of the values of the raw operand files
+            memory_limit(int): bound in bytes of the memory used by a chunk
+            calculator(ScientificCalculator): calculator performing the operation
+
+        Returns:
+            BulkResult: number of rows and of failed rows
+    """
+    calculator = calculator or ScientificCalculator()
+    if operator in calculator.registry.binary:
+        if second_path is None:
+            raise ValueError('The operator {} requires two columns'.format(operator))
+
+        def evaluate(first, second):
+            return calculator.calculate_batch(operator, first, second)
+    elif operator in calculator.registry.unary:
+        def evaluate(first, second):
+            return calculator.calculate_scientific_batch(operator, first, second,
+                                                         arith_operator)
+    else:
+        raise ValueError('Unsupported operator: {}'.format(operator))
+    if output_path is None:
+        raise ValueError('An output file is required')
+
+    first_column = open_operands(first_path, dtype)
+    second_column = None if second_path is None else open_operands(second_path, dtype)
+    if second_column is not None and len(second_column) != len(first_column):
+        raise ValueError('The operand columns have different lengths')
+    rows = len(first_column)
+    output = create_output(output_path, rows)
+    errors = None if errors_path is None else create_output(errors_path, rows, 'uint8')
+
+    chunk_size = max(1, memory_limit // ROW_BYTES)
+    failed_rows = 0
+    for start in range(0, rows, chunk_size):
+        stop = min(start + chunk_size, rows)
+        result = evaluate(first_column[start:stop],
+                          None if second_column is None else second_column[start:stop])
+        output[start:stop] = result.values
+        failed_rows += result.failed_rows
+        if errors is not None:
+            errors[start:stop] = result.status
+
+    # Write the dirty pages of the result files
+    for column in (output, errors):
+        if column is not None:
+            column.flush()
+    return BulkResult(rows, failed_rows)
+
+
+def add_arguments(parser):
+    """ Add the arguments of the bulk command to the parser
+
+        Args:
+            parser(argparse.ArgumentParser): parser of the bulk command
+    """
+    parser.add_argument('operator', help='arithmetic operator or scientific function')
+    parser.add_argument('first', help='.npy or raw binary file of the first operands')
+    parser.add_argument('second', nargs='?', help='.npy or raw binary file of the second operands')
+    parser.add_argument('-o', '--output', required=True,
+                        help='.npy or raw float64 file receiving the outputs')
+    parser.add_argument('-e', '--errors', help='.npy or raw uint8 file receiving the error codes')
+    parser.add_argument('-a', '--arith-operator',
+                        help='operator combining both columns of a scientific function')
+    parser.add_argument('--dtype', default='float64', choices=('float64', 'int64'),
+                        help='type of the values of the raw operand files')
+    parser.add_argument('-m', '--memory-limit', type=int, default=DEFAULT_MEMORY_LIMIT // 2 ** 20,
+                        help='memory used by a chunk in MiB (default: %(default)s)')
+    parser.add_argument('--angle-mode', default='rad', choices=('rad', 'deg', 'grad'),
+                        help='unit of the angles of the trigonometric functions')
+    parser.set_defaults(handler=run_command)
+
+
+def run_command(args):
+    """ Run the bulk command for the parsed command line arguments
+
+        Args:
+            args(argparse.Namespace): parsed arguments of the bulk command
+    """
+    start_time = time.perf_counter()
+    result = run_bulk(
+        args.operator,
+        args.first,
+        args.second,
+        args.output,
+        args.arith_operator,
+        args.errors,
+        args.dtype,
+        args.memory_limit * 2 ** 20,
+        ScientificCalculator(angle_mode=args.angle_mode),
+    )
+    elapsed = time.perf_counter() - start_time
+
+    print('Processed {} rows ({} failed) in {:.3f} s ({:,.0f} rows/sec)'.format(
+        result.rows, result.failed_rows, elapsed, result.rows / elapsed if elapsed else 0),
+        file=sys.stderr)
+    return 0
@@ -0,0 +1,75 @@
+""" Module contains the bounded LRU cache used for storing calculator results.
+"""
+
+# Importing modules
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+class ResultCache:
+    """ Thread-safe bounded cache which evicts the least recently used entry
+        once the maximum size is reached
+    """
+    def __init__(self, maxsize=128):
+        """ Args:
+                maxsize(int): maximum number of entries kept in the cache
+        """
+        if maxsize <= 0:
+            raise ValueError('Cache size must be a positive number')
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """ Get the cached value for the key and mark it as recently used
+
+            Args:
+                key(tuple): hashable key of the entry
+                default: value returned when the key is not cached
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """ Store the value for the key, evicting the least recently used entry
+            when the cache is full
+
+            Args:
+                key(tuple): hashable key of the entry
+                value: value to be cached
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def cache_info(self):
+        """ Get the hit, miss and eviction counters along with the cache size
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._entries))
+
+    def cache_clear(self):
+        """ Remove all the entries and reset the counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
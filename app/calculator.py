@@ -2,38 +2,220 @@
 """
 
 # Importing modules
-import math
+import cmath
+import decimal
+import fractions
 import re
 import logging
+import sys
 
-# Create and configure logger
-logging.basicConfig(filename="logFile.log",
-                    format='%(asctime)s : %(levelname)s : %(name)s : %(message)s',
-                    filemode='w')
-# Creating an object
+from .cache import ResultCache
+from .operations import (ANGLE_MODES, REGISTRY, check_exact_size, from_radians,
+                         to_radians)
+from .results import (INVALID_INPUT, INVALID_INPUT_MESSAGE, MATH_DOMAIN, MATH_DOMAIN_MESSAGE,
+                      OK, STATUS_MESSAGES, ZERO_DIVISION, ZERO_DIVISION_MESSAGE, BatchResult,
+                      OperationResult)
+
+# Creating an object, the handlers are configured explicitly
+# with app.logging_config.configure_logging
 logger = logging.getLogger('calculatorLogs')
+logger.addHandler(logging.NullHandler())
+# Child logger for the per-input details, which can be silenced on the hot path
+details_logger = logging.getLogger('calculatorLogs.details')
 
-# Setting the threshold of logger to DEBUG
+# Setting the threshold of logger to INFO
 logger.setLevel(logging.INFO)
 
+# Error type of each error message, as counted by the metrics
+ERROR_TYPES = {
+    INVALID_INPUT_MESSAGE: 'invalid_input',
+    ZERO_DIVISION_MESSAGE: 'zero_division',
+    MATH_DOMAIN_MESSAGE: 'math_domain',
+}
+
+
+# Numeric types available for the arithmetic operations
+NUMERIC_MODES = {
+    'float': float,
+    'decimal': decimal.Decimal,
+    'fraction': fractions.Fraction,
+    'complex': complex,
+}
+
+# Hexadecimal operand, the decimal operands are validated by the int/float parsers
+_HEX_PATTERN = re.compile(r'\s*(?P<sign>[+-]?)0[xX](?P<digits>[0-9a-fA-F](?:_?[0-9a-fA-F])*)\s*',
+                          re.ASCII)
+
+
+def _check_finite(value, text):
+    """ Reject the float and complex operands whose exponent overflows, e.g. "1e400",
+        rather than returning an infinite value
+    """
+    if isinstance(value, (float, complex)) and not cmath.isfinite(value):
+        raise ValueError('Operand out of range: {!r}'.format(text))
+    return value
+
+
+def parse_operand(text, numeric_mode='float'):
+    """ Validate and convert the operand text into a number in a single pass.
+        Supports negative numbers, exponents, hexadecimal integers and underscores
+        between digits.
+
+        Args:
+            text(str): operand text provided by the user
+            numeric_mode(str): 'float' for integer or float values, 'decimal' for
+                               decimal.Decimal values, 'fraction' for exact
+                               fractions.Fraction values (which accept "1/3" as well)
+                               and 'complex' for complex values such as "3+4j"
+
+        Raises:
+            ValueError: if the text is not a valid number
+    """
+    # The builtin parsers accept exactly the ASCII decimal number grammar, apart from
+    # the inf/nan spellings which all contain an 'n'
+    if text.isascii() and 'n' not in text and 'N' not in text:
+        if numeric_mode == 'float':
+            if '.' not in text and 'e' not in text and 'E' not in text:
+                try:
+                    return int(text)
+                except ValueError:
+                    # A digit string over the digit limit of the interpreter is too
+                    # large, rather than an infinite float
+                    if text.strip().lstrip('+-').replace('_', '').isdigit():
+                        raise
+            try:
+                value = float(text)
+            except ValueError:
+                pass
+            else:
+                return _check_finite(value, text)
+        else:
+            try:
+                value = NUMERIC_MODES[numeric_mode](text)
+            except (ValueError, ArithmeticError):
+                pass
+            else:
+                return _check_finite(value, text)
+
+    match = _HEX_PATTERN.fullmatch(text)
+    if match is None:
+        raise ValueError('Invalid operand: {!r}'.format(text))
+    value = int(match.group('digits'), 16)
+    if match.group('sign') == '-':
+        value = -value
+    return value if numeric_mode == 'float' else NUMERIC_MODES[numeric_mode](value)
+
 
 def convert_number(func):
     """ Custom Decorator to convert string values either in integer or float value,
-        based on the condition
+        based on the condition. Values which are already numbers are passed as is.
     """
     def inner(*args, **kwargs):
-        arg_list = list(args)
-        args = []
-        for arg in arg_list:
-            args.append(int(arg) if arg.isdigit() else float(arg))
+        args = [parse_operand(arg) if isinstance(arg, str) else arg for arg in args]
         return func(*args, **kwargs)
     return inner
 
 
-class Calculator:
-    """ Base class for calculator which performs all arithmetic operations
+def _numpy():
+    """ Import NumPy on first use, so that importing the calculator for the scalar
+        operations does not pay for it
     """
-    def perform_operation(self, operator, first_num, second_num):
+    import numpy  # pylint: disable=import-outside-toplevel
+    return numpy
+
+
+def convert_number_array(values, numeric_mode='float'):
+    """ Convert a sequence or array of operands into a float array, along with
+        a boolean mask of the entries which hold a valid number
+
+        Args:
+            values(sequence/ndarray): operands given as numbers or strings
+            numeric_mode(str): 'float' for a float array, 'complex' for a complex array
+    """
+    np = _numpy()
+    kinds, dtype = ('biufc', np.complex128) if numeric_mode == 'complex' else ('biuf', np.float64)
+    try:
+        array = np.asarray(values)
+        if array.dtype.kind not in kinds:
+            raise TypeError('Operands are not numeric')
+        array = array.astype(dtype, copy=False)
+    except (TypeError, ValueError):
+        # Strings, mixed or invalid entries, convert them one by one
+        objects = np.asarray(values, dtype=object)
+        array = np.empty(objects.shape, dtype=dtype)
+        flat_array = array.reshape(-1)
+        for index, value in enumerate(objects.reshape(-1)):
+            try:
+                flat_array[index] = (parse_operand(value, numeric_mode) if isinstance(value, str)
+                                     else value)
+            except (TypeError, ValueError, OverflowError):
+                flat_array[index] = np.nan
+    return array, ~np.isnan(array)
+
+
+def _operation_method(registry, owner, name):
+    """ Get the operation method named by get_operators() or get_scientific_operators(),
+        taking the operands as numbers or strings. The arithmetic methods return the
+        (output data, message) tuple, the message being set on a division by zero,
+        and the scientific methods their value.
+
+        Raises:
+            AttributeError: if no registered operation has the method name
+    """
+    operation = registry.by_method.get(name)
+    if operation is None:
+        raise AttributeError('{!r} object has no attribute {!r}'.format(owner, name))
+    if operation.arity == 1:
+        return convert_number(operation.function)
+
+    def method(input1, input2):
+        try:
+            return operation.function(input1, input2), None
+        except ZeroDivisionError:
+            # Handle division by zero error
+            return '', ZERO_DIVISION_MESSAGE
+    return convert_number(method)
+
+
+class OperationMethods(type):
+    """ Metaclass resolving the operation method names on the calculator classes,
+        e.g. Calculator._add
+    """
+    def __getattr__(cls, name):
+        if name.startswith('__') or name == 'registry':
+            raise AttributeError(name)
+        return _operation_method(cls.registry, cls.__name__, name)
+
+
+class Calculator(metaclass=OperationMethods):
+    """ Base class for calculator which performs all arithmetic operations. An instance
+        can be shared by threads: the operations keep their state in local variables
+        and the optional cache, metrics and history synchronize themselves.
+    """
+    # Registry of the operations performed by the calculator
+    registry = REGISTRY
+
+    def __init__(self, cache_size=None, numeric_mode='float', precision=28, metrics=None,
+                 history=None):
+        """ Args:
+                cache_size(int): maximum number of results kept in the LRU result cache,
+                                 caching is disabled when not provided
+                numeric_mode(str): numeric type of the arithmetic operations,
+                                   one of 'float', 'decimal' or 'fraction'
+                precision(int): number of significant digits in the 'decimal' mode
+                metrics(OperationMetrics): collector of the call counts, error counts and
+                                           phase latencies, instrumentation is disabled
+                                           when not provided
+                history(HistoryStore): store recording every performed operation,
+                                       no history is kept when not provided
+        """
+        self.cache = ResultCache(cache_size) if cache_size else None
+        self.metrics = metrics
+        self.history = history
+        self.numeric_mode = self._check_numeric_mode(numeric_mode)
+        self.decimal_context = decimal.Context(prec=precision)
+
+    def perform_operation(self, operator, first_num, second_num, numeric_mode=None):
         """ Main method for base calculator to perform arithmetic operation
             based on the provided inputs.
 
@@ -41,132 +223,287 @@ class Calculator:
                  operator(str): operator symbol to perform the requested operation
                  first_num(str): first input operand for the operation
                  second_num(str): second input operand for the operation
+                 numeric_mode(str): numeric type overriding the mode of the instance
+
+            Returns:
+                 tuple: output data ('' on failure) and display message of the operation
         """
-        # logging the input operator and operands
-        self.initial_logging_statements(operator, first_num, second_num)
+        return self.calculate(operator, first_num, second_num, numeric_mode).as_tuple()
+
+    def calculate(self, operator, first_num, second_num, numeric_mode=None):
+        """ Perform the arithmetic operation like perform_operation, returning an
+            OperationResult whose display message is only rendered when it is read
 
-        # get the method name from the operator
-        operation_method = self.get_operators().get(operator)
+            Args:
+                 operator(str): operator symbol to perform the requested operation
+                 first_num(str): first input operand for the operation
+                 second_num(str): second input operand for the operation
+                 numeric_mode(str): numeric type overriding the mode of the instance
+        """
+        numeric_mode = self._check_numeric_mode(numeric_mode or self.numeric_mode)
+        result = self._cached_operation(operator, first_num, second_num, numeric_mode)
+        if self.history is not None:
+            self.history.record(operator, first_num, second_num, None, result, numeric_mode)
+        return result
+
+    def _cached_operation(self, operator, first_num, second_num, numeric_mode):
+        """ Perform the arithmetic operation through the result cache and the metrics
+            timer, without recording it in the history
+        """
+        timer = self.metrics.timer(operator) if self.metrics is not None else None
+        result = self._lookup_operation(operator, first_num, second_num, numeric_mode, timer)
+        if timer is not None:
+            timer.finish(ERROR_TYPES.get(STATUS_MESSAGES[result.status]))
+        return result
+
+    def _lookup_operation(self, operator, first_num, second_num, numeric_mode, timer=None):
+        """ Perform the arithmetic operation through the result cache, timing its phases
+            with the timer of the calling operation if any
+        """
+        if self.cache is None:
+            return self._perform_operation(operator, first_num, second_num, numeric_mode,
+                                           timer)
+        # Serve the repeated operations from the result cache
+        key = (operator, first_num, second_num, numeric_mode)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._perform_operation(operator, first_num, second_num, numeric_mode,
+                                             timer)
+            self.cache.put(key, result)
+        return result
 
-        # validation check for empty inputs
-        if first_num == '' or second_num == '':
-            display_operation = 'Please provide valid input.'
-            logger.warning(display_operation)
-            return '', display_operation
+    @staticmethod
+    def _check_numeric_mode(numeric_mode):
+        """ Validate the numeric mode of the arithmetic operations
+        """
+        if numeric_mode not in NUMERIC_MODES:
+            raise ValueError('Unsupported numeric mode: {}'.format(numeric_mode))
+        return numeric_mode
 
-        # validation check for the invalid input values
-        if ((first_num and not re.search(r'[^ a-zA-z\s\t.(){}]+', first_num)) or
-                                second_num and not re.search(r'[^ a-zA-z\s\t.(){}]+', second_num)):
-            display_operation = 'Please provide valid input.'
-            logger.warning(display_operation)
-            return '', display_operation
-
-        # get the output data and message for the performed operation
-        output_data, message = getattr(self, operation_method)(first_num, second_num)
-        logger.info("Output: %s", str(output_data))
-
-        # If error occurs, log the warning
-        if message:
-            display_operation = message
-            logger.warning(display_operation)
-        else:
-            display_operation = 'Operation Performed: {}{}{}={}'.format(
-                first_num,
-                operator,
-                second_num,
-                str(output_data)
-            )
-            logger.info(display_operation)
+    def cache_info(self):
+        """ Get the hit, miss and eviction counters of the result cache
+        """
+        return self.cache.cache_info() if self.cache is not None else None
 
-        return output_data, display_operation
+    def cache_clear(self):
+        """ Remove all the results from the result cache
+        """
+        if self.cache is not None:
+            self.cache.cache_clear()
 
-    @staticmethod
-    def get_operators():
-        """ Mapping to get operator function based on the provided operator
+    def _perform_operation(self, operator, first_num, second_num, numeric_mode, timer=None):
+        """ Perform the arithmetic operation without looking up the result cache,
+            timing each phase when a metrics timer is provided
         """
-        mapping = {
-            '+': '_add',
-            '-': '_subtract',
-            '*': '_multiply',
-            '/': '_division',
-        }
-        return mapping
+        # logging the input operator and operands
+        self.initial_logging_statements(operator, first_num, second_num)
+        if timer is not None:
+            timer.lap('logging')
 
-    @staticmethod
-    def initial_logging_statements(operator, first_num, second_num):
-        """ Utility function for logging the details of operators and operands
+        # get the registered operation from the operator
+        operation = self.registry.binary.get(operator)
+
+        # validate and convert the input values, empty inputs and unknown operators
+        # are invalid as well
+        try:
+            if operation is None:
+                raise ValueError('Unsupported operator: {}'.format(operator))
+            first_value = parse_operand(first_num, numeric_mode)
+            second_value = parse_operand(second_num, numeric_mode)
+        except ValueError:
+            logger.warning(INVALID_INPUT_MESSAGE)
+            return OperationResult(None, INVALID_INPUT, operator, (first_num, second_num))
+        if timer is not None:
+            timer.lap('parse')
+
+        # get the output data for the performed operation,
+        # rounding the decimal values to the precision of the instance
+        status = OK
+        try:
+            if numeric_mode == 'decimal':
+                with decimal.localcontext(self.decimal_context):
+                    output_data = operation.function(first_value, second_value)
+            elif numeric_mode == 'complex':
+                output_data = self._complex_function(operation)(first_value, second_value)
+            else:
+                output_data = check_exact_size(operation.function(first_value, second_value))
+        except ZeroDivisionError:
+            # Handle division by zero error
+            output_data, status = None, ZERO_DIVISION
+        except (ArithmeticError, ValueError):
+            # Handle the inputs out of the operation domain, e.g. overflows
+            output_data, status = None, MATH_DOMAIN
+        if timer is not None:
+            timer.lap('operation')
+        details_logger.info("Output: %s", output_data)
+
+        # The display message is rendered by the logging handlers only, if any
+        result = OperationResult(output_data, status, operator, (first_num, second_num))
+        if status == OK:
+            logger.info("%s", result)
+        else:
+            logger.warning("%s", result)
+        if timer is not None:
+            timer.lap('logging')
+
+        return result
+
+    def perform_operation_batch(self, operator, first_nums, second_nums):
+        """ Batch method for base calculator to perform arithmetic operation
+            over whole columns of operands at once.
 
             Args:
                  operator(str): operator symbol to perform the requested operation
-                 first_num(str): first input operand for the operation
-                 second_num(str): second input operand for the operation
-        """
-        logger.info("Input 1: %s", first_num)
-        logger.info("Input 2: %s", second_num)
-        logger.info("Operator selected: %s", operator)
+                 first_nums(sequence/ndarray): first input operands for the operation
+                 second_nums(sequence/ndarray): second input operands for the operation
 
+            Returns:
+                 tuple: float array with the output of each row (nan for failed rows)
+                 and an object array with the error message of each row
+                 (None for the rows which succeeded)
+        """
+        return self.calculate_batch(operator, first_nums, second_nums).as_tuple()
 
-    @staticmethod
-    @convert_number
-    def _add(input1, input2):
-        """ Perform the arithmetic addition operation for input values
+    def calculate_batch(self, operator, first_nums, second_nums):
+        """ Perform the arithmetic operation over whole columns like
+            perform_operation_batch, returning a BatchResult with a status code per row
+            instead of the messages
 
             Args:
-                input1(int/float): first input value
-                input2(int/float): second input value
+                 operator(str): operator symbol to perform the requested operation
+                 first_nums(sequence/ndarray): first input operands for the operation
+                 second_nums(sequence/ndarray): second input operands for the operation
         """
-        message = None
-        operation = input1 + input2
-        return operation, message
+        # get the vectorized function from the operator
+        operation = self.registry.binary.get(operator)
+        if operation is None:
+            raise ValueError('Unsupported operator: {}'.format(operator))
+        np = _numpy()
+        array_operation = operation.vectorized()
+        # The complex mode evaluates complex arrays, the other modes float arrays
+        numeric_mode = 'complex' if self.numeric_mode == 'complex' else 'float'
+        # Without a complex implementation, the operation is out of its domain
+        defined = numeric_mode != 'complex' or operation.complex_function is not None
+
+        first_array, first_valid = convert_number_array(first_nums, numeric_mode)
+        second_array, second_valid = convert_number_array(second_nums, numeric_mode)
+        first_array, second_array, first_valid, second_valid = np.broadcast_arrays(
+            first_array, second_array, first_valid, second_valid)
+
+        # validation check for the invalid input values
+        valid = first_valid & second_valid
+        status = np.zeros(valid.shape, dtype=np.uint8)
+        status[~valid] = INVALID_INPUT
+        if not defined:
+            status[valid] = MATH_DOMAIN
+            valid[...] = False
+
+        # Mask the rows which would divide by zero
+        if operation.nonzero_divisor:
+            zero_division = valid & (second_array == 0)
+            status[zero_division] = ZERO_DIVISION
+            valid &= ~zero_division
+
+        # get the output data for the valid rows only
+        output_data = np.full(valid.shape, np.nan, dtype=first_array.dtype)
+        if defined:
+            with np.errstate(all='ignore'):
+                array_operation(first_array, second_array, out=output_data, where=valid)
+
+        # Rows without a real result, e.g. a negative base with a fractional exponent
+        domain_error = valid & np.isnan(output_data)
+        status[domain_error] = MATH_DOMAIN
+        valid &= ~domain_error
+
+        failed_rows = valid.size - np.count_nonzero(valid)
+        logger.info("Batch operation performed: %s on %d rows", operator, valid.size)
+        if failed_rows:
+            logger.warning("Batch operation failed for %d rows", failed_rows)
+
+        return BatchResult(output_data, status, operator)
 
     @staticmethod
-    @convert_number
-    def _subtract(input1, input2):
-        """ Perform the arithmetic subtraction operation for input values
+    def aggregate(values, **kwargs):
+        """ Compute the count, sum, mean, variance, min/max and quantiles of a stream
+            of operands in a single pass, e.g. Calculator.aggregate(column).summary()
 
             Args:
-                input1(int/float): first input value
-                input2(int/float): second input value
+                 values(iterable/ndarray): operands given as numbers or strings
+                 kwargs: relative_accuracy of the quantiles and chunk_size
         """
-        message = None
-        operation = input1 - input2
-        return operation, message
+        # pylint: disable=import-outside-toplevel
+        from .aggregation import aggregate
+
+        return aggregate(values, **kwargs)
 
     @staticmethod
-    @convert_number
-    def _multiply(input1, input2):
-        """ Perform the arithmetic multiplication operation for input values
+    def _complex_function(operation):
+        """ Get the implementation of the operation for the complex numbers
 
-            Args:
-                input1(int/float): first input value
-                input2(int/float): second input value
+            Raises:
+                ValueError: if the operation is not defined for the complex numbers
+        """
+        if operation.complex_function is None:
+            raise ValueError('Unsupported operator for complex numbers: {}'.format(
+                operation.symbol))
+        return operation.complex_function
+
+    def __getattr__(self, name):
+        """ Operation methods named by get_operators() and get_scientific_operators(),
+            e.g. _add or _sin, behaving as the former static methods
+        """
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return _operation_method(self.registry, type(self).__name__, name)
+
+    @classmethod
+    def get_operators(cls):
+        """ Mapping to get operator function based on the provided operator,
+            precomputed by the registry (do not modify it)
         """
-        message = None
-        operation = input1 * input2
-        return operation, message
+        return cls.registry.binary_methods
 
     @staticmethod
-    @convert_number
-    def _division(input1, input2):
-        """ Perform the arithmetic division operation for input values
+    def initial_logging_statements(operator, first_num, second_num):
+        """ Utility function for logging the details of operators and operands
 
             Args:
-                input1(int/float): first input value
-                input2(int/float): second input value
+                 operator(str): operator symbol to perform the requested operation
+                 first_num(str): first input operand for the operation
+                 second_num(str): second input operand for the operation
         """
-        message = None
-        try:
-            operation = input1 / input2
-        except ZeroDivisionError:
-            # Handle division by zero error
-            operation = ''
-            message = "Number 2 can't be zero. Please provide correct input."
-        return operation, message
+        details_logger.info("Input 1: %s", first_num)
+        details_logger.info("Input 2: %s", second_num)
+        details_logger.info("Operator selected: %s", operator)
 
 
 class ScientificCalculator(Calculator):
     """ Class for calculator which performs all scientific operations
     """
+    def __init__(self, *args, angle_mode='rad', fast_math=None, **kwargs):
+        """ Args:
+                angle_mode(str): unit of the angles of the trigonometric functions,
+                                 one of 'rad', 'deg' or 'grad'
+                fast_math(FastMath): lookup tables approximating the scientific functions
+                                     in the batch operations, which are exact when not
+                                     provided. The other arguments are the ones of Calculator.
+        """
+        super().__init__(*args, **kwargs)
+        self.angle_mode = angle_mode
+        self.fast_math = fast_math
+
+    @property
+    def angle_mode(self):
+        """ Unit of the angles of the trigonometric functions: 'rad', 'deg' or 'grad'
+        """
+        return self._angle_mode
+
+    @angle_mode.setter
+    def angle_mode(self, angle_mode):
+        if angle_mode not in ANGLE_MODES:
+            raise ValueError('Unsupported angle mode: {}'.format(angle_mode))
+        self._angle_mode = angle_mode
+
     def perform_scientific_operation(self, operator, first_num=None, second_num=None,
      arith_operator=None):
         """ Main method for to perform scientific operation
@@ -176,107 +513,289 @@ class ScientificCalculator(Calculator):
                  operator(str): operator symbol to perform the requested operation
                  first_num(str): first input operand for the operation
                  second_num(str): second input operand for the operation
+                 arith_operator(str): operator symbol for combining both the operands
+
+            Returns:
+                 tuple: output data ('' on failure) and display message of the operation
         """
-        # logging the input operator and operands
-        self.initial_logging_statements(operator, first_num, second_num)
+        return self.calculate_scientific(operator, first_num, second_num,
+                                         arith_operator).as_tuple()
 
-        # Mapping to get operator function based on the provided operator
-        mapping = {
-            'sin': '_sin',
-            'cos': '_cos',
-            'tan': '_tan',
-            'log': '_log',
-        }
+    def calculate_scientific(self, operator, first_num=None, second_num=None,
+                             arith_operator=None):
+        """ Perform the scientific operation like perform_scientific_operation,
+            returning an OperationResult whose display message is only rendered when
+            it is read
 
-        # get the method name from the operator
-        operation_method = mapping.get(operator)
+            Args:
+                 operator(str): operator symbol to perform the requested operation
+                 first_num(str): first input operand for the operation
+                 second_num(str): second input operand for the operation
+                 arith_operator(str): operator symbol for combining both the operands
+        """
+        result = self._cached_scientific_operation(operator, first_num, second_num,
+                                                   arith_operator)
+        if self.history is not None:
+            self.history.record(operator, first_num, second_num, arith_operator, result)
+        return result
+
+    def _cached_scientific_operation(self, operator, first_num, second_num, arith_operator):
+        """ Perform the scientific operation through the result cache and the metrics
+            timer, without recording it in the history
+        """
+        timer = self.metrics.timer(operator) if self.metrics is not None else None
+        # The modes are read once, so that changing them from another thread never
+        # mixes both modes in a result nor caches a result under the other mode
+        angle_mode = self._angle_mode
+        numeric_mode = self.numeric_mode
+
+        if self.cache is None:
+            result = self._perform_scientific_operation(operator, first_num, second_num,
+                                                        arith_operator, angle_mode,
+                                                        numeric_mode, timer)
+        else:
+            # Serve the repeated operations from the result cache
+            key = (operator, first_num, second_num, arith_operator, angle_mode, numeric_mode)
+            result = self.cache.get(key)
+            if result is None:
+                result = self._perform_scientific_operation(operator, first_num, second_num,
+                                                            arith_operator, angle_mode,
+                                                            numeric_mode, timer)
+                self.cache.put(key, result)
+
+        if timer is not None:
+            timer.finish(ERROR_TYPES.get(STATUS_MESSAGES[result.status]))
+        return result
+
+    def _perform_scientific_operation(self, operator, first_num, second_num, arith_operator,
+                                      angle_mode, numeric_mode, timer=None):
+        """ Perform the scientific operation without looking up the result cache,
+            timing each phase when a metrics timer is provided
+        """
+        # logging the input operator and operands
+        self.initial_logging_statements(operator, first_num, second_num)
+        if timer is not None:
+            timer.lap('logging')
 
-        # validation check for empty inputs
-        if first_num == '' and second_num == '':
-            display_operation = 'Please provide valid input.'
-            logger.warning(display_operation)
-            return '', display_operation
+        # get the registered operation from the operator
+        operation = self.registry.unary.get(operator)
 
-        # validation check for the invalid input values
-        if ((first_num and not re.search(r'[^ a-zA-z\s\t.(){}]+', first_num)) or
-                                second_num and not re.search(r'[^ a-zA-z\s\t.(){}]+', second_num)):
-            display_operation = 'Please provide valid input.'
-            logger.warning(display_operation)
-            return '', display_operation
+        # validation check for empty inputs and unknown functions
+        if operation is None or (not first_num and not second_num):
+            logger.warning(INVALID_INPUT_MESSAGE)
+            return OperationResult(None, INVALID_INPUT, operator, (first_num, second_num))
 
         # If both the input values are provided, perform the arithmetic operation
         if first_num and second_num:
-            input_data, _ = self.perform_operation(
+            operands = (first_num, second_num)
+            # the combining operation is part of this one, it is neither recorded in the
+            # history nor counted by the metrics on its own
+            combined = self._lookup_operation(
                 arith_operator,
                 first_num,
                 second_num,
+                numeric_mode,
+                timer,
             )
+            # If the inputs are invalid or the arithmetic operation fails, report its error
+            if combined.status != OK:
+                return OperationResult(None, combined.status, operator, operands,
+                                       arith_operator)
+            input_value = combined.value
+            if timer is not None:
+                timer.lap('operation')
         # If single input value is provided, then directly perform the scientific operation
-        elif first_num or second_num:
-            input_data = first_num or second_num
+        else:
+            operands = (first_num or second_num,)
+            arith_operator = None
+            # validate and convert the input value in the numeric mode, as the
+            # arithmetic operations do
+            try:
+                input_value = parse_operand(operands[0], numeric_mode)
+            except ValueError:
+                logger.warning(INVALID_INPUT_MESSAGE)
+                return OperationResult(None, INVALID_INPUT, operator, operands)
+            if timer is not None:
+                timer.lap('parse')
 
         # get the output data for the performed operation
-        output_data = getattr(self, operation_method)(str(input_data))
-        logger.info("Output: %s", str(output_data))
-
-        # Create the message for displaying it on the window
-        if arith_operator:
-            display_operation = 'Operation Performed: {}{}{}{}={}'.format(
-                operator,
-                first_num,
-                arith_operator,
-                second_num,
-                str(output_data)
-            )
+        try:
+            output_data = self._apply_function(operation, input_value, angle_mode,
+                                               numeric_mode)
+        except (ArithmeticError, ValueError):
+            # Handle the input out of the function domain, e.g. log of negative number
+            logger.warning(MATH_DOMAIN_MESSAGE)
+            return OperationResult(None, MATH_DOMAIN, operator, operands, arith_operator)
+        if timer is not None:
+            timer.lap('operation')
+        details_logger.info("Output: %s", output_data)
+
+        # The display message is rendered by the logging handlers only, if any
+        result = OperationResult(output_data, OK, operator, operands, arith_operator)
+        logger.info("%s", result)
+        if timer is not None:
+            timer.lap('logging')
+        return result
+
+    @classmethod
+    def _apply_function(cls, operation, value, angle_mode, numeric_mode='float'):
+        """ Apply the scientific function on a value, converting the angles from and
+            into the angle mode, with the complex implementation in the complex mode
+        """
+        if numeric_mode == 'complex':
+            function = cls._complex_function(operation)
         else:
-            display_operation = 'Operation Performed: {}{}={}'.format(
-                operator,
-                input_data,
-                str(output_data)
-            )
-        logger.info(display_operation)
-        return output_data, display_operation
-
-    @staticmethod
-    @convert_number
-    def _sin(input1):
-        """ Get the sine value for input number
+            function = operation.function
+            value = float(value) if operation.angle == 'input' else value
+        if operation.angle == 'input':
+            value = to_radians(value, angle_mode)
+        output_data = function(value)
+        if operation.angle == 'output':
+            output_data = from_radians(output_data, angle_mode)
+        return output_data
+
+    def perform_scientific_operation_batch(self, operator, first_nums=None, second_nums=None,
+                                           arith_operator=None):
+        """ Batch method to perform scientific operation over whole columns
+            of operands at once.
 
             Args:
-                input1(int/float): input value
+                 operator(str): operator symbol to perform the requested operation
+                 first_nums(sequence/ndarray): first input operands for the operation
+                 second_nums(sequence/ndarray): second input operands for the operation
+                 arith_operator(str): operator combining both columns, if both are provided
+
+            Returns:
+                 tuple: float array with the output of each row (nan for failed rows)
+                 and an object array with the error message of each row
+                 (None for the rows which succeeded)
         """
-        operation = math.sin(input1)
-        return operation
+        return self.calculate_scientific_batch(operator, first_nums, second_nums,
+                                               arith_operator).as_tuple()
 
-    @staticmethod
-    @convert_number
-    def _cos(input1):
-        """ Get the cosine value for input number
+    def calculate_scientific_batch(self, operator, first_nums=None, second_nums=None,
+                                   arith_operator=None):
+        """ Perform the scientific operation over whole columns like
+            perform_scientific_operation_batch, returning a BatchResult with a status
+            code per row instead of the messages
 
             Args:
-                input1(int/float): input value
+                 operator(str): operator symbol to perform the requested operation
+                 first_nums(sequence/ndarray): first input operands for the operation
+                 second_nums(sequence/ndarray): second input operands for the operation
+                 arith_operator(str): operator combining both columns, if both are provided
         """
-        operation = math.cos(input1)
-        return operation
-
-    @staticmethod
-    @convert_number
-    def _tan(input1):
-        """ Get the tangent value for input number
+        # get the vectorized function from the operator
+        operation = self.registry.unary.get(operator)
+        if operation is None:
+            raise ValueError('Unsupported operator: {}'.format(operator))
+        np = _numpy()
+        array_operation = operation.vectorized()
+        # The complex mode evaluates complex arrays exactly, the other modes float arrays
+        numeric_mode = 'complex' if self.numeric_mode == 'complex' else 'float'
+        # Without a complex implementation, the function is out of its domain
+        defined = numeric_mode != 'complex' or operation.complex_function is not None
+        if numeric_mode != 'complex' and self.fast_math is not None:
+            array_operation = self.fast_math.array_function(operation.method, array_operation)
+
+        # If both the columns are provided, perform the arithmetic operation row-wise
+        if first_nums is not None and second_nums is not None:
+            combined = self.calculate_batch(
+                arith_operator,
+                first_nums,
+                second_nums,
+            )
+            input_data, status = combined.values, combined.status
+            valid = status == OK
+        # If single column is provided, then directly perform the scientific operation
+        elif first_nums is not None or second_nums is not None:
+            input_data, valid = convert_number_array(
+                first_nums if first_nums is not None else second_nums, numeric_mode)
+            status = np.zeros(valid.shape, dtype=np.uint8)
+            status[~valid] = INVALID_INPUT
+        else:
+            raise ValueError('At least one column of operands is required')
+
+        if not defined:
+            status[valid] = MATH_DOMAIN
+            valid = np.zeros(valid.shape, dtype=bool)
+
+        # get the output data for the valid rows only, with the angles in radians
+        angle_mode = self._angle_mode
+        output_data = np.full(valid.shape, np.nan, dtype=input_data.dtype)
+        with np.errstate(all='ignore'):
+            if operation.angle == 'input':
+                input_data = to_radians(input_data, angle_mode)
+            if defined:
+                np.copyto(output_data, array_operation(input_data), where=valid)
+            if operation.angle == 'output':
+                output_data = from_radians(output_data, angle_mode)
+
+        # Rows outside of the function domain (log of non-positive values, poles)
+        # do not yield a finite value
+        domain_error = valid & ~np.isfinite(output_data)
+        status[domain_error] = MATH_DOMAIN
+        output_data[domain_error] = np.nan
+
+        failed_rows = np.count_nonzero(status)
+        logger.info("Batch operation performed: %s on %d rows", operator, valid.size)
+        if failed_rows:
+            logger.warning("Batch operation failed for %d rows", failed_rows)
+
+        return BatchResult(output_data, status, operator)
+
+    def evaluate(self, expression, **variables):
+        """ Evaluate an arithmetic and scientific expression such as "sin(3+2)*log(x)/y",
+            the angles being in the angle mode of the calculator
 
             Args:
-                input1(int/float): input value
+                 expression(str/Expression): expression text, compiled once and cached,
+                                             or a compiled expression
+                 variables(int/float/ndarray): value of each variable of the expression
+
+            Raises:
+                ValueError: if the compiled expression has another angle mode
+        """
+        # pylint: disable=import-outside-toplevel
+        from .expression import Expression, compile_expression
+
+        angle_mode = self._angle_mode
+        if not isinstance(expression, Expression):
+            expression = compile_expression(expression, angle_mode)
+        elif expression.angle_mode != angle_mode:
+            raise ValueError('The expression is compiled for the {} angle mode'.format(
+                expression.angle_mode))
+        return expression(**variables)
+
+    @classmethod
+    def get_scientific_operators(cls):
+        """ Mapping to get scientific function based on the provided operator,
+            precomputed by the registry (do not modify it)
         """
-        operation = math.tan(input1)
-        return operation
+        return cls.registry.unary_methods
 
-    @staticmethod
-    @convert_number
-    def _log(input1):
-        """ Get the logarithmic value for input number
 
-            Args:
-                input1(int/float): input value
-        """
-        operation = math.log(input1)
-        return operation
+def main(argv=None):
+    """ Command line entry point of the calculator, e.g.
+        > python -m app.calculator batch rows.csv -o results.csv
+    """
+    # pylint: disable=import-outside-toplevel
+    import argparse
+    from . import batch, bulk, server
+
+    parser = argparse.ArgumentParser(prog='python -m app.calculator',
+                                     description='Headless calculator operations')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    batch.add_arguments(subparsers.add_parser(
+        'batch', help='stream CSV/JSON lines rows of operations through the calculator'))
+    bulk.add_arguments(subparsers.add_parser(
+        'bulk', help='evaluate an operation over memory-mapped binary operand columns'))
+    server.add_arguments(subparsers.add_parser(
+        'serve', help='serve the calculator over a local socket with line-delimited JSON'))
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
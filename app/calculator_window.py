@@ -0,0 +1,381 @@
+""" Module contains the calculator window, imported only when the UI is launched
+    so that the calculator core never pays for importing PyQt5
+"""
+
+# Importing modules
+import logging
+
+from PyQt5 import QtCore, QtWidgets
+
+from .calculator import ScientificCalculator
+from .operations import ANGLE_MODES
+
+# Milliseconds a calculation runs before its progress and cancel button are shown
+PROGRESS_DELAY = 200
+
+# Number of past calculations listed in the history panel
+HISTORY_LIMIT = 50
+
+# Number of operation buttons on each row of the grid
+BUTTON_COLUMNS = 4
+
+# Display message of a calculation which raised an unexpected error
+CALCULATION_ERROR_MESSAGE = 'The calculation failed. Please provide correct input.'
+
+logger = logging.getLogger('calculatorLogs')
+
+
+class CalculationSignals(QtCore.QObject):
+    """ Signals of a calculation task, emitted from the worker thread and delivered
+        to the window on the GUI thread
+    """
+    # generation of the task, output data and display message of the operation
+    finished = QtCore.pyqtSignal(int, object, str)
+
+
+class CalculationTask(QtCore.QRunnable):
+    """ Calculation performed on a thread of the pool, so that the event loop keeps
+        running while the calculator (and its logging) is busy
+    """
+    def __init__(self, generation, function, *args):
+        """ Args:
+                generation(int): number identifying the latest request of the window
+                function(callable): calculator method returning (output data, display message)
+                args: arguments of the calculator method
+        """
+        super().__init__()
+        # The window owns the task, which the pool must not delete once it has run
+        self.setAutoDelete(False)
+        self.generation = generation
+        self.function = function
+        self.args = args
+        self.cancelled = False
+        self.done = False
+        self.signals = CalculationSignals()
+
+    def run(self):
+        """ Perform the calculation unless it was cancelled while queued. An error
+            raised by the calculation is displayed, as an exception escaping the
+            worker thread would abort the application.
+        """
+        try:
+            if self.cancelled:
+                return
+            try:
+                output_data, display_operation = self.function(*self.args)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Calculation failed: %s', self.args)
+                output_data, display_operation = '', CALCULATION_ERROR_MESSAGE
+            if not self.cancelled:
+                self.signals.finished.emit(self.generation, output_data, display_operation)
+        finally:
+            self.done = True
+
+
+class CalulatorUi(QtWidgets.QWidget):
+    """ Main UI class for calculator
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, history=None):
+        """ Args:
+                history(HistoryStore): store recording the calculations, whose latest
+                                       entries are listed in the history panel
+        """
+        super().__init__()
+
+        self.history = history
+        self.calculator = ScientificCalculator(history=history)
+
+        # A single worker thread performs the calculations in the background, the
+        # latest request replacing the queued one
+        self.thread_pool = QtCore.QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self._generation = 0
+        self._task = None
+        self._task_key = None
+        # Tasks handed to the pool, kept alive until they have run
+        self._tasks = []
+
+        # Timer showing the progress of the calculations which take long
+        self._progress_timer = QtCore.QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_DELAY)
+
+        # setting title
+        self.setWindowTitle("Calculator")
+
+        # setting geometry
+        self.setGeometry(100, 100, 160, 150)
+
+        # calling method
+        self.ui_components()
+
+
+    def ui_components(self):
+        """ Method for initializing widgets and placing widget on window
+        """
+        # Initializing and setting grid layout for the window
+        layout = QtWidgets.QGridLayout()
+        self.setLayout(layout)
+
+        # Creating label for first input
+        self.first_input_lbl = QtWidgets.QLabel('Number 1', self)
+        # Adding label in the layout
+        layout.addWidget(self.first_input_lbl, 0, 0)
+
+        # Creating a line edit for getting input value from the user
+        self.first_input_text = QtWidgets.QLineEdit(self)
+        # Adding line edit in the layout
+        layout.addWidget(self.first_input_text, 0, 3)
+
+        # Creating label for second input
+        self.second_input_lbl = QtWidgets.QLabel('Number 2', self)
+        # Adding label in the layout
+        layout.addWidget(self.second_input_lbl, 1, 0)
+
+        # Creating a line edit for getting input value from the user
+        self.second_input_text = QtWidgets.QLineEdit(self)
+        # Adding line edit in the layout
+        layout.addWidget(self.second_input_text, 1, 3)
+
+        # Creating a selector for the unit of the angles
+        self.angle_mode_lbl = QtWidgets.QLabel('Angle', self)
+        layout.addWidget(self.angle_mode_lbl, 2, 0)
+        self.angle_mode_combo = QtWidgets.QComboBox(self)
+        self.angle_mode_combo.addItems(list(ANGLE_MODES))
+        self.angle_mode_combo.setCurrentText(self.calculator.angle_mode)
+        # Adding selector in the layout
+        layout.addWidget(self.angle_mode_combo, 2, 3)
+
+        # Creating a button for each registered operation, the arithmetic operators
+        # first, available as <name>_btn (e.g. add_btn, sin_btn)
+        self.operation_buttons = {}
+        operations = (list(self.calculator.registry.binary.values())
+                      + list(self.calculator.registry.unary.values()))
+        for index, operation in enumerate(operations):
+            button = QtWidgets.QPushButton(operation.symbol, self)
+            if operation.domain:
+                button.setToolTip('Domain: {}'.format(operation.domain))
+            self.operation_buttons[operation.symbol] = button
+            setattr(self, '{}_btn'.format(operation.name), button)
+            # Adding button in the layout
+            layout.addWidget(button, 3 + index // BUTTON_COLUMNS, index % BUTTON_COLUMNS)
+        row = 3 + (len(operations) + BUTTON_COLUMNS - 1) // BUTTON_COLUMNS
+
+        # Creating a label for displaying operation result
+        self.disp_operation_lbl = QtWidgets.QLabel('', self)
+        # Adding label in the layout
+        layout.addWidget(self.disp_operation_lbl, row, 0, 1, 4)
+
+        # Creating a label for displaying output
+        self.output_lbl = QtWidgets.QLabel('Output', self)
+        # Adding label in the layout
+        layout.addWidget(self.output_lbl, row + 1, 0)
+
+        # Creating a text field for displaying the output
+        self.output_text = QtWidgets.QLineEdit(self)
+        # Adding text field in the layout
+        layout.addWidget(self.output_text, row + 1, 3)
+
+        # Creating a button for clearing the text fields
+        self.clear_btn = QtWidgets.QPushButton("Clear", self)
+        # Adding button in the layout
+        layout.addWidget(self.clear_btn, row + 2, 0, 1, 4)
+
+        # Creating a busy indicator for the long calculations, hidden until needed
+        self.progress_bar = QtWidgets.QProgressBar(self)
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.hide()
+        # Adding progress bar in the layout
+        layout.addWidget(self.progress_bar, row + 3, 0, 1, 3)
+
+        # Creating a button for cancelling the running calculation
+        self.cancel_btn = QtWidgets.QPushButton("Cancel", self)
+        self.cancel_btn.hide()
+        # Adding button in the layout
+        layout.addWidget(self.cancel_btn, row + 3, 3)
+
+        # Creating a list of the past calculations, double-click restores their inputs
+        self.history_list = QtWidgets.QListWidget(self)
+        # Adding list in the layout
+        layout.addWidget(self.history_list, row + 4, 0, 1, 4)
+        if self.history is not None:
+            for entry in self.history.recent(HISTORY_LIMIT):
+                self._add_history_item(entry.message, (entry.operator, entry.first,
+                                                       entry.second, entry.arith_operator),
+                                       latest=False)
+
+        # Adding action to each of the button
+        for operation in operations:
+            self.operation_buttons[operation.symbol].clicked.connect(
+                self.display_operation if operation.arity == 2
+                else self.display_scientific_operation)
+        self.angle_mode_combo.currentTextChanged.connect(self.set_angle_mode)
+
+        self.clear_btn.clicked.connect(self.clear)
+        self.cancel_btn.clicked.connect(self.cancel_calculation)
+        self.history_list.itemDoubleClicked.connect(self.restore_history_item)
+        self._progress_timer.timeout.connect(self._show_progress)
+
+    def display_operation(self):
+        """ Button slot to perform the arithmetic operation
+        """
+        operator = self.sender().text()
+        first_input = self.first_input_text.text()
+        second_input = self.second_input_text.text()
+
+        # Call the calculator class to perform the arithmetic operation in the background
+        self.start_calculation(
+            self.calculator.perform_operation,
+            operator,
+            first_input,
+            second_input
+        )
+
+    def display_scientific_operation(self):
+        """ Button slot to perform the scientific operation
+        """
+        operator = self.sender().text()
+        first_input = self.first_input_text.text()
+        second_input = self.second_input_text.text()
+        arith_operator = None
+
+        # If both the input values are provided, perform the arithmetic operation
+        if first_input and second_input:
+            # Get the list of arithmetic operators
+            operator_lists = self.calculator.get_operators()
+            # Display an input dialog box to get the operator
+            # for performing the arithmetic operation
+            arith_operator_symbol, operator_success = QtWidgets.QInputDialog.getItem(
+              self, 'Input Operator', 'Select operator for scientific calculation:', operator_lists)
+            if operator_success:
+                arith_operator = arith_operator_symbol
+            else:
+                # Do not perform any operation
+                return
+
+        # Call the calculator class to perform the scientific operation in the background
+        self.start_calculation(
+            self.calculator.perform_scientific_operation,
+            operator,
+            first_input,
+            second_input,
+            arith_operator
+        )
+
+    def start_calculation(self, function, *args):
+        """ Perform the calculation on the worker thread and display its result once
+            finished. Clicking again the same operation while it runs is ignored, while
+            a different operation replaces the running one.
+
+            Args:
+                function(callable): calculator method returning (output data, display message)
+                args: arguments of the calculator method
+        """
+        key = (function, args)
+        if self._task is not None and self._task_key == key:
+            return
+        self.cancel_calculation()
+
+        self._generation += 1
+        self._task = CalculationTask(self._generation, function, *args)
+        self._task_key = key
+        self._task.signals.finished.connect(self._display_result)
+        self._tasks = [task for task in self._tasks if not task.done]
+        self._tasks.append(self._task)
+        self.thread_pool.start(self._task)
+        self._progress_timer.start()
+
+    def cancel_calculation(self):
+        """ Button slot to cancel the running calculation, whose result is discarded
+        """
+        if self._task is None:
+            return
+        self._task.cancelled = True
+        # Remove the task from the queue if it has not started yet
+        if self.thread_pool.tryTake(self._task):
+            self._tasks.remove(self._task)
+        self._task = None
+        self._task_key = None
+        self._hide_progress()
+
+    def is_calculating(self):
+        """ Check if a calculation is running or queued
+        """
+        return self._task is not None
+
+    def wait_for_result(self, msecs=-1):
+        """ Block until the worker thread is idle and display the pending result
+
+            Args:
+                msecs(int): maximum time to wait in milliseconds, -1 for no limit
+        """
+        self.thread_pool.waitForDone(msecs)
+        QtCore.QCoreApplication.processEvents()
+
+    def _display_result(self, generation, output_data, display_operation):
+        """ Display the result of the calculation, unless a newer one was started
+        """
+        if self._task is None or generation != self._task.generation:
+            return
+        _, args = self._task_key
+        self._task = None
+        self._task_key = None
+        self._hide_progress()
+        self.disp_operation_lbl.setText(display_operation)
+        self.output_text.setText(str(output_data))
+        # operator, first input, second input and arithmetic operator of the calculation
+        args = args + (None,) * (4 - len(args))
+        self._add_history_item(display_operation, args[:4])
+
+    def _add_history_item(self, display_operation, inputs, latest=True):
+        """ List a calculation in the history panel, the latest ones first
+
+            Args:
+                display_operation(str): display message of the calculation
+                inputs(tuple): operator, first input, second input and arithmetic operator
+                latest(bool): insert the item first, otherwise append it
+        """
+        item = QtWidgets.QListWidgetItem(display_operation)
+        item.setData(QtCore.Qt.UserRole, inputs)
+        if latest:
+            self.history_list.insertItem(0, item)
+            while self.history_list.count() > HISTORY_LIMIT:
+                self.history_list.takeItem(self.history_list.count() - 1)
+        else:
+            self.history_list.addItem(item)
+
+    def restore_history_item(self, item):
+        """ List slot restoring the inputs of a past calculation
+        """
+        _, first_input, second_input, _ = item.data(QtCore.Qt.UserRole)
+        self.first_input_text.setText(first_input or '')
+        self.second_input_text.setText(second_input or '')
+
+    def _show_progress(self):
+        """ Show the busy indicator and the cancel button of the running calculation
+        """
+        if self._task is not None:
+            self.progress_bar.show()
+            self.cancel_btn.show()
+
+    def _hide_progress(self):
+        """ Hide the busy indicator and the cancel button
+        """
+        self._progress_timer.stop()
+        self.progress_bar.hide()
+        self.cancel_btn.hide()
+
+    def set_angle_mode(self, angle_mode):
+        """ Selector slot to change the unit of the angles of the calculator
+        """
+        self.calculator.angle_mode = angle_mode
+
+    def clear(self):
+        """ Button slot to clear all the text fields on the window
+        """
+        self.cancel_calculation()
+        self.first_input_text.setText('')
+        self.second_input_text.setText('')
+        self.disp_operation_lbl.setText('')
+        self.output_text.setText('')
@@ -0,0 +1,451 @@
+""" Module contains the expression engine which parses, constant-folds and compiles
+    arithmetic and scientific expressions such as "sin(3+2)*log(x)/y" into generated
+    Python functions for the scalars and fused NumPy kernels for the arrays.
+"""
+
+# Importing modules
+import ast
+import functools
+import math
+import operator
+
+import numpy as np
+
+from .cache import ResultCache
+from .calculator import Calculator, ScientificCalculator
+from .operations import ANGLE_MODES, REGISTRY, from_radians, to_radians
+
+# Number of compiled expressions kept by compile_expression, by expression text
+EXPRESSION_CACHE_SIZE = 256
+
+# Number of values evaluated at once by the array kernels, keeping the intermediate
+# arrays in the CPU cache
+CHUNK_SIZE = 16384
+
+# Scalar functions written as Python operators in the generated code, which gives the
+# same results without the call overhead
+_INLINE_OPERATORS = {
+    operator.add: '+',
+    operator.sub: '-',
+    operator.mul: '*',
+    operator.truediv: '/',
+    operator.mod: '%',
+}
+
+
+class ExpressionError(ValueError):
+    """ Error raised for the expressions which can not be parsed or evaluated
+    """
+
+
+# Python syntax nodes mapped to the calculator operator symbols
+_BINARY_OPERATORS = {
+    ast.Add: '+',
+    ast.Sub: '-',
+    ast.Mult: '*',
+    ast.Div: '/',
+    ast.Pow: '^',
+    ast.Mod: '%',
+}
+
+
+def _angle_functions(angle_mode):
+    """ Get the conversions of the angles of the angle mode from and into radians
+    """
+    return {
+        '_to_radians': functools.partial(to_radians, angle_mode=angle_mode),
+        '_from_radians': functools.partial(from_radians, angle_mode=angle_mode),
+    }
+
+
+def _scalar_functions(angle_mode='rad'):
+    """ Get the scalar implementation of each registered operation method,
+        the functions taking and returning angles in radians
+    """
+    functions = {info.method: info.function for info in REGISTRY}
+    functions['_negate'] = operator.neg
+    functions.update(_angle_functions(angle_mode))
+    return functions
+
+
+def _array_functions(angle_mode='rad'):
+    """ Get the vectorized implementation of each registered operation method
+    """
+    functions = {info.method: info.vectorized() for info in REGISTRY}
+    functions['_negate'] = np.negative
+    functions.update(_angle_functions(angle_mode))
+    return functions
+
+
+class Number:
+    """ Expression node holding a constant value
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class Variable:
+    """ Expression node holding a variable which is bound at evaluation time
+    """
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+
+class Operation:
+    """ Expression node applying a calculator operation method on its operands
+    """
+    __slots__ = ('method', 'operands')
+
+    def __init__(self, method, operands):
+        self.method = method
+        self.operands = operands
+
+
+def parse(source):
+    """ Parse the expression text into a tree of expression nodes
+
+        Args:
+            source(str): expression text such as "sin(3+2)*log(x)/y"
+    """
+    try:
+        tree = ast.parse(source.strip(), mode='eval')
+    except SyntaxError as error:
+        raise ExpressionError('Invalid expression: {}'.format(source)) from error
+    return _convert_node(tree.body)
+
+
+def _convert_node(node):
+    """ Convert a Python syntax node into an expression node, rejecting anything
+        which is not a number, a variable, an operator or a scientific function
+    """
+    operators = Calculator.get_operators()
+    functions = ScientificCalculator.get_scientific_operators()
+
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return Number(node.value)
+    if isinstance(node, ast.Name):
+        return Variable(node.id)
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        method = operators[_BINARY_OPERATORS[type(node.op)]]
+        return Operation(method, (_convert_node(node.left), _convert_node(node.right)))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.UAdd):
+        return _convert_node(node.operand)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return Operation('_negate', (_convert_node(node.operand),))
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+            and node.func.id in functions and len(node.args) == 1 and not node.keywords):
+        return Operation(functions[node.func.id], (_convert_node(node.args[0]),))
+    raise ExpressionError('Unsupported expression element: {}'.format(ast.dump(node)))
+
+
+def convert_angles(node, angle_mode):
+    """ Convert the angles given to the trigonometric functions into radians and the
+        angles they return into the angle mode, as the calculator operations do
+
+        Args:
+            node(Number/Variable/Operation): root of the expression tree
+            angle_mode(str): 'rad', 'deg' or 'grad'
+    """
+    if angle_mode == 'rad' or not isinstance(node, Operation):
+        return node
+    operands = tuple(convert_angles(operand, angle_mode) for operand in node.operands)
+    info = REGISTRY.by_method.get(node.method)
+    angle = info.angle if info is not None else None
+    if angle == 'input':
+        operands = (Operation('_to_radians', operands),)
+    node = Operation(node.method, operands)
+    if angle == 'output':
+        node = Operation('_from_radians', (node,))
+    return node
+
+
+def fold_constants(node, functions=None):
+    """ Replace every operation whose operands are all constants by its value
+
+        Args:
+            node(Number/Variable/Operation): root of the expression tree
+            functions(dict): scalar implementation of each operation method
+    """
+    if not isinstance(node, Operation):
+        return node
+    functions = functions or _scalar_functions()
+    operands = tuple(fold_constants(operand, functions) for operand in node.operands)
+    if all(isinstance(operand, Number) for operand in operands):
+        try:
+            return Number(functions[node.method](
+                *(operand.value for operand in operands)))
+        except (ArithmeticError, ValueError):
+            # Keep the failing operation so the error is raised on evaluation
+            pass
+    return Operation(node.method, operands)
+
+
+def variable_names(node):
+    """ Get the set of variable names referenced in the expression tree
+
+        Args:
+            node(Number/Variable/Operation): root of the expression tree
+    """
+    if isinstance(node, Variable):
+        return {node.name}
+    if isinstance(node, Operation):
+        return set().union(*(variable_names(operand) for operand in node.operands))
+    return set()
+
+
+class _Namespace:
+    """ Global names of a generated function, binding each function and non-literal
+        constant once
+    """
+    def __init__(self):
+        self.values = {}
+        self._names = {}
+
+    def bind(self, value):
+        """ Get the global name bound to the value
+        """
+        key = id(value)
+        if key not in self._names:
+            self._names[key] = '_g{}'.format(len(self.values))
+            self.values[self._names[key]] = value
+        return self._names[key]
+
+    def constant(self, value):
+        """ Get the source of a constant, a literal unless it is not finite
+        """
+        if type(value) is int or math.isfinite(value):
+            return '({!r})'.format(value)
+        return self.bind(value)
+
+
+def _generate_scalar(node, arguments, functions, namespace):
+    """ Generate the source of a Python expression computing the node from the
+        arguments of the function
+    """
+    if isinstance(node, Number):
+        return namespace.constant(node.value)
+    if isinstance(node, Variable):
+        return arguments[node.name]
+
+    function = functions[node.method]
+    operands = [_generate_scalar(operand, arguments, functions, namespace)
+                for operand in node.operands]
+    if function is operator.neg:
+        return '(-{})'.format(operands[0])
+    if len(operands) == 2 and function in _INLINE_OPERATORS:
+        return '({} {} {})'.format(operands[0], _INLINE_OPERATORS[function], operands[1])
+    return '{}({})'.format(namespace.bind(function), ', '.join(operands))
+
+
+class _Buffers:
+    """ Intermediate arrays of a generated kernel, reused once their value is consumed
+    """
+    def __init__(self):
+        self.count = 0
+        self._free = []
+
+    def take(self):
+        """ Get the name of an unused buffer
+        """
+        if self._free:
+            return self._free.pop()
+        self.count += 1
+        return 'b{}'.format(self.count - 1)
+
+    def release(self, name):
+        """ Make the buffer available for another intermediate value
+        """
+        self._free.append(name)
+
+
+def _generate_array(node, target, arguments, functions, namespace, buffers, lines):
+    """ Generate the statements computing the node into the target array, and get the
+        source of its value (the target, a variable or a constant)
+    """
+    if isinstance(node, Number):
+        return namespace.constant(node.value)
+    if isinstance(node, Variable):
+        return arguments[node.name]
+
+    operands = []
+    taken = []
+    for operand in node.operands:
+        # The first operation operand is computed in place in the target
+        if isinstance(operand, Operation) and target not in operands:
+            destination = target
+        elif isinstance(operand, Operation):
+            destination = buffers.take()
+            taken.append(destination)
+        else:
+            destination = None
+        operands.append(_generate_array(operand, destination, arguments, functions,
+                                        namespace, buffers, lines))
+    function = functions[node.method]
+    if isinstance(function, np.ufunc):
+        lines.append('{}({}, out={})'.format(namespace.bind(function), ', '.join(operands),
+                                             target))
+    else:
+        lines.append('{}[...] = {}({})'.format(target, namespace.bind(function),
+                                               ', '.join(operands)))
+    for name in taken:
+        buffers.release(name)
+    return target
+
+
+def _define(name, parameters, body, namespace):
+    """ Compile the generated function and get it from its namespace
+    """
+    code = 'def {}({}):\n{}'.format(name, ', '.join(parameters),
+                                    ''.join('    {}\n'.format(line) for line in body))
+    scope = dict(namespace.values)
+    exec(compile(code, '<expression>', 'exec'), scope)  # pylint: disable=exec-used
+    function = scope[name]
+    function.code = code
+    return function
+
+
+def generate_function(tree, arguments, angle_mode='rad'):
+    """ Generate a Python function computing the expression tree for scalar arguments,
+        the operators being inlined and the functions bound as globals, so a call costs
+        no dispatch. The results are the ones of the calculator operations.
+
+        Args:
+            tree(Number/Variable/Operation): root of the expression tree
+            arguments(sequence): variable names, in the order of the function arguments
+            angle_mode(str): angle mode of the angle conversions of the tree
+    """
+    parameters = ['v{}'.format(index) for index in range(len(arguments))]
+    namespace = _Namespace()
+    value = _generate_scalar(tree, dict(zip(arguments, parameters)),
+                             _scalar_functions(angle_mode), namespace)
+    return _define('expression', parameters, ['return {}'.format(value)], namespace)
+
+
+def generate_kernel(tree, arguments, angle_mode='rad'):
+    """ Generate a fused NumPy kernel computing the expression tree for one chunk of the
+        argument arrays, each ufunc writing into the output or into a few reused buffers
+        instead of allocating a temporary array per operation. The kernel takes the
+        arguments, the output and kernel.buffers buffers of the chunk size.
+
+        Args:
+            tree(Number/Variable/Operation): root of the expression tree
+            arguments(sequence): variable names, in the order of the kernel arguments
+            angle_mode(str): angle mode of the angle conversions of the tree
+    """
+    parameters = ['v{}'.format(index) for index in range(len(arguments))]
+    namespace = _Namespace()
+    buffers = _Buffers()
+    lines = []
+    value = _generate_array(tree, 'out', dict(zip(arguments, parameters)),
+                            _array_functions(angle_mode), namespace, buffers, lines)
+    if value != 'out':
+        lines.append('out[...] = {}'.format(value))
+    parameters += ['out'] + ['b{}'.format(index) for index in range(buffers.count)]
+    kernel = _define('kernel', parameters, lines, namespace)
+    kernel.buffers = buffers.count
+    return kernel
+
+
+class Expression:
+    """ Expression parsed once and compiled into a generated function, so repeated
+        evaluation with new variable bindings costs no re-parsing and no dispatch
+    """
+    def __init__(self, source, angle_mode='rad'):
+        """ Args:
+                source(str): expression text such as "sin(3+2)*log(x)/y"
+                angle_mode(str): unit of the angles of the trigonometric functions,
+                                 one of 'rad', 'deg' or 'grad'
+        """
+        if angle_mode not in ANGLE_MODES:
+            raise ValueError('Unsupported angle mode: {}'.format(angle_mode))
+        self.source = source
+        self.angle_mode = angle_mode
+        functions = _scalar_functions(angle_mode)
+        tree = convert_angles(parse(source), angle_mode)
+        self.tree = fold_constants(self._transform(fold_constants(tree, functions)),
+                                   functions)
+        self.variables = frozenset(variable_names(self.tree))
+        # Positional arguments of the generated function and kernel
+        self.arguments = tuple(sorted(self.variables))
+        self.function = generate_function(self.tree, self.arguments, angle_mode)
+        self._kernel = None
+
+    def __repr__(self):
+        return 'Expression({!r})'.format(self.source)
+
+    def _transform(self, tree):
+        """ Rewrite the folded expression tree before it is compiled, e.g. to check the
+            units of the operands (the tree is kept as is by default)
+        """
+        return tree
+
+    def __call__(self, **variables):
+        """ Evaluate the expression for the provided variable bindings. Scalars are
+            evaluated with the math functions and raise on errors, arrays with the
+            NumPy functions following floating point rules (nan/inf) instead.
+
+            Args:
+                variables(int/float/sequence/ndarray): value of each variable
+        """
+        try:
+            values = [variables[name] for name in self.arguments]
+        except KeyError:
+            missing = self.variables.difference(variables)
+            raise ExpressionError(
+                'Missing value for: {}'.format(', '.join(sorted(missing)))) from None
+
+        for value in variables.values():
+            if isinstance(value, (np.ndarray, list, tuple)):
+                return self.evaluate_arrays(*values)
+        return self.function(*values)
+
+    def evaluate_arrays(self, *values):
+        """ Evaluate the expression with the fused kernel, chunk by chunk
+
+            Args:
+                values(int/float/sequence/ndarray): value of each variable, in the
+                                                    order of the arguments
+        """
+        if self._kernel is None:
+            self._kernel = generate_kernel(self.tree, self.arguments, self.angle_mode)
+        arrays = [np.asarray(value, dtype=np.float64) for value in values]
+        shape = np.broadcast_shapes(*(array.shape for array in arrays))
+        # The arrays are flattened to the output shape, the scalars broadcast by the ufuncs
+        arrays = [np.broadcast_to(array, shape).reshape(-1) if array.ndim else array
+                  for array in arrays]
+        output = np.empty(shape, dtype=np.float64)
+        flat_output = output.reshape(-1)
+        size = flat_output.size
+        buffers = [np.empty(min(size, CHUNK_SIZE)) for _ in range(self._kernel.buffers)]
+        with np.errstate(all='ignore'):
+            for start in range(0, size, CHUNK_SIZE):
+                stop = min(start + CHUNK_SIZE, size)
+                self._kernel(*(array[start:stop] if array.ndim else array
+                               for array in arrays),
+                             flat_output[start:stop],
+                             *(buffer[:stop - start] for buffer in buffers))
+        return output
+
+
+# Compiled expressions shared by compile_expression, by expression text
+expression_cache = ResultCache(EXPRESSION_CACHE_SIZE)
+
+
+def compile_expression(source, angle_mode='rad'):
+    """ Parse and compile the expression text into a reusable callable, the compiled
+        expressions being cached by text and angle mode (see expression_cache.cache_info())
+
+        Args:
+            source(str): expression text such as "sin(3+2)*log(x)/y"
+            angle_mode(str): unit of the angles of the trigonometric functions
+    """
+    key = source if angle_mode == 'rad' else (source, angle_mode)
+    expression = expression_cache.get(key)
+    if expression is None:
+        expression = Expression(source, angle_mode)
+        expression_cache.put(key, expression)
+    return expression
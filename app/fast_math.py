@@ -0,0 +1,273 @@
+""" Module contains the fast approximate scientific functions, which evaluate sin, cos,
+    tan and log from precomputed tables with range reduction and piecewise polynomial
+    interpolation, sized for a given accuracy target.
+"""
+
+# Importing modules
+import logging
+import math
+
+import numpy as np
+
+logger = logging.getLogger('calculatorLogs')
+
+# Functions which can be approximated from the tables
+FUNCTIONS = ('sin', 'cos', 'tan', 'log')
+
+# Number of values evaluated at once, keeping the temporary arrays in the CPU cache
+CHUNK_SIZE = 16384
+
+# Interpolation kinds with, for each one, the error bound of a step h as a function of
+# the maximum of the derivative it depends on: f'' for linear, f'''' for cubic Hermite
+INTERPOLATIONS = {
+    'linear': (2, lambda step, bound: bound * step ** 2 / 8),
+    'cubic': (4, lambda step, bound: bound * step ** 4 / 384),
+}
+
+
+class LookupTable:
+    """ Piecewise polynomial approximation of a function over [start, start + span),
+        stored as one row of polynomial coefficients in t in [0, 1) per interval
+    """
+    __slots__ = ('start', 'step', 'coefficients', 'error_bound')
+
+    def __init__(self, function, derivative, start, span, step, interpolation, error_bound):
+        """ Args:
+                function(ufunc): exact function sampled on the grid
+                derivative(ufunc): exact derivative, used by the cubic Hermite interpolation
+                start(float): first point of the grid
+                span(float): length of the tabulated range
+                step(float): maximum distance between the grid points
+                interpolation(str): 'linear' or 'cubic'
+                error_bound(float): maximum absolute interpolation error
+        """
+        count = max(1, math.ceil(span / step))
+        self.start = start
+        self.step = span / count
+        self.error_bound = error_bound
+        grid = start + self.step * np.arange(count + 1)
+        values = function(grid)
+        first, last = values[:-1], values[1:]
+        if interpolation == 'linear':
+            self.coefficients = np.column_stack([first, last - first])
+        else:
+            slopes = derivative(grid) * self.step
+            first_slope, last_slope = slopes[:-1], slopes[1:]
+            self.coefficients = np.column_stack([
+                first,
+                first_slope,
+                3 * (last - first) - 2 * first_slope - last_slope,
+                2 * (first - last) + first_slope + last_slope,
+            ])
+
+    @property
+    def points(self):
+        """ Number of intervals of the table
+        """
+        return len(self.coefficients)
+
+    @property
+    def nbytes(self):
+        """ Memory used by the table in bytes
+        """
+        return self.coefficients.nbytes
+
+    def __call__(self, reduced, out):
+        """ Interpolate the function at points already reduced into the tabulated range
+
+            Args:
+                reduced(ndarray): float points within [start, start + span], overwritten
+                out(ndarray): array receiving the result
+        """
+        position = reduced
+        position -= self.start
+        position *= 1 / self.step
+        index = position.astype(np.intp)
+        np.clip(index, 0, self.points - 1, out=index)
+        fraction = position
+        fraction -= index
+        # Horner evaluation of the polynomial of each row, take() is much faster than
+        # fancy indexing for the gathers
+        rows = self.coefficients.take(index, axis=0)
+        columns = self.coefficients.shape[1]
+        np.multiply(rows[:, columns - 1], fraction, out=out)
+        for column in range(columns - 2, 0, -1):
+            out += rows[:, column]
+            out *= fraction
+        out += rows[:, 0]
+        return out
+
+
+class FastMath:
+    """ Approximate sin, cos, tan and log of arrays evaluated from lookup tables, for the
+        large batches where an absolute error of the order of the accuracy target is
+        enough. Pass it to the scientific calculator to use it in the batch operations:
+        ScientificCalculator(fast_math=FastMath(accuracy=1e-7)).
+
+        The accuracy target bounds the absolute error of sin, cos and log. The tangent is
+        the ratio of the sine and the cosine, so its error grows as 1 + tan(x)**2 near the
+        poles. The range reduction of sin, cos and tan loses about |x| * 1e-16.
+    """
+    def __init__(self, accuracy=1e-7, interpolation='cubic', functions=FUNCTIONS):
+        """ Args:
+                accuracy(float): maximum absolute error of the interpolation
+                interpolation(str): 'cubic' Hermite (small tables) or 'linear'
+                                    (larger tables, cheaper evaluation)
+                functions(tuple): functions approximated in the calculator batch operations,
+                                  the others use the exact NumPy functions, e.g. ('sin', 'cos')
+                                  when NumPy already vectorizes tan and log on the machine
+        """
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError('Unsupported interpolation: {}'.format(interpolation))
+        if not accuracy > 0:
+            raise ValueError('The accuracy target must be positive')
+        unsupported = set(functions).difference(FUNCTIONS)
+        if unsupported:
+            raise ValueError('Unsupported functions: {}'.format(', '.join(sorted(unsupported))))
+        self.accuracy = accuracy
+        self.interpolation = interpolation
+        self.functions = tuple(functions)
+
+        # sin over one period, the derivatives of sin are bounded by 1
+        self._sin = self._table(np.sin, np.cos, 0.0, 2 * math.pi, bound=1.0)
+        # log of the mantissa in [0.5, 1), |log''| <= 4 and |log''''| <= 96 there
+        order, _ = INTERPOLATIONS[interpolation]
+        self._log = self._table(np.log, np.reciprocal, 0.5, 0.5,
+                                bound=4.0 if order == 2 else 96.0)
+
+        logger.info("Fast math tables: %d bytes for an accuracy of %g (%s)",
+                    self.nbytes, accuracy, interpolation)
+
+    def _table(self, function, derivative, start, span, bound):
+        """ Build the lookup table whose step meets the accuracy target
+        """
+        order, error = INTERPOLATIONS[self.interpolation]
+        # 10% of the target is left for the rounding errors of the evaluation
+        target = 0.9 * self.accuracy
+        step = (target * (8 if order == 2 else 384) / bound) ** (1 / order)
+        table = LookupTable(function, derivative, start, span, step, self.interpolation, 0.0)
+        table.error_bound = error(table.step, bound)
+        return table
+
+    @property
+    def nbytes(self):
+        """ Memory used by all the tables in bytes
+        """
+        return self._sin.nbytes + self._log.nbytes
+
+    def table_info(self):
+        """ Get the number of intervals, the step, the memory and the error bound
+            of each table
+        """
+        return {
+            name: {'points': table.points, 'step': table.step, 'bytes': table.nbytes,
+                   'error_bound': table.error_bound}
+            for name, table in (('sin', self._sin), ('log', self._log))
+        }
+
+    def sin(self, values, out=None, where=True):
+        """ Approximate sine of the values
+
+            Args:
+                values(float/ndarray): input values in radians
+                out(ndarray): array receiving the result, a new one by default
+                where(bool/ndarray): rows of out which receive the result
+        """
+        return self._evaluate(self._sin_kernel, values, out, where)
+
+    def cos(self, values, out=None, where=True):
+        """ Approximate cosine of the values, from the sine table
+
+            Args:
+                values(float/ndarray): input values in radians
+                out(ndarray): array receiving the result, a new one by default
+                where(bool/ndarray): rows of out which receive the result
+        """
+        return self._evaluate(self._cos_kernel, values, out, where)
+
+    def tan(self, values, out=None, where=True):
+        """ Approximate tangent of the values, the ratio of the sine and the cosine
+
+            Args:
+                values(float/ndarray): input values in radians
+                out(ndarray): array receiving the result, a new one by default
+                where(bool/ndarray): rows of out which receive the result
+        """
+        return self._evaluate(self._tan_kernel, values, out, where)
+
+    def log(self, values, out=None, where=True):
+        """ Approximate natural logarithm of the values, from the table of the mantissa
+
+            Args:
+                values(float/ndarray): input values
+                out(ndarray): array receiving the result, a new one by default
+                where(bool/ndarray): rows of out which receive the result
+        """
+        return self._evaluate(self._log_kernel, values, out, where)
+
+    @staticmethod
+    def _evaluate(kernel, values, out, where):
+        """ Apply the kernel on successive chunks of the values, so that its temporary
+            arrays stay in the CPU cache
+        """
+        values = np.asarray(values, dtype=np.float64)
+        result = np.empty(values.shape)
+        flat_values, flat_result = values.reshape(-1), result.reshape(-1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for start in range(0, flat_values.size, CHUNK_SIZE):
+                kernel(flat_values[start:start + CHUNK_SIZE],
+                       flat_result[start:start + CHUNK_SIZE])
+        if out is None:
+            return result[()] if result.ndim == 0 else result
+        np.copyto(out, result, where=where)
+        return out
+
+    def _periodic(self, values, shift, out):
+        """ Evaluate the sine table at the values shifted by the phase, after reducing
+            them into one period. The non-finite values yield nan.
+        """
+        reduced = values + shift
+        # floor based reduction, several times cheaper than np.mod
+        turns = reduced * (1 / (2 * math.pi))
+        np.floor(turns, out=turns)
+        turns *= 2 * math.pi
+        reduced -= turns
+        return self._sin(reduced, out)
+
+    def _sin_kernel(self, values, out):
+        """ Sine of a chunk of values
+        """
+        self._periodic(values, 0.0, out)
+
+    def _cos_kernel(self, values, out):
+        """ Cosine of a chunk of values
+        """
+        self._periodic(values, math.pi / 2, out)
+
+    def _tan_kernel(self, values, out):
+        """ Tangent of a chunk of values
+        """
+        self._periodic(values, 0.0, out)
+        out /= self._periodic(values, math.pi / 2, np.empty_like(out))
+
+    def _log_kernel(self, values, out):
+        """ Natural logarithm of a chunk of values
+        """
+        mantissa, exponent = np.frexp(values)
+        self._log(mantissa, out)
+        out += exponent * math.log(2)
+        regular = (values > 0) & (values < math.inf)
+        if not regular.all():
+            # Zero, negative and non-finite values follow the exact function (-inf, nan)
+            out[~regular] = np.log(values[~regular])
+
+    def array_function(self, operation_method, exact):
+        """ Get the array function of a scientific operation method, approximate when
+            the function is one of the approximated functions and exact otherwise
+
+            Args:
+                operation_method(str): scientific operation method such as '_sin'
+                exact(callable): exact vectorized implementation of the operation
+        """
+        name = operation_method.lstrip('_')
+        return getattr(self, name) if name in self.functions else exact
@@ -0,0 +1,198 @@
+""" Module contains the persistent calculation history, an append-only SQLite store
+    fed by the calculator operations, which can be searched and replayed.
+"""
+
+# Importing modules
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+
+HistoryEntry = namedtuple('HistoryEntry', ['id', 'timestamp', 'operator', 'first', 'second',
+                                           'arith_operator', 'numeric_mode', 'output',
+                                           'message'])
+
+_COLUMNS = ', '.join(HistoryEntry._fields)
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    operator TEXT,
+    first TEXT,
+    second TEXT,
+    arith_operator TEXT,
+    numeric_mode TEXT,
+    output TEXT,
+    message TEXT
+);
+CREATE INDEX IF NOT EXISTS history_timestamp ON history (timestamp);
+CREATE INDEX IF NOT EXISTS history_operator ON history (operator, timestamp);
+'''
+
+
+def _text(value):
+    """ Normalize an operand or an output into the text stored in the history
+    """
+    return None if value is None else str(value)
+
+
+class HistoryStore:
+    """ Thread-safe append-only store of the performed calculations. The entries are
+        buffered in memory and written in a single transaction once the buffer is full
+        or the flush interval is elapsed, so recording costs no disk access per call.
+        Pass it to the calculator to enable it: Calculator(history=HistoryStore(path)).
+    """
+    def __init__(self, path=':memory:', batch_size=1000, flush_interval=1.0):
+        """ Args:
+                path(str): path of the SQLite database file, in memory by default
+                batch_size(int): maximum number of entries buffered before a commit
+                flush_interval(float): maximum seconds an entry stays buffered
+                                       while new entries are recorded
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.RLock()
+        self._pending = []
+        self._last_flush = time.monotonic()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        if path != ':memory:':
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            self.flush()
+            return self._connection.execute('SELECT COUNT(*) FROM history').fetchone()[0]
+
+    def record(self, operator, first, second, arith_operator, result, numeric_mode=None):
+        """ Append a performed calculation to the history
+
+            Args:
+                operator(str): arithmetic operator or scientific function
+                first(str): first input operand of the operation
+                second(str): second input operand of the operation
+                arith_operator(str): operator combining both operands of a scientific function
+                result(tuple): output data and display message of the operation
+                numeric_mode(str): numeric type of an arithmetic operation
+        """
+        output_data, display_operation = result
+        entry = (time.time(), _text(operator), _text(first), _text(second),
+                 _text(arith_operator), numeric_mode, _text(output_data), display_operation)
+        with self._lock:
+            self._pending.append(entry)
+            if (len(self._pending) >= self.batch_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+
+    def flush(self):
+        """ Write the buffered entries to the database in a single transaction
+        """
+        with self._lock:
+            if self._pending:
+                with self._connection:
+                    self._connection.executemany(
+                        'INSERT INTO history (timestamp, operator, first, second, arith_operator,'
+                        ' numeric_mode, output, message) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                        self._pending)
+                self._pending = []
+            self._last_flush = time.monotonic()
+
+    def close(self):
+        """ Write the buffered entries and close the database
+        """
+        with self._lock:
+            if self._connection is not None:
+                self.flush()
+                self._connection.close()
+                self._connection = None
+
+    def recent(self, limit=20):
+        """ Get the latest entries, newest first
+
+            Args:
+                limit(int): maximum number of entries
+        """
+        return self.query(limit=limit)
+
+    def query(self, operator=None, since=None, until=None, limit=100):
+        """ Get the entries matching the filters, newest first
+
+            Args:
+                operator(str): only the entries of this operator
+                since(float): only the entries recorded at or after this timestamp
+                until(float): only the entries recorded before this timestamp
+                limit(int): maximum number of entries, None for all of them
+        """
+        return list(self.iter_entries(operator, since, until, limit))
+
+    def iter_entries(self, operator=None, since=None, until=None, limit=None,
+                     newest_first=True, fetch_size=1000):
+        """ Generator yielding the entries matching the filters, fetched from the database
+            in chunks so that any number of entries is read with bounded memory
+
+            Args:
+                operator(str): only the entries of this operator
+                since(float): only the entries recorded at or after this timestamp
+                until(float): only the entries recorded before this timestamp
+                limit(int): maximum number of entries, None for all of them
+                newest_first(bool): order of the entries
+                fetch_size(int): number of entries read from the database at once
+        """
+        conditions = []
+        parameters = []
+        for condition, value in (('operator = ?', operator), ('timestamp >= ?', since),
+                                 ('timestamp < ?', until)):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+        # The entries recorded while iterating, e.g. by a replay, are not yielded
+        conditions.append('id <= ?')
+        statement = 'SELECT {} FROM history WHERE {}'.format(_COLUMNS, ' AND '.join(conditions))
+        # Ordering by timestamp lets the filtered queries walk their index
+        statement += (' ORDER BY timestamp DESC, id DESC' if newest_first
+                      else ' ORDER BY timestamp, id')
+        if limit is not None:
+            statement += ' LIMIT ?'
+
+        with self._lock:
+            self.flush()
+            last_id = self._connection.execute('SELECT MAX(id) FROM history').fetchone()[0]
+            parameters.append(last_id or 0)
+            if limit is not None:
+                parameters.append(limit)
+            cursor = self._connection.execute(statement, parameters)
+            rows = cursor.fetchmany(fetch_size)
+        while rows:
+            yield from map(HistoryEntry._make, rows)
+            with self._lock:
+                rows = cursor.fetchmany(fetch_size)
+
+    def replay(self, calculator, entries=None):
+        """ Generator performing again the calculations of the history entries, yielding
+            each entry with the (output data, display message) of its new calculation
+
+            Args:
+                calculator(ScientificCalculator): calculator performing the calculations
+                entries(iterable): entries to replay, the whole history oldest first
+                                   by default
+        """
+        if entries is None:
+            entries = self.iter_entries(newest_first=False)
+        operators = calculator.get_operators()
+        for entry in entries:
+            if entry.operator in operators:
+                result = calculator.perform_operation(entry.operator, entry.first, entry.second,
+                                                      entry.numeric_mode)
+            else:
+                result = calculator.perform_scientific_operation(
+                    entry.operator, entry.first, entry.second, entry.arith_operator)
+            yield entry, result
@@ -0,0 +1,141 @@
+""" Module contains the explicit logging setup for the calculator, including the
+    queue based mode where the operations only enqueue the log records and a
+    background thread writes them to the log file in batches.
+"""
+
+# Importing modules
+import atexit
+import logging
+import logging.handlers
+import queue
+
+LOG_FORMAT = '%(asctime)s : %(levelname)s : %(name)s : %(message)s'
+
+# Logger of the calculator operations and its child logger for the per-input details
+CALCULATOR_LOGGER = 'calculatorLogs'
+DETAILS_LOGGER = 'calculatorLogs.details'
+
+# Listener and handlers installed by the current configuration
+_state = {
+    'listener': None,
+    'handlers': [],
+}
+
+
+class BatchingFileHandler(logging.handlers.RotatingFileHandler):
+    """ Rotating file handler which leaves flushing to the queue listener, so the
+        file is flushed once per batch of records instead of once per record
+    """
+    def __init__(self, filename, mode='a', max_bytes=0, backup_count=0):
+        super().__init__(filename, mode=mode, maxBytes=max_bytes,
+                         backupCount=backup_count, encoding='utf-8', delay=True)
+        self.deferred = False
+
+    def flush(self):
+        """ Flush the stream, unless the records are written as part of a batch
+        """
+        if not self.deferred:
+            super().flush()
+
+    def flush_batch(self):
+        """ Flush the records written as part of the current batch
+        """
+        super().flush()
+
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """ Queue handler enqueuing the records as they are, so their messages and
+        arguments are formatted by the listener thread instead of the calling one
+    """
+    def prepare(self, record):
+        """ Keep the record unformatted, the queue never leaves the process
+        """
+        return record
+
+
+class BatchQueueListener(logging.handlers.QueueListener):
+    """ Queue listener which flushes its handlers only once the queue is drained
+        or the batch size is reached
+    """
+    def __init__(self, log_queue, *handlers, batch_size=512):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+        self._pending = 0
+        for handler in handlers:
+            handler.deferred = True
+
+    def handle(self, record):
+        """ Write the record and flush the handlers at the end of a batch
+        """
+        super().handle(record)
+        self._pending += 1
+        if self._pending >= self.batch_size or self.queue.empty():
+            self.flush()
+
+    def flush(self):
+        """ Flush the records written by the handlers since the last flush
+        """
+        for handler in self.handlers:
+            getattr(handler, 'flush_batch', handler.flush)()
+        self._pending = 0
+
+
+def configure_logging(filename='logFile.log', filemode='a', queued=True, summary_only=False,
+                      max_bytes=0, backup_count=3, level=logging.INFO):
+    """ Configure the calculator logger. Nothing is logged to a file until this
+        function is called.
+
+        Args:
+            filename(str): path of the log file
+            filemode(str): 'a' to append to the log file, 'w' to truncate it first
+            queued(bool): enqueue the records on the calling thread and write them
+                          from a background thread
+            summary_only(bool): log only the operation summaries and warnings,
+                                skipping the per-input details
+            max_bytes(int): rotate the log file once it reaches this size, 0 disables rotation
+            backup_count(int): number of rotated log files to keep
+            level(int): threshold of the calculator logger
+    """
+    shutdown_logging()
+
+    file_handler = BatchingFileHandler(filename, filemode, max_bytes, backup_count)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    logger = logging.getLogger(CALCULATOR_LOGGER)
+    logger.setLevel(level)
+    logger.propagate = False
+    logging.getLogger(DETAILS_LOGGER).setLevel(
+        logging.WARNING if summary_only else logging.NOTSET)
+
+    if queued:
+        log_queue = queue.SimpleQueue()
+        handler = RecordQueueHandler(log_queue)
+        listener = BatchQueueListener(log_queue, file_handler)
+        listener.start()
+        _state['listener'] = listener
+    else:
+        handler = file_handler
+
+    logger.addHandler(handler)
+    _state['handlers'] = [handler, file_handler]
+    return logger
+
+
+def shutdown_logging():
+    """ Stop the background writer, flush the pending records and remove the
+        handlers installed by configure_logging
+    """
+    listener = _state['listener']
+    if listener is not None:
+        listener.stop()
+        listener.flush()
+        _state['listener'] = None
+
+    logger = logging.getLogger(CALCULATOR_LOGGER)
+    for handler in _state['handlers']:
+        logger.removeHandler(handler)
+        handler.close()
+    _state['handlers'] = []
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,315 @@
+""" Module contains the optional instrumentation of the calculator operations:
+    per-operator call and error counts and latency histograms of each phase,
+    exported as a snapshot or in the Prometheus text format.
+"""
+
+# Importing modules
+import bisect
+import http.server
+import threading
+import time
+from collections import defaultdict
+
+from .operations import REGISTRY
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+                   1e-3, 2.5e-3, 1e-2, float('inf'))
+
+# Phases of an operation: operand validation and conversion (a single pass),
+# the operation itself, the logging and the whole call
+PHASES = ('parse', 'operation', 'logging', 'total')
+
+# Label of the operators which are not registered, so that arbitrary user input does not
+# create a new series per operator
+INVALID_OPERATOR = 'invalid'
+
+
+class Histogram:
+    """ Latency histogram with fixed buckets
+    """
+    __slots__ = ('buckets', 'count', 'sum')
+
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        """ Add a latency to the histogram
+        """
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def cumulative_buckets(self):
+        """ Get the number of observations below each bucket bound
+        """
+        total = 0
+        cumulative = []
+        for bucket in self.buckets:
+            total += bucket
+            cumulative.append(total)
+        return cumulative
+
+
+class PhaseTimer:
+    """ Timer accumulating the latency of the successive phases of one operation,
+        which are recorded together once the operation is finished
+    """
+    __slots__ = ('metrics', 'operator', 'start', 'last', 'phases')
+
+    def __init__(self, metrics, operator):
+        self.metrics = metrics
+        self.operator = operator
+        self.start = self.last = time.perf_counter()
+        self.phases = {}
+
+    def lap(self, phase):
+        """ Add the time elapsed since the previous lap to the latency of the phase
+        """
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self.last
+        self.last = now
+
+    def finish(self, error=None):
+        """ Record the phase latencies and the total latency of the operation
+
+            Args:
+                error(str): error of the operation, if it failed
+        """
+        self.phases['total'] = time.perf_counter() - self.start
+        self.metrics.record(self.operator, self.phases, error)
+
+
+class MetricsShard:
+    """ Calls, errors and latencies recorded by a single thread. Its lock is only
+        contended by the snapshots, so recording never waits for the other threads.
+    """
+    __slots__ = ('lock', 'calls', 'errors', 'latencies')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.latencies = defaultdict(Histogram)
+
+    def record(self, operator, phases, error=None):
+        """ Record a call of the operator along with its phase latencies and its error
+        """
+        with self.lock:
+            self.calls[operator] += 1
+            if error:
+                self.errors[operator, error] += 1
+            for phase, seconds in phases.items():
+                self.latencies[operator, phase].observe(seconds)
+
+    def merge_into(self, other):
+        """ Add the recorded metrics to another shard
+        """
+        with self.lock:
+            for operator, count in self.calls.items():
+                other.calls[operator] += count
+            for key, count in self.errors.items():
+                other.errors[key] += count
+            for key, histogram in self.latencies.items():
+                merged = other.latencies[key]
+                merged.buckets = [total + count for total, count
+                                  in zip(merged.buckets, histogram.buckets)]
+                merged.count += histogram.count
+                merged.sum += histogram.sum
+
+    def clear(self):
+        """ Remove the recorded metrics
+        """
+        with self.lock:
+            self.calls.clear()
+            self.errors.clear()
+            self.latencies.clear()
+
+
+class OperationMetrics:
+    """ Thread-safe collector of the call counts, error counts and phase latencies
+        of the calculator operations. Pass it to the calculator to enable it:
+        Calculator(metrics=OperationMetrics()); it costs nothing when not provided.
+        Each thread records into its own shard, which are merged by the snapshots.
+    """
+    def __init__(self, namespace='calculator', registry=REGISTRY):
+        """ Args:
+                namespace(str): prefix of the exported metric names
+                registry(OperationRegistry): registered operations, the other operators
+                                             being recorded as INVALID_OPERATOR
+        """
+        self.namespace = namespace
+        self.registry = registry
+        # The lock guards the list of shards, not the recording
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards = []
+        # Metrics of the threads which have finished
+        self._retired = MetricsShard()
+
+    def timer(self, operator):
+        """ Start a timer for the phases of an operation
+
+            Args:
+                operator(str): operator of the timed operation
+        """
+        return PhaseTimer(self, operator)
+
+    def _shard(self):
+        """ Get the shard of the calling thread, created on its first record
+        """
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = MetricsShard()
+            with self._lock:
+                self._retire_shards()
+                self._shards.append((threading.current_thread(), shard))
+            return shard
+
+    def _retire_shards(self):
+        """ Merge the shards of the finished threads, which can not record anymore,
+            so that the number of shards does not grow with short-lived threads
+        """
+        shards = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                shards.append((thread, shard))
+            else:
+                shard.merge_into(self._retired)
+        self._shards = shards
+
+    def record(self, operator, phases, error=None):
+        """ Record a call of the operator along with its phase latencies and its error
+
+            Args:
+                operator(str): operator of the operation
+                phases(dict): latency in seconds of each phase
+                error(str): 'invalid_input', 'zero_division' or 'math_domain' if it failed
+        """
+        if operator not in self.registry:
+            operator = INVALID_OPERATOR
+        self._shard().record(operator, phases, error)
+
+    def reset(self):
+        """ Remove all the recorded metrics
+        """
+        with self._lock:
+            for _, shard in self._shards:
+                shard.clear()
+            self._retired.clear()
+
+    def snapshot(self):
+        """ Get a copy of the recorded metrics as plain dictionaries
+        """
+        merged = MetricsShard()
+        with self._lock:
+            self._retire_shards()
+            self._retired.merge_into(merged)
+            for _, shard in self._shards:
+                shard.merge_into(merged)
+
+        latencies = defaultdict(dict)
+        for (operator, phase), histogram in merged.latencies.items():
+            latencies[operator][phase] = {
+                'count': histogram.count,
+                'sum': histogram.sum,
+                'buckets': dict(zip(LATENCY_BUCKETS, histogram.cumulative_buckets())),
+            }
+        errors = defaultdict(dict)
+        for (operator, error), count in merged.errors.items():
+            errors[operator][error] = count
+        return {
+            'calls': dict(merged.calls),
+            'errors': dict(errors),
+            'latency': dict(latencies),
+        }
+
+    def to_prometheus(self):
+        """ Export the recorded metrics in the Prometheus text format
+        """
+        snapshot = self.snapshot()
+        name = self.namespace
+        lines = [
+            '# HELP {}_operations_total Operations performed by operator.'.format(name),
+            '# TYPE {}_operations_total counter'.format(name),
+        ]
+        for operator, count in sorted(snapshot['calls'].items()):
+            lines.append('{}_operations_total{{operator="{}"}} {}'.format(
+                name, _escape(operator), count))
+
+        lines += [
+            '# HELP {}_errors_total Failed operations by operator and error.'.format(name),
+            '# TYPE {}_errors_total counter'.format(name),
+        ]
+        for operator, errors in sorted(snapshot['errors'].items()):
+            for error, count in sorted(errors.items()):
+                lines.append('{}_errors_total{{operator="{}",error="{}"}} {}'.format(
+                    name, _escape(operator), error, count))
+
+        lines += [
+            '# HELP {}_phase_seconds Latency of each phase of the operations.'.format(name),
+            '# TYPE {}_phase_seconds histogram'.format(name),
+        ]
+        for operator, phases in sorted(snapshot['latency'].items()):
+            for phase, histogram in sorted(phases.items()):
+                labels = 'operator="{}",phase="{}"'.format(_escape(operator), phase)
+                for bound, count in histogram['buckets'].items():
+                    lines.append('{}_phase_seconds_bucket{{{},le="{}"}} {}'.format(
+                        name, labels, '+Inf' if bound == float('inf') else repr(bound), count))
+                lines.append('{}_phase_seconds_sum{{{}}} {!r}'.format(
+                    name, labels, histogram['sum']))
+                lines.append('{}_phase_seconds_count{{{}}} {}'.format(
+                    name, labels, histogram['count']))
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        """ Dump the metrics in the Prometheus text format to a file, e.g. for the
+            textfile collector of the node exporter
+
+            Args:
+                path(str): path of the written file
+        """
+        with open(path, 'w', encoding='utf-8') as metrics_file:
+            metrics_file.write(self.to_prometheus())
+
+    def serve(self, port=9100, host='127.0.0.1'):
+        """ Serve the metrics in the Prometheus text format from a background thread
+
+            Args:
+                port(int): port to listen on, 0 for any free port
+                host(str): host to listen on
+
+            Returns:
+                http.server.ThreadingHTTPServer: the running server, stopped with shutdown()
+        """
+        metrics = self
+
+        class MetricsHandler(http.server.BaseHTTPRequestHandler):
+            """ Handler answering every GET request with the metrics
+            """
+            def do_GET(self):  # pylint: disable=invalid-name
+                """ Send the metrics in the Prometheus text format
+                """
+                body = metrics.to_prometheus().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                """ Do not log the scrapes to stderr
+                """
+
+        server = http.server.ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def _escape(value):
+    """ Escape a label value of the Prometheus text format
+    """
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
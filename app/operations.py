@@ -0,0 +1,285 @@
+""" Module contains the registry of the calculator operations. Each operation is
+    registered once with its metadata (arity, domain, angle handling, scalar and
+    vectorized implementations) and looked up by symbol in precomputed tables.
+"""
+
+# Importing modules
+import cmath
+import fractions
+import math
+import operator
+import sys
+
+# Factor converting an angle of each angle mode into radians, and the size of a turn
+ANGLE_MODES = {
+    'rad': (1.0, 2 * math.pi),
+    'deg': (math.pi / 180, 360.0),
+    'grad': (math.pi / 200, 400.0),
+}
+
+# Largest factorial which fits into a float
+FACTORIAL_LIMIT = 170
+
+# Largest size in bits of an exact power, larger ones go through the float power
+EXACT_POWER_BITS = 8192
+
+# Number of decimal digits per bit of an integer
+_DIGITS_PER_BIT = math.log10(2)
+
+# Lookup tables of the vectorized implementations, built on first use
+_tables = {}
+
+
+class OperationInfo:
+    """ Metadata and implementations of a registered operation
+    """
+    __slots__ = ('symbol', 'name', 'method', 'arity', 'function', 'array_function', 'domain',
+                 'angle', 'nonzero_divisor', 'complex_function', '_vectorized')
+
+    def __init__(self, symbol, name, method, arity, function, array_function, domain=None,
+                 angle=None, nonzero_divisor=False, complex_function=None):
+        self.symbol = symbol
+        self.name = name
+        self.method = method
+        self.arity = arity
+        self.function = function
+        self.array_function = array_function
+        self.domain = domain
+        self.angle = angle
+        self.nonzero_divisor = nonzero_divisor
+        self.complex_function = complex_function
+        self._vectorized = None
+
+    def __repr__(self):
+        return 'OperationInfo({!r}, arity={})'.format(self.symbol, self.arity)
+
+    def vectorized(self):
+        """ Get the vectorized implementation, importing NumPy on first use when it
+            is given by the name of a NumPy function
+        """
+        if self._vectorized is None:
+            if isinstance(self.array_function, str):
+                import numpy  # pylint: disable=import-outside-toplevel
+                self._vectorized = getattr(numpy, self.array_function)
+            else:
+                self._vectorized = self.array_function
+        return self._vectorized
+
+
+class OperationRegistry:
+    """ Registry of the operations by symbol. The arithmetic operators (arity 2) and the
+        scientific functions (arity 1) are kept in tables rebuilt on registration only,
+        so that the lookups are plain dictionary accesses.
+    """
+    def __init__(self):
+        self._operations = {}
+        self.binary = {}
+        self.unary = {}
+        self.binary_methods = {}
+        self.unary_methods = {}
+        self.by_method = {}
+
+    def __contains__(self, symbol):
+        return symbol in self._operations
+
+    def __getitem__(self, symbol):
+        return self._operations[symbol]
+
+    def __iter__(self):
+        return iter(self._operations.values())
+
+    def __len__(self):
+        return len(self._operations)
+
+    def get(self, symbol, default=None):
+        """ Get the operation of the symbol
+        """
+        return self._operations.get(symbol, default)
+
+    def register(self, symbol, function, arity, array_function=None, name=None, method=None,
+                 domain=None, angle=None, nonzero_divisor=False, complex_function=None):
+        """ Register an operation
+
+            Args:
+                symbol(str): operator symbol or function name, e.g. '^' or 'sqrt'
+                function(callable): scalar implementation, raising ZeroDivisionError,
+                                    ValueError or OverflowError outside of its domain
+                arity(int): 2 for an arithmetic operator, 1 for a scientific function
+                array_function(str/callable): name of the NumPy function or vectorized
+                                              implementation, non-finite outside of the domain
+                name(str): identifier of the operation, the symbol by default
+                method(str): name of the calculator operation method, '_' + name by default
+                domain(str): description of the valid inputs, e.g. 'x >= 0'
+                angle(str): 'input' when the input is an angle, 'output' when the result is
+                nonzero_divisor(bool): if the second operand can not be zero
+                complex_function(callable): scalar implementation of the complex mode, the
+                                            operation is not defined for the complex
+                                            numbers when not provided (the vectorized
+                                            implementation must accept complex arrays)
+
+            Returns:
+                OperationInfo: the registered operation
+        """
+        if symbol in self._operations:
+            raise ValueError('Operation already registered: {}'.format(symbol))
+        if arity not in (1, 2):
+            raise ValueError('Unsupported arity: {}'.format(arity))
+        name = name or symbol
+        info = OperationInfo(symbol, name, method or '_' + name, arity, function,
+                             array_function, domain, angle, nonzero_divisor, complex_function)
+        self._operations[symbol] = info
+        operations, methods = ((self.binary, self.binary_methods) if arity == 2
+                               else (self.unary, self.unary_methods))
+        operations[symbol] = info
+        methods[symbol] = info.method
+        self.by_method[info.method] = info
+        return info
+
+    def unregister(self, symbol):
+        """ Remove a registered operation
+        """
+        info = self._operations.pop(symbol)
+        operations, methods = ((self.binary, self.binary_methods) if info.arity == 2
+                               else (self.unary, self.unary_methods))
+        del operations[symbol]
+        del methods[symbol]
+        self.by_method.pop(info.method, None)
+
+
+def to_radians(value, angle_mode):
+    """ Convert an angle of the angle mode into radians, reducing the angles given in
+        degrees or grads to one turn first so that no precision is lost
+
+        Args:
+            value(int/float/complex/ndarray): angle in the angle mode
+            angle_mode(str): 'rad', 'deg' or 'grad'
+    """
+    factor, turn = ANGLE_MODES[angle_mode]
+    if angle_mode == 'rad':
+        return value
+    if isinstance(value, complex) or getattr(getattr(value, 'dtype', None), 'kind', '') == 'c':
+        # The complex angles can not be reduced to one turn
+        return value * factor
+    return (value % turn) * factor
+
+
+def from_radians(value, angle_mode):
+    """ Convert an angle in radians into the angle mode
+
+        Args:
+            value(int/float/complex/ndarray): angle in radians
+            angle_mode(str): 'rad', 'deg' or 'grad'
+    """
+    factor, _ = ANGLE_MODES[angle_mode]
+    return value if angle_mode == 'rad' else value / factor
+
+
+def _power(base, exponent):
+    """ Raise the base to the exponent, exactly for the integers and the exact numeric
+        types, without ever returning a complex number
+    """
+    exact_types = (int, fractions.Fraction)
+    if (isinstance(base, exact_types) and isinstance(exponent, exact_types)
+            and abs(base) not in (0, 1)
+            and abs(exponent) * _bit_length(base) > EXACT_POWER_BITS):
+        # An exact result would have an unbounded number of digits
+        return math.pow(base, exponent)
+    result = base ** exponent
+    if isinstance(result, complex):
+        raise ValueError('math domain error')
+    return result
+
+
+def _bit_length(value):
+    """ Size in bits of an integer, or of the larger term of a fraction
+    """
+    if isinstance(value, fractions.Fraction):
+        return max(value.numerator.bit_length(), value.denominator.bit_length())
+    return value.bit_length()
+
+
+def check_exact_size(value):
+    """ Check that an exact result can be converted to text, the integers and fractions
+        over the digit limit of the interpreter raising an OverflowError
+
+        Args:
+            value: result of an operation, returned as is
+    """
+    limit = getattr(sys, 'get_int_max_str_digits', lambda: 0)()
+    if limit and isinstance(value, (int, fractions.Fraction)):
+        if _bit_length(value) * _DIGITS_PER_BIT + 1 >= limit:
+            raise OverflowError('exact result is too large')
+    return value
+
+
+def _factorial(value):
+    """ Factorial of a non-negative integral value, up to the float limit
+    """
+    if value != int(value) or value < 0:
+        raise ValueError('factorial is only defined for non-negative integers')
+    if value > FACTORIAL_LIMIT:
+        raise OverflowError('factorial is too large')
+    return math.factorial(int(value))
+
+
+def _factorial_array(values):
+    """ Vectorized factorial reading a table of the factorials up to the float limit,
+        nan outside of the domain
+    """
+    import numpy  # pylint: disable=import-outside-toplevel
+    if 'factorial' not in _tables:
+        _tables['factorial'] = numpy.array(
+            [math.factorial(number) for number in range(FACTORIAL_LIMIT + 1)], dtype=float)
+    values = numpy.asarray(values, dtype=float)
+    valid = (values >= 0) & (values <= FACTORIAL_LIMIT) & (values == numpy.floor(values))
+    index = numpy.where(valid, values, 0).astype(numpy.intp)
+    return numpy.where(valid, _tables['factorial'].take(index), numpy.nan)
+
+
+def _complex_log2(value):
+    """ Base 2 logarithm of a complex number
+    """
+    return cmath.log(value) / math.log(2)
+
+
+def _register_defaults(registry):
+    """ Register the built-in operations, in the order of the buttons of the window
+    """
+    register = registry.register
+    # Arithmetic operators
+    register('+', operator.add, 2, 'add', name='add', complex_function=operator.add)
+    register('-', operator.sub, 2, 'subtract', name='sub', method='_subtract',
+             complex_function=operator.sub)
+    register('*', operator.mul, 2, 'multiply', name='mul', method='_multiply',
+             complex_function=operator.mul)
+    register('/', operator.truediv, 2, 'divide', name='div', method='_division',
+             domain='y != 0', nonzero_divisor=True, complex_function=operator.truediv)
+    register('^', _power, 2, 'power', name='pow', domain='x >= 0 or integral y',
+             complex_function=operator.pow)
+    register('%', operator.mod, 2, 'remainder', name='mod', domain='y != 0',
+             nonzero_divisor=True)
+
+    # Scientific functions
+    register('sin', math.sin, 1, 'sin', angle='input', complex_function=cmath.sin)
+    register('cos', math.cos, 1, 'cos', angle='input', complex_function=cmath.cos)
+    register('tan', math.tan, 1, 'tan', angle='input', complex_function=cmath.tan)
+    register('log', math.log, 1, 'log', domain='x > 0', complex_function=cmath.log)
+    register('asin', math.asin, 1, 'arcsin', domain='-1 <= x <= 1', angle='output',
+             complex_function=cmath.asin)
+    register('acos', math.acos, 1, 'arccos', domain='-1 <= x <= 1', angle='output',
+             complex_function=cmath.acos)
+    register('atan', math.atan, 1, 'arctan', angle='output', complex_function=cmath.atan)
+    register('sinh', math.sinh, 1, 'sinh', complex_function=cmath.sinh)
+    register('cosh', math.cosh, 1, 'cosh', complex_function=cmath.cosh)
+    register('tanh', math.tanh, 1, 'tanh', complex_function=cmath.tanh)
+    register('log10', math.log10, 1, 'log10', domain='x > 0', complex_function=cmath.log10)
+    register('log2', math.log2, 1, 'log2', domain='x > 0', complex_function=_complex_log2)
+    register('exp', math.exp, 1, 'exp', complex_function=cmath.exp)
+    register('sqrt', math.sqrt, 1, 'sqrt', domain='x >= 0', complex_function=cmath.sqrt)
+    register('factorial', _factorial, 1, _factorial_array, name='fact', method='_factorial',
+             domain='integral 0 <= x <= {}'.format(FACTORIAL_LIMIT))
+    return registry
+
+
+# Registry of the calculator operations, new operations can be registered on it
+REGISTRY = _register_defaults(OperationRegistry())
@@ -0,0 +1,162 @@
+""" Module contains the multi-core execution of large calculation batches, which
+    shards the input across a process pool and reassembles the ordered results.
+"""
+
+# Importing modules
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .batch import READERS, process_row
+from .calculator import ScientificCalculator
+
+# Calculator of the current worker process
+_worker = {}
+
+
+def _init_worker(numeric_mode):
+    """ Initializer of each worker process creating its own calculator
+    """
+    _worker['calculator'] = ScientificCalculator(numeric_mode=numeric_mode)
+
+
+def _process_rows(rows):
+    """ Perform the operations of a shard of rows in a worker process
+    """
+    calculator = _worker['calculator']
+    return [process_row(calculator, row) for row in rows]
+
+
+def _process_arrays(method, operator, first_nums, second_nums, arith_operator):
+    """ Perform the batch operation of a shard of operand columns in a worker process
+    """
+    calculator = _worker['calculator']
+    if method == 'perform_operation_batch':
+        return calculator.perform_operation_batch(operator, first_nums, second_nums)
+    return calculator.perform_scientific_operation_batch(operator, first_nums, second_nums,
+                                                         arith_operator)
+
+
+class ParallelExecutor:
+    """ Executor running the calculator on shards of a large input across a pool of
+        worker processes. The results and messages are identical to the sequential
+        path and are returned in the order of the input.
+    """
+    def __init__(self, workers=None, chunk_size=10000, numeric_mode='float'):
+        """ Args:
+                workers(int): number of worker processes, the number of CPUs by default
+                chunk_size(int): number of rows in each shard sent to a worker
+                numeric_mode(str): numeric type of the arithmetic operations
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.numeric_mode = numeric_mode
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def pool(self):
+        """ Process pool of the executor, started on first use
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                             initargs=(self.numeric_mode,))
+        return self._pool
+
+    def close(self):
+        """ Shut down the worker processes
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def imap_rows(self, rows):
+        """ Generator yielding the (output data, display message) of each row in order.
+            Only a bounded number of shards is in flight, so the rows can be streamed
+            from a file of any size.
+
+            Args:
+                rows(iterable): operator, first operand, second operand and optional
+                                arithmetic operator of each row
+        """
+        rows = iter(rows)
+        pending = deque()
+        while True:
+            # Keep every worker busy with a shard queued behind it
+            while len(pending) < 2 * self.workers:
+                shard = list(itertools.islice(rows, self.chunk_size))
+                if not shard:
+                    break
+                pending.append(self.pool.submit(_process_rows, shard))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+    def map_rows(self, rows):
+        """ Get the list of (output data, display message) of each row in order
+
+            Args:
+                rows(iterable): operator, first operand, second operand and optional
+                                arithmetic operator of each row
+        """
+        return list(self.imap_rows(rows))
+
+    def map_file(self, path, input_format='csv'):
+        """ Generator yielding the input row along with its output data and display
+            message for each row of a CSV or JSON lines file
+
+            Args:
+                path(str): path of the input file
+                input_format(str): 'csv' or 'jsonl'
+        """
+        with open(path, newline='', encoding='utf-8') as input_stream:
+            rows, shard_rows = itertools.tee(READERS[input_format](input_stream))
+            for row, result in zip(rows, self.imap_rows(shard_rows)):
+                yield (row,) + result
+
+    def map_batch(self, operator, first_nums=None, second_nums=None, arith_operator=None):
+        """ Perform the batch operation over columns of operands, sharded across
+            the worker processes
+
+            Args:
+                operator(str): arithmetic operator or scientific function
+                first_nums(sequence/ndarray): first input operands for the operation
+                second_nums(sequence/ndarray): second input operands for the operation
+                arith_operator(str): operator combining both columns of a scientific function
+
+            Returns:
+                tuple: output array and the message array of the batch operation
+        """
+        method = ('perform_operation_batch' if operator in ScientificCalculator.get_operators()
+                  else 'perform_scientific_operation_batch')
+        columns = [None if nums is None else np.atleast_1d(nums)
+                   for nums in (first_nums, second_nums)]
+        length = max(len(column) for column in columns if column is not None)
+
+        starts = iter(range(0, length, self.chunk_size))
+        pending = deque()
+        results = []
+        while True:
+            # Only a bounded number of shards is copied to the workers at once
+            for start in itertools.islice(starts, 2 * self.workers - len(pending)):
+                # Single operands are broadcast to every shard
+                shard = [column if column is None or len(column) == 1
+                         else column[start:start + self.chunk_size] for column in columns]
+                pending.append(self.pool.submit(_process_arrays, method, operator, *shard,
+                                                arith_operator))
+            if not pending:
+                break
+            results.append(pending.popleft().result())
+
+        if not results:
+            return np.empty(0), np.empty(0, dtype=object)
+        return (np.concatenate([output_data for output_data, _ in results]),
+                np.concatenate([messages for _, messages in results]))
@@ -0,0 +1,158 @@
+""" Module contains the result types of the calculator operations: the compact result of
+    a single operation, whose display message is only rendered when it is read, and the
+    array-backed result of a batch operation holding a status code per row.
+"""
+
+# Status code of an operation, the codes of the failures index their message
+OK = 0
+INVALID_INPUT = 1
+ZERO_DIVISION = 2
+MATH_DOMAIN = 3
+
+# Messages shared by the scalar and the batch operations
+INVALID_INPUT_MESSAGE = 'Please provide valid input.'
+ZERO_DIVISION_MESSAGE = "Number 2 can't be zero. Please provide correct input."
+MATH_DOMAIN_MESSAGE = "Input is out of the function domain. Please provide correct input."
+
+# Error message of each status code, and status code of each error message
+STATUS_MESSAGES = (None, INVALID_INPUT_MESSAGE, ZERO_DIVISION_MESSAGE, MATH_DOMAIN_MESSAGE)
+STATUS_CODES = {message: code for code, message in enumerate(STATUS_MESSAGES) if message}
+
+
+class OperationResult:
+    """ Result of a single operation. It unpacks and compares like the
+        (output data, display message) tuple of the calculator methods, the output
+        data being '' when the operation failed.
+    """
+    __slots__ = ('value', 'status', 'operator', 'operands', 'arith_operator', '_message')
+
+    def __init__(self, value, status=OK, operator=None, operands=(), arith_operator=None):
+        """ Args:
+                value(int/float/Decimal/Fraction): output of the operation, None on failure
+                status(int): OK or the status code of the failure
+                operator(str): operator symbol or scientific function
+                operands(tuple): input operand texts, as displayed in the message
+                arith_operator(str): operator combining both operands of a scientific function
+        """
+        self.value = value
+        self.status = status
+        self.operator = operator
+        self.operands = operands
+        self.arith_operator = arith_operator
+        self._message = None
+
+    @property
+    def ok(self):
+        """ If the operation succeeded
+        """
+        return self.status == OK
+
+    @property
+    def output_data(self):
+        """ Output of the operation, '' when it failed
+        """
+        return self.value if self.status == OK else ''
+
+    @property
+    def message(self):
+        """ Display message of the operation, rendered on first access
+        """
+        if self._message is None:
+            if self.status != OK:
+                self._message = STATUS_MESSAGES[self.status]
+            elif self.arith_operator:
+                first_num, second_num = self.operands
+                self._message = 'Operation Performed: {}{}{}{}={}'.format(
+                    self.operator, first_num, self.arith_operator, second_num, self.value)
+            elif len(self.operands) == 1:
+                self._message = 'Operation Performed: {}{}={}'.format(
+                    self.operator, self.operands[0], self.value)
+            else:
+                first_num, second_num = self.operands
+                self._message = 'Operation Performed: {}{}{}={}'.format(
+                    first_num, self.operator, second_num, self.value)
+        return self._message
+
+    def as_tuple(self):
+        """ Get the (output data, display message) tuple of the result
+        """
+        return self.output_data, self.message
+
+    def __str__(self):
+        return self.message
+
+    def __repr__(self):
+        return 'OperationResult({!r}, status={})'.format(self.value, self.status)
+
+    def __iter__(self):
+        return iter(self.as_tuple())
+
+    def __len__(self):
+        return 2
+
+    def __getitem__(self, index):
+        return self.as_tuple()[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (OperationResult, tuple)):
+            return self.as_tuple() == tuple(other)
+        return NotImplemented
+
+    __hash__ = None
+
+
+class BatchResult:
+    """ Result of a batch operation: a float array of the outputs (nan for the failed
+        rows) and a uint8 array of the status codes. The object array of the messages
+        is only built when it is read. It unpacks like the (output data, messages)
+        tuple of the calculator batch methods.
+    """
+    __slots__ = ('values', 'status', 'operator', '_messages')
+
+    def __init__(self, values, status, operator=None):
+        """ Args:
+                values(ndarray): float output of each row
+                status(ndarray): uint8 status code of each row
+                operator(str): operator symbol or scientific function
+        """
+        self.values = values
+        self.status = status
+        self.operator = operator
+        self._messages = None
+
+    @property
+    def ok(self):
+        """ Boolean mask of the rows which succeeded
+        """
+        return self.status == OK
+
+    @property
+    def failed_rows(self):
+        """ Number of rows which failed
+        """
+        return int((self.status != OK).sum())
+
+    @property
+    def messages(self):
+        """ Object array with the error message of each row, None for the rows which
+            succeeded
+        """
+        if self._messages is None:
+            import numpy  # pylint: disable=import-outside-toplevel
+            messages = numpy.full(self.status.shape, None, dtype=object)
+            failed = self.status.nonzero()
+            messages[failed] = numpy.array(STATUS_MESSAGES, dtype=object).take(
+                self.status[failed])
+            self._messages = messages
+        return self._messages
+
+    def as_tuple(self):
+        """ Get the (output data, messages) tuple of the result
+        """
+        return self.values, self.messages
+
+    def __repr__(self):
+        return 'BatchResult({!r}, rows={})'.format(self.operator, self.status.size)
+
+    def __iter__(self):
+        return iter(self.as_tuple())
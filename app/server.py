@@ -0,0 +1,330 @@
+""" Module contains the asyncio calculation service, which exposes the calculator
+    over a local TCP or Unix socket using line-delimited JSON. Concurrent requests
+    are micro-batched into a single vectorized evaluation per operator.
+
+    Request line:  {"id": 1, "operator": "sin", "first": "3", "second": "2", "arith_operator": "+"}
+    Response line: {"id": 1, "output": -0.9589242746631385, "error": null}
+"""
+
+# Importing modules
+import asyncio
+import itertools
+import json
+import logging
+import math
+from collections import defaultdict
+
+from .calculator import INVALID_INPUT_MESSAGE, ScientificCalculator
+
+# Error message of the requests whose batch failed to be evaluated
+EVALUATION_ERROR_MESSAGE = 'The calculation failed. Please provide correct input.'
+
+logger = logging.getLogger('calculatorLogs')
+
+
+def _operand(value):
+    """ Normalize an operand of a request into the text given to the calculator
+    """
+    return '' if value is None else str(value)
+
+
+class CalculationServer:
+    """ Asyncio server evaluating the requests of all the connections in micro-batches.
+        Each connection can pipeline requests, which are answered in order.
+    """
+    # pylint: disable=too-many-instance-attributes
+    def __init__(self, calculator=None, max_batch_size=1024, max_delay=0.001,
+                 max_pending=10000, max_pipeline=1000):
+        """ Args:
+                calculator(ScientificCalculator): calculator evaluating the batches
+                max_batch_size(int): maximum number of requests evaluated together
+                max_delay(float): seconds waited for more requests to join a batch
+                max_pending(int): requests queued for evaluation before the connections
+                                  stop being read (backpressure)
+                max_pipeline(int): unanswered requests allowed per connection
+
+            Raises:
+                ValueError: if the calculator is in the complex mode, whose outputs can
+                            not be written as JSON numbers
+        """
+        self.calculator = calculator or ScientificCalculator()
+        if self.calculator.numeric_mode == 'complex':
+            raise ValueError('The complex mode is not supported by the calculation service')
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.max_pipeline = max_pipeline
+        self._queue = None
+        self._server = None
+        self._batcher = None
+        self._connections = {}
+
+    async def start(self, host='127.0.0.1', port=0, path=None):
+        """ Start listening on the TCP host and port, or on the Unix socket path
+
+            Returns:
+                tuple/str: address the server is listening on
+        """
+        self._queue = asyncio.Queue(self.max_pending)
+        self._batcher = asyncio.ensure_future(self._batch_loop())
+        if path:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path)
+            return path
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        """ Serve the connections until the server is closed
+        """
+        await self._server.serve_forever()
+
+    async def close(self):
+        """ Stop accepting connections, close the open ones and stop the batch evaluation
+        """
+        self._server.close()
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+        # Requests left in the queue will not be evaluated anymore
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+        for writer, handler in list(self._connections.items()):
+            writer.close()
+            handler.cancel()
+        await asyncio.gather(*self._connections.values(), return_exceptions=True)
+        await self._server.wait_closed()
+
+    async def _handle_connection(self, reader, writer):
+        """ Read the pipelined requests of a connection and queue them for evaluation,
+            while a separate task writes the responses back in the request order
+        """
+        responses = asyncio.Queue(self.max_pipeline)
+        response_writer = asyncio.ensure_future(self._write_responses(responses, writer))
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                future = asyncio.get_running_loop().create_future()
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The line exceeds the limit of the reader, the following data can not
+                    # be split into requests anymore
+                    future.set_result({'id': None, 'output': None,
+                                       'error': INVALID_INPUT_MESSAGE})
+                    await responses.put(future)
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError('Request must be an object')
+                except ValueError:
+                    future.set_result({'id': None, 'output': None,
+                                       'error': INVALID_INPUT_MESSAGE})
+                else:
+                    # Waiting for free space is the backpressure on the clients
+                    await self._queue.put((request, future))
+                await responses.put(future)
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.pop(writer, None)
+            await responses.put(None)
+            await response_writer
+
+    @staticmethod
+    async def _write_responses(responses, writer):
+        """ Write the response of each request once it is evaluated
+        """
+        try:
+            while True:
+                future = await responses.get()
+                if future is None:
+                    break
+                writer.write(json.dumps(await future).encode() + b'\n')
+                if responses.empty():
+                    await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            # The connection or the server was closed
+            pass
+        finally:
+            writer.close()
+
+    async def _batch_loop(self):
+        """ Collect the queued requests into batches and evaluate them
+        """
+        while True:
+            batch = [await self._queue.get()]
+            self._drain(batch)
+            if len(batch) < self.max_batch_size and self.max_delay:
+                # Give the concurrent requests a chance to join the batch
+                await asyncio.sleep(self.max_delay)
+                self._drain(batch)
+            try:
+                self.evaluate_batch(batch)
+            except Exception:  # pylint: disable=broad-except
+                # A failed batch must not stop the evaluation of the next ones
+                logger.exception('Evaluation of a batch of %d requests failed', len(batch))
+                for request, future in batch:
+                    if not future.done():
+                        future.set_result({'id': request.get('id'), 'output': None,
+                                           'error': EVALUATION_ERROR_MESSAGE})
+
+    def _drain(self, batch):
+        """ Move the queued requests into the batch, up to the maximum batch size
+        """
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    def evaluate_batch(self, batch):
+        """ Evaluate the batch with one vectorized operation per group of requests
+            sharing the same operator, and resolve the future of each request
+
+            Args:
+                batch(list): (request, future) pairs
+        """
+        operators = self.calculator.get_operators()
+        functions = self.calculator.get_scientific_operators()
+
+        groups = defaultdict(list)
+        for request, future in batch:
+            operator = _operand(request.get('operator'))
+            first, second = _operand(request.get('first')), _operand(request.get('second'))
+            arith_operator = _operand(request.get('arith_operator')) or None
+            if operator in operators and arith_operator is None:
+                key = (operator, None, True)
+            elif operator in functions and (not first or not second):
+                key = (operator, None, False)
+                first = first or second
+            elif operator in functions and arith_operator in operators:
+                key = (operator, arith_operator, True)
+            else:
+                future.set_result({'id': request.get('id'), 'output': None,
+                                   'error': INVALID_INPUT_MESSAGE})
+                continue
+            groups[key].append((request.get('id'), first, second, future))
+
+        for (operator, arith_operator, two_inputs), items in groups.items():
+            firsts = [first for _, first, _, _ in items]
+            seconds = [second for _, _, second, _ in items]
+            if operator in operators:
+                output_data, messages = self.calculator.perform_operation_batch(
+                    operator, firsts, seconds)
+            elif two_inputs:
+                output_data, messages = self.calculator.perform_scientific_operation_batch(
+                    operator, firsts, seconds, arith_operator)
+            else:
+                output_data, messages = self.calculator.perform_scientific_operation_batch(
+                    operator, firsts)
+
+            for (request_id, _, _, future), output, message in zip(items, output_data.tolist(),
+                                                                   messages):
+                if not future.done():
+                    future.set_result({'id': request_id,
+                                       'output': output if math.isfinite(output) else None,
+                                       'error': message})
+
+
+class CalculationClient:
+    """ Asyncio client of the calculation service, which pipelines the requests
+        over a single connection
+    """
+    def __init__(self):
+        self._reader = None
+        self._writer = None
+        self._pending = {}
+        self._ids = itertools.count()
+        self._receiver = None
+
+    async def connect(self, host='127.0.0.1', port=None, path=None):
+        """ Connect to the server on the TCP host and port, or on the Unix socket path
+        """
+        if path:
+            self._reader, self._writer = await asyncio.open_unix_connection(path)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(host, port)
+        self._receiver = asyncio.ensure_future(self._receive())
+        return self
+
+    async def close(self):
+        """ Close the connection to the server
+        """
+        self._writer.close()
+        await self._writer.wait_closed()
+        await self._receiver
+
+    async def _receive(self):
+        """ Resolve the pending requests with the responses read from the server
+        """
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                break
+            response = json.loads(line)
+            future = self._pending.pop(response['id'], None)
+            if future is not None:
+                future.set_result((response['output'], response['error']))
+        for future in self._pending.values():
+            future.set_exception(ConnectionError('Connection closed by the server'))
+        self._pending.clear()
+
+    async def calculate(self, operator, first=None, second=None, arith_operator=None):
+        """ Send a request and wait for its result
+
+            Args:
+                operator(str): arithmetic operator or scientific function
+                first(str/int/float): first input operand for the operation
+                second(str/int/float): second input operand for the operation
+                arith_operator(str): operator combining both the operands of a scientific function
+
+            Returns:
+                tuple: output of the operation (None on error) and the error message
+        """
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        request = {'id': request_id, 'operator': operator, 'first': first,
+                   'second': second, 'arith_operator': arith_operator}
+        self._writer.write(json.dumps(request).encode() + b'\n')
+        await self._writer.drain()
+        return await future
+
+
+def add_arguments(parser):
+    """ Add the arguments of the serve command to the parser
+
+        Args:
+            parser(argparse.ArgumentParser): parser of the serve command
+    """
+    parser.add_argument('--host', default='127.0.0.1', help='TCP host to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='TCP port to listen on')
+    parser.add_argument('--unix-socket', help='Unix socket path to listen on instead of TCP')
+    parser.add_argument('--max-batch-size', type=int, default=1024,
+                        help='maximum number of requests evaluated together')
+    parser.add_argument('--max-delay', type=float, default=0.001,
+                        help='seconds waited for more requests to join a batch')
+    parser.set_defaults(handler=run_command)
+
+
+def run_command(args):
+    """ Run the serve command for the parsed command line arguments
+
+        Args:
+            args(argparse.Namespace): parsed arguments of the serve command
+    """
+    async def serve():
+        server = CalculationServer(max_batch_size=args.max_batch_size,
+                                   max_delay=args.max_delay)
+        address = await server.start(args.host, args.port, args.unix_socket)
+        print('Calculation service listening on {}'.format(address), flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
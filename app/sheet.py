@@ -0,0 +1,246 @@
+""" Module contains the reactive sheet, a graph of cells holding values or formulas
+    such as "sin(A1+B1)" which reference other cells. A change recomputes only the
+    cells depending on it, in topological order, and stops where a value is unchanged.
+"""
+
+# Importing modules
+import heapq
+
+from .calculator import INVALID_INPUT_MESSAGE, MATH_DOMAIN_MESSAGE, ZERO_DIVISION_MESSAGE
+from .expression import ExpressionError, compile_expression
+
+
+class CycleError(ExpressionError):
+    """ Error raised for the formulas which would make a cell depend on itself
+    """
+
+
+class Cell:
+    """ Cell of the sheet. The level of a cell is greater than the level of all the
+        cells it depends on, so that evaluating the dirty cells by increasing level
+        evaluates each of them once, after its dependencies.
+    """
+    __slots__ = ('name', 'formula', 'expression', 'value', 'error', 'dependencies',
+                 'dependents', 'level')
+
+    def __init__(self, name):
+        self.name = name
+        self.formula = None
+        self.expression = None
+        self.value = None
+        # A referenced cell without value or formula is reported as invalid input
+        self.error = INVALID_INPUT_MESSAGE
+        self.dependencies = frozenset()
+        self.dependents = set()
+        self.level = 0
+
+    def __repr__(self):
+        return 'Cell({!r}, value={!r}, error={!r})'.format(self.name, self.value, self.error)
+
+
+class Sheet:
+    """ Sheet of cells evaluated incrementally. The values of the cells are kept, so
+        reading a cell costs no evaluation, and a change only evaluates the cells
+        depending on it whose inputs actually changed.
+    """
+    def __init__(self):
+        self._cells = {}
+        # Number of formula evaluations, to check the cost of the updates
+        self.evaluations = 0
+
+    def __contains__(self, name):
+        cell = self._cells.get(name)
+        return cell is not None and (cell.formula is not None or cell.value is not None)
+
+    def __getitem__(self, name):
+        return self.value(name)
+
+    def __len__(self):
+        return sum(1 for name in self._cells if name in self)
+
+    def _cell(self, name):
+        """ Get the cell of the name, created empty when it does not exist
+        """
+        cell = self._cells.get(name)
+        if cell is None:
+            cell = self._cells[name] = Cell(name)
+        return cell
+
+    def value(self, name):
+        """ Get the value of a cell, None when the cell failed
+
+            Args:
+                name(str): name of the cell, e.g. 'A1'
+        """
+        cell = self._cells.get(name)
+        return None if cell is None else cell.value
+
+    def error(self, name):
+        """ Get the error message of a cell, None when the cell has a value
+
+            Args:
+                name(str): name of the cell, e.g. 'A1'
+        """
+        cell = self._cells.get(name)
+        return INVALID_INPUT_MESSAGE if cell is None else cell.error
+
+    def set_value(self, name, value):
+        """ Set the value of a cell and recompute the cells depending on it
+
+            Args:
+                name(str): name of the cell
+                value(int/float): new value of the cell
+        """
+        self.update({name: value})
+
+    def update(self, values):
+        """ Set the values of several cells and recompute the cells depending on any of
+            them, each one once
+
+            Args:
+                values(dict): new value of each cell by name
+        """
+        changed = []
+        for name, value in values.items():
+            cell = self._cell(name)
+            if cell.formula is not None:
+                self._set_dependencies(cell, frozenset())
+                cell.formula = cell.expression = None
+            if (cell.value, cell.error) != (value, None):
+                cell.value, cell.error = value, None
+                changed.append(cell)
+        self._propagate(changed, evaluate=False)
+
+    def set_formula(self, name, formula):
+        """ Set the formula of a cell, evaluate it and recompute the cells depending on it
+
+            Args:
+                name(str): name of the cell
+                formula(str): expression referencing other cells, e.g. 'sin(A1+B1)/C1'
+
+            Raises:
+                ExpressionError: if the formula can not be parsed
+                CycleError: if the formula references the cell or one of its dependents,
+                            the cell being left unchanged
+        """
+        expression = compile_expression(formula)
+        dependencies = expression.variables
+        cell = self._cells.get(name) or Cell(name)
+        cycle = self._find_dependent(cell, dependencies)
+        if cycle is not None:
+            raise CycleError('Circular reference: {} depends on {}'.format(cycle, name))
+        self._cells[name] = cell
+        cell.formula = formula
+        cell.expression = expression
+        self._set_dependencies(cell, dependencies)
+        self._propagate([cell], evaluate=True)
+
+    def remove(self, name):
+        """ Clear a cell, the cells referencing it fail with the invalid input message
+
+            Args:
+                name(str): name of the cell
+        """
+        cell = self._cells.get(name)
+        if cell is None:
+            return
+        self._set_dependencies(cell, frozenset())
+        cell.formula = cell.expression = cell.value = None
+        cell.error = INVALID_INPUT_MESSAGE
+        if cell.dependents:
+            self._propagate([cell], evaluate=False)
+        else:
+            del self._cells[name]
+
+    def _find_dependent(self, cell, names):
+        """ Get the first of the names which is the cell or one of its dependents
+        """
+        if cell.name in names:
+            return cell.name
+        stack = list(cell.dependents)
+        seen = set(stack)
+        while stack:
+            dependent = stack.pop()
+            if dependent.name in names:
+                return dependent.name
+            for child in dependent.dependents:
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        return None
+
+    def _set_dependencies(self, cell, names):
+        """ Link the cell to the cells it references, raising its level and the levels
+            of its dependents above the levels of the new dependencies
+        """
+        for dependency in cell.dependencies:
+            dependency_cell = self._cells[dependency]
+            dependency_cell.dependents.discard(cell)
+            if (dependency_cell.formula is None and dependency_cell.value is None
+                    and not dependency_cell.dependents):
+                del self._cells[dependency]
+        cell.dependencies = names
+        level = 0
+        for dependency in names:
+            dependency_cell = self._cell(dependency)
+            dependency_cell.dependents.add(cell)
+            level = max(level, dependency_cell.level + 1)
+
+        # The levels only increase, they stay above the levels of the dependencies
+        if level > cell.level:
+            cell.level = level
+            stack = [cell]
+            while stack:
+                parent = stack.pop()
+                for dependent in parent.dependents:
+                    if dependent.level <= parent.level:
+                        dependent.level = parent.level + 1
+                        stack.append(dependent)
+
+    def _propagate(self, changed, evaluate):
+        """ Evaluate the dirty cells by increasing level, starting from the changed cells,
+            and only mark the dependents of the cells whose value or error changed
+
+            Args:
+                changed(list): cells whose content changed
+                evaluate(bool): if the changed cells must be evaluated themselves
+        """
+        heap = []
+        queued = set()
+
+        def push(cell):
+            if cell.name not in queued:
+                queued.add(cell.name)
+                heapq.heappush(heap, (cell.level, cell.name, cell))
+
+        for cell in changed:
+            if evaluate:
+                push(cell)
+            else:
+                for dependent in cell.dependents:
+                    push(dependent)
+        while heap:
+            _, _, cell = heapq.heappop(heap)
+            previous = (cell.value, cell.error)
+            self._evaluate(cell)
+            if (cell.value, cell.error) != previous:
+                for dependent in cell.dependents:
+                    push(dependent)
+
+    def _evaluate(self, cell):
+        """ Evaluate the formula of the cell from the values of its dependencies
+        """
+        self.evaluations += 1
+        values = {}
+        for dependency in cell.dependencies:
+            dependency_cell = self._cells[dependency]
+            if dependency_cell.error is not None:
+                cell.value, cell.error = None, dependency_cell.error
+                return
+            values[dependency] = dependency_cell.value
+        try:
+            cell.value, cell.error = cell.expression(**values), None
+        except ZeroDivisionError:
+            cell.value, cell.error = None, ZERO_DIVISION_MESSAGE
+        except (ArithmeticError, ValueError):
+            cell.value, cell.error = None, MATH_DOMAIN_MESSAGE
@@ -0,0 +1,308 @@
+""" Module contains the unit-aware evaluation of the expressions. The variables are
+    given units such as "m/s" or "km/h", whose dimensions are checked once when the
+    expression is compiled: the scale factors are folded into the compiled code, so
+    the evaluation stays plain float arithmetic on scalars or arrays.
+"""
+
+# Importing modules
+import ast
+import math
+from fractions import Fraction
+
+from .cache import ResultCache
+from .expression import (EXPRESSION_CACHE_SIZE, Expression, ExpressionError, Number,
+                         Operation, Variable)
+from .operations import REGISTRY
+
+# Base dimensions of the International System of Units
+BASE_UNITS = ('kg', 'm', 's', 'A', 'K', 'mol', 'cd')
+
+# Derived units: name, scale and definition from the previously defined units
+DERIVED_UNITS = (
+    ('g', 1e-3, 'kg'),
+    ('min', 60.0, 's'),
+    ('h', 3600.0, 's'),
+    ('Hz', 1.0, '1/s'),
+    ('N', 1.0, 'kg*m/s^2'),
+    ('Pa', 1.0, 'N/m^2'),
+    ('bar', 1e5, 'Pa'),
+    ('J', 1.0, 'N*m'),
+    ('eV', 1.602176634e-19, 'J'),
+    ('W', 1.0, 'J/s'),
+    ('C', 1.0, 'A*s'),
+    ('V', 1.0, 'W/A'),
+    ('ohm', 1.0, 'V/A'),
+    ('L', 1e-3, 'm^3'),
+    ('rad', 1.0, '1'),
+    ('deg', math.pi / 180, '1'),
+    ('percent', 0.01, '1'),
+)
+
+# Prefixes of the unit names, e.g. km or mA
+PREFIXES = {'G': 1e9, 'M': 1e6, 'k': 1e3, 'c': 1e-2, 'm': 1e-3, 'u': 1e-6, 'n': 1e-9}
+
+
+class UnitError(ExpressionError):
+    """ Error raised for the unknown units and the operations mixing incompatible
+        dimensions
+    """
+
+
+class Unit:
+    """ Unit given by its scale relative to the SI units and the exponent of each base
+        dimension, e.g. km/h is 1/3.6 m*s^-1
+    """
+    __slots__ = ('scale', 'dimensions')
+
+    def __init__(self, scale=1.0, dimensions=(0,) * len(BASE_UNITS)):
+        """ Args:
+                scale(float): value of the unit in SI units
+                dimensions(tuple): exponent of each base dimension
+        """
+        self.scale = scale
+        self.dimensions = tuple(Fraction(exponent) for exponent in dimensions)
+
+    def __mul__(self, other):
+        return Unit(self.scale * other.scale,
+                    [first + second for first, second in zip(self.dimensions, other.dimensions)])
+
+    def __truediv__(self, other):
+        return Unit(self.scale / other.scale,
+                    [first - second for first, second in zip(self.dimensions, other.dimensions)])
+
+    def __pow__(self, exponent):
+        exponent = Fraction(exponent).limit_denominator(1000)
+        return Unit(self.scale ** float(exponent),
+                    [dimension * exponent for dimension in self.dimensions])
+
+    def __eq__(self, other):
+        return (isinstance(other, Unit) and self.scale == other.scale
+                and self.dimensions == other.dimensions)
+
+    def __hash__(self):
+        return hash((self.scale, self.dimensions))
+
+    def __repr__(self):
+        return 'Unit({!r})'.format(str(self))
+
+    def __str__(self):
+        """ Unit written with the base units, e.g. kg*m^2/s^2
+        """
+        def power(name, exponent):
+            if exponent == 1:
+                return name
+            return '{}^{}'.format(name, exponent if exponent.denominator == 1
+                                  else '({})'.format(exponent))
+
+        numerator = [power(name, exponent) for name, exponent
+                     in zip(BASE_UNITS, self.dimensions) if exponent > 0]
+        denominator = [power(name, -exponent) for name, exponent
+                       in zip(BASE_UNITS, self.dimensions) if exponent < 0]
+        text = '*'.join(numerator) or '1'
+        if denominator:
+            text += '/' + '/'.join(denominator)
+        return text if self.scale == 1 else '{!r}*{}'.format(self.scale, text)
+
+    @property
+    def dimensionless(self):
+        """ Check if all the dimension exponents are zero, e.g. for rad or percent
+        """
+        return not any(self.dimensions)
+
+    def same_dimensions(self, other):
+        """ Check if both units measure the same quantity, whatever their scale
+        """
+        return self.dimensions == other.dimensions
+
+
+def _build_units():
+    """ Build the table of the named units
+    """
+    units = {}
+    for index, name in enumerate(BASE_UNITS):
+        dimensions = [0] * len(BASE_UNITS)
+        dimensions[index] = 1
+        units[name] = Unit(1.0, dimensions)
+    for name, scale, definition in DERIVED_UNITS:
+        unit = _parse_unit(definition, units)
+        units[name] = Unit(scale * unit.scale, unit.dimensions)
+    return units
+
+
+def _named_unit(name, units):
+    """ Get the unit of a name, possibly prefixed
+    """
+    if name in units:
+        return units[name]
+    if len(name) > 1 and name[0] in PREFIXES and name[1:] in units:
+        unit = units[name[1:]]
+        return Unit(PREFIXES[name[0]] * unit.scale, unit.dimensions)
+    raise UnitError('Unknown unit: {}'.format(name))
+
+
+def _unit_node(node, units):
+    """ Convert a Python syntax node of a unit text into its unit
+    """
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return Unit(float(node.value))
+    if isinstance(node, ast.Name):
+        return _named_unit(node.id, units)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult):
+        return _unit_node(node.left, units) * _unit_node(node.right, units)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Div):
+        return _unit_node(node.left, units) / _unit_node(node.right, units)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+        exponent = _unit_node(node.right, units)
+        if not exponent.dimensionless:
+            raise UnitError('Unit exponents must be numbers')
+        return _unit_node(node.left, units) ** exponent.scale
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return Unit(-_unit_node(node.operand, units).scale)
+    raise UnitError('Unsupported unit element: {}'.format(ast.dump(node)))
+
+
+def _parse_unit(text, units):
+    """ Parse a unit text with the table of the named units
+    """
+    try:
+        tree = ast.parse(text.strip().replace('^', '**'), mode='eval')
+    except SyntaxError as error:
+        raise UnitError('Invalid unit: {}'.format(text)) from error
+    return _unit_node(tree.body, units)
+
+
+# Named units, including the base and derived SI units
+UNITS = _build_units()
+
+# Unit of the plain numbers
+DIMENSIONLESS = Unit()
+
+
+def parse_unit(text):
+    """ Parse a unit text such as "km/h", "kg*m/s^2" or "N*m" into a Unit
+
+        Args:
+            text(str/Unit): unit text, a Unit being returned as is, empty or None for
+                            the plain numbers
+    """
+    if isinstance(text, Unit):
+        return text
+    if not text:
+        return DIMENSIONLESS
+    return _parse_unit(text, UNITS)
+
+
+# Expression methods whose operands must have the same dimensions
+_SAME_DIMENSIONS = {REGISTRY[symbol].method for symbol in ('+', '-', '%')}
+
+
+def check_dimensions(node, units):
+    """ Check the dimensions of the expression tree and scale its variables into SI
+        units, getting the rewritten tree and the SI unit of its value
+
+        Args:
+            node(Number/Variable/Operation): root of the expression tree
+            units(dict): Unit of each variable, the others being plain numbers
+
+        Raises:
+            UnitError: if an operation mixes incompatible dimensions
+    """
+    if isinstance(node, Number):
+        return node, DIMENSIONLESS
+    if isinstance(node, Variable):
+        unit = units.get(node.name, DIMENSIONLESS)
+        if unit.scale != 1:
+            node = Operation(REGISTRY['*'].method, (node, Number(unit.scale)))
+        return node, Unit(1.0, unit.dimensions)
+
+    checked = [check_dimensions(operand, units) for operand in node.operands]
+    operands = tuple(operand for operand, _ in checked)
+    operand_units = [unit for _, unit in checked]
+    method = node.method
+    first = operand_units[0]
+    if method in _SAME_DIMENSIONS or method == '_negate':
+        if any(not first.same_dimensions(unit) for unit in operand_units):
+            raise UnitError('Incompatible units: {}'.format(
+                ' and '.join(str(unit) for unit in operand_units)))
+        unit = first
+    elif method == REGISTRY['*'].method:
+        unit = first * operand_units[1]
+    elif method == REGISTRY['/'].method:
+        unit = first / operand_units[1]
+    elif method == REGISTRY['^'].method:
+        exponent = operands[1]
+        if not operand_units[1].dimensionless:
+            raise UnitError('The exponent must be a plain number, not {}'.format(
+                operand_units[1]))
+        if first.dimensionless:
+            unit = DIMENSIONLESS
+        elif isinstance(exponent, Number):
+            unit = first ** exponent.value
+        else:
+            raise UnitError('The exponent of a {} value must be a constant'.format(first))
+    elif method == REGISTRY['sqrt'].method:
+        unit = first ** 0.5
+    else:
+        # The other functions (sin, log, exp, ...) take and return plain numbers
+        if not first.dimensionless:
+            raise UnitError('The argument of {} must be a plain number, not {}'.format(
+                method.lstrip('_'), first))
+        unit = DIMENSIONLESS
+    return Operation(method, operands), unit
+
+
+class UnitExpression(Expression):
+    """ Expression whose variables have units, checked once when it is compiled. The
+        variables are given in their units and the result in the output unit, the
+        conversions being folded into the compiled function and kernel.
+    """
+    def __init__(self, source, units=None, to=None):
+        """ Args:
+                source(str): expression text such as "d / t"
+                units(dict): unit text or Unit of each variable, e.g. {'d': 'km'}
+                to(str/Unit): unit of the result, its SI unit by default
+
+            Raises:
+                UnitError: if a unit is unknown or an operation mixes incompatible
+                           dimensions
+        """
+        self.units = {name: parse_unit(unit) for name, unit in (units or {}).items()}
+        self.unit = parse_unit(to) if to else None
+        super().__init__(source)
+
+    def __repr__(self):
+        return 'UnitExpression({!r}, unit={!r})'.format(self.source, str(self.unit))
+
+    def _transform(self, tree):
+        """ Check the dimensions, scale the variables into SI units and the result into
+            the output unit
+        """
+        tree, unit = check_dimensions(tree, self.units)
+        if self.unit is None:
+            self.unit = unit
+        elif not self.unit.same_dimensions(unit):
+            raise UnitError('The result in {} can not be given in {}'.format(unit, self.unit))
+        elif self.unit.scale != 1:
+            tree = Operation(REGISTRY['/'].method, (tree, Number(self.unit.scale)))
+        return tree
+
+
+# Compiled unit expressions shared by compile_unit_expression
+unit_expression_cache = ResultCache(EXPRESSION_CACHE_SIZE)
+
+
+def compile_unit_expression(source, units=None, to=None):
+    """ Parse, check and compile the expression with the units of its variables, the
+        compiled expressions being cached by text and units
+
+        Args:
+            source(str): expression text such as "d / t"
+            units(dict): unit text or Unit of each variable, e.g. {'d': 'km', 't': 'h'}
+            to(str/Unit): unit of the result, its SI unit by default
+    """
+    key = (source, tuple(sorted((units or {}).items())), to)
+    expression = unit_expression_cache.get(key)
+    if expression is None:
+        expression = UnitExpression(source, units, to)
+        unit_expression_cache.put(key, expression)
+    return expression
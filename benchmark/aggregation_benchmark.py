@@ -0,0 +1,109 @@
+""" Benchmark of the streaming aggregation against the sum emulated by chaining the
+    calculator addition, reporting the error of the sums and variances on ill-conditioned
+    data and the throughput of each path.
+
+    Usage:
+        python benchmark/aggregation_benchmark.py [--size 1000000] [--chained 20000]
+"""
+
+# Importing modules
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+# pylint: disable=wrong-import-position
+from app.aggregation import StreamingStatistics, aggregate
+from app.calculator import Calculator
+from app.operations import REGISTRY
+
+
+def timed(function):
+    """ Call the function and get its result along with the elapsed seconds
+    """
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def relative_error(value, exact):
+    """ Relative error of a value, against an exact non-zero value
+    """
+    return abs(value - exact) / abs(exact)
+
+
+def main():
+    """ Run the benchmark and print the error and throughput of each path
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=1000000, help='values aggregated')
+    parser.add_argument('--chained', type=int, default=20000,
+                        help='values summed with the chained calculator operations')
+    args = parser.parse_args()
+
+    # Values spanning 20 orders of magnitude and a large offset for the variance
+    generator = np.random.default_rng(0)
+    values = generator.normal(0, 1, args.size) * 10.0 ** generator.integers(-10, 10, args.size)
+    offset_values = 1e9 + generator.normal(0, 1, args.size)
+    add = REGISTRY['+'].function
+    calculator = Calculator()
+
+    print('{:<34}{:>14}{:>16}'.format('path', 'values/s', 'relative error'))
+    exact = math.fsum(values)
+
+    def chained_strings():
+        total = '0'
+        for value in values[:args.chained]:
+            total = str(calculator.perform_operation('+', total, repr(float(value)))[0])
+        return float(total)
+
+    def chained_add():
+        total = 0.0
+        for value in values.tolist():
+            total = add(total, value)
+        return total
+
+    def streaming_scalars():
+        stats = StreamingStatistics()
+        for value in values.tolist():
+            stats.update(value)
+        return stats.sum
+
+    paths = [
+        ('chained perform_operation', chained_strings, args.chained,
+         math.fsum(values[:args.chained])),
+        ('chained add', chained_add, args.size, exact),
+        ('numpy sum', lambda: float(values.sum()), args.size, exact),
+        ('streaming update (scalars)', streaming_scalars, args.size, exact),
+        ('streaming aggregate (chunks)', lambda: aggregate(values).sum, args.size, exact),
+    ]
+    for name, function, count, expected in paths:
+        total, elapsed = timed(function)
+        print('{:<34}{:>14,.0f}{:>16.2e}'.format(name, count / elapsed,
+                                                 relative_error(total, expected)))
+
+    # Variance of values with a large offset, where the sum of squares formula cancels
+    exact_variance = float(np.var(offset_values - 1e9))
+    sums = math.fsum(offset_values)
+    squares = math.fsum((offset_values ** 2).tolist())
+    naive_variance = squares / args.size - (sums / args.size) ** 2
+    print('\n{:<34}{:>16}'.format('variance', 'relative error'))
+    print('{:<34}{:>16.2e}'.format('sum of squares',
+                                   relative_error(naive_variance, exact_variance)))
+    print('{:<34}{:>16.2e}'.format('streaming (Welford/Chan)', relative_error(
+        aggregate(offset_values).variance(), exact_variance)))
+
+    stats = aggregate(values)
+    print('\n{:<34}{:>16}'.format('quantile', 'relative error'))
+    for fraction in (0.5, 0.9, 0.99):
+        expected = np.quantile(values, fraction, method='lower')
+        print('{:<34}{:>16.2e}'.format('p{:g}'.format(fraction * 100), relative_error(
+            stats.quantile(fraction), expected)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+""" Benchmark of the compiled expressions against the repeated calculator operations
+    evaluating the same formula, for scalars (generated function) and arrays (fused
+    kernel against the unfused NumPy functions).
+
+    Usage:
+        python benchmark/expression_benchmark.py [--calls 20000] [--size 1000000]
+"""
+
+# Importing modules
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+# pylint: disable=wrong-import-position
+from app.calculator import ScientificCalculator
+from app.expression import (Number, Variable, _array_functions, _scalar_functions,
+                            compile_expression)
+
+FORMULA = "sin(x+y)*log(x)/y"
+
+
+def timed(function):
+    """ Call the function and get its result along with the elapsed seconds
+    """
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def interpret(node, variables, functions):
+    """ Evaluate the expression tree by walking it, one function call per operation
+    """
+    if isinstance(node, Number):
+        return node.value
+    if isinstance(node, Variable):
+        return variables[node.name]
+    return functions[node.method](*(interpret(operand, variables, functions)
+                                    for operand in node.operands))
+
+
+def main():
+    """ Run the benchmark and print the evaluations per second of each path
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=20000, help='scalar evaluations')
+    parser.add_argument('--size', type=int, default=1000000, help='array length')
+    args = parser.parse_args()
+
+    generator = np.random.default_rng(0)
+    xs = generator.uniform(1, 10, args.calls).tolist()
+    ys = generator.uniform(1, 10, args.calls).tolist()
+    calculator = ScientificCalculator()
+    compiled = compile_expression(FORMULA)
+    scalar_functions = _scalar_functions()
+
+    def operations():
+        # The formula performed as the chained calculator operations on the display texts
+        results = []
+        for x, y in zip(xs, ys):
+            first, second = repr(x), repr(y)
+            sine, _ = calculator.perform_scientific_operation('sin', first, second, '+')
+            logarithm, _ = calculator.perform_scientific_operation('log', first)
+            product, _ = calculator.perform_operation('*', str(sine), str(logarithm))
+            quotient, _ = calculator.perform_operation('/', str(product), second)
+            results.append(quotient)
+        return results
+
+    def interpreted():
+        return [interpret(compiled.tree, {'x': x, 'y': y}, scalar_functions)
+                for x, y in zip(xs, ys)]
+
+    def evaluate():
+        return [calculator.evaluate(FORMULA, x=x, y=y) for x, y in zip(xs, ys)]
+
+    def keywords():
+        return [compiled(x=x, y=y) for x, y in zip(xs, ys)]
+
+    def positional():
+        function = compiled.function
+        return [function(x, y) for x, y in zip(xs, ys)]
+
+    print(FORMULA)
+    print(compiled.function.code)
+    print('{:<34}{:>14}{:>10}'.format('scalar path', 'formulas/s', 'speedup'))
+    expected, baseline = timed(operations)
+    for name, function in (('chained operations', operations),
+                           ('interpreted tree', interpreted),
+                           ('calculator.evaluate (cached)', evaluate),
+                           ('compiled(x=, y=)', keywords),
+                           ('compiled.function(x, y)', positional)):
+        results, elapsed = timed(function)
+        assert results == expected, name
+        print('{:<34}{:>14,.0f}{:>9.1f}x'.format(name, args.calls / elapsed,
+                                                 baseline / elapsed))
+
+    x = generator.uniform(1, 10, args.size)
+    y = generator.uniform(1, 10, args.size)
+    array_functions = _array_functions()
+    print('\n{:<34}{:>14}{:>10}'.format('array path', 'values/s', 'speedup'))
+    expected, baseline = timed(lambda: interpret(compiled.tree, {'x': x, 'y': y},
+                                                 array_functions))
+    for name, function in (('unfused numpy', lambda: interpret(
+            compiled.tree, {'x': x, 'y': y}, array_functions)),
+                           ('fused kernel', lambda: compiled(x=x, y=y))):
+        results, elapsed = timed(function)
+        assert np.array_equal(results, expected), name
+        print('{:<34}{:>14,.0f}{:>9.1f}x'.format(name, args.size / elapsed,
+                                                 baseline / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+""" Benchmark comparing the exact NumPy scientific functions with the lookup tables of
+    the fast approximate mode, reporting the cost per value, the maximum absolute error
+    and the memory of the tables.
+
+    Usage:
+        python benchmark/fast_math_benchmark.py [--size 1000000] [--accuracy 1e-7]
+"""
+
+# Importing modules
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app.fast_math import FastMath  # pylint: disable=wrong-import-position
+
+
+def main():
+    """ Run the benchmark and print the cost per value and the error of each function
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=1000000, help='values per call')
+    parser.add_argument('--accuracy', type=float, default=1e-7, help='accuracy target')
+    args = parser.parse_args()
+
+    generator = np.random.default_rng(0)
+    inputs = {
+        'sin': generator.uniform(-100, 100, args.size),
+        'cos': generator.uniform(-100, 100, args.size),
+        'tan': generator.uniform(-1.4, 1.4, args.size),
+        'log': 10 ** generator.uniform(-10, 10, args.size),
+    }
+    tables = {interpolation: FastMath(args.accuracy, interpolation)
+              for interpolation in ('cubic', 'linear')}
+    for interpolation, fast in tables.items():
+        print('{} tables: {:,} bytes'.format(interpolation, fast.nbytes))
+
+    print('{:<6}{:<8}{:>12}{:>12}{:>12}'.format('func', 'path', 'ns/value', 'speedup',
+                                                  'max error'))
+    for name, values in inputs.items():
+        exact = getattr(np, name)
+        expected = exact(values)
+        exact_ns = min(timeit.repeat(lambda: exact(values), number=3, repeat=3)) / 3 / args.size * 1e9
+        print('{:<6}{:<8}{:>12.2f}{:>12}{:>12}'.format(name, 'numpy', exact_ns, '', ''))
+        for interpolation, fast in tables.items():
+            function = getattr(fast, name)
+            elapsed = min(timeit.repeat(lambda: function(values),  # pylint: disable=cell-var-from-loop
+                                        number=3, repeat=3)) / 3 / args.size * 1e9
+            error = np.max(np.abs(function(values) - expected))
+            print('{:<6}{:<8}{:>12.2f}{:>11.2f}x{:>12.1e}'.format(
+                name, interpolation, elapsed, exact_ns / elapsed, error))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+""" Benchmark of the calculation history: the overhead of recording on the operations,
+    the bulk insertion of entries into a database file and the lookup of the recent
+    and filtered entries once it holds many of them.
+
+    Usage:
+        python benchmark/history_benchmark.py [--entries 1000000] [--number 20000]
+"""
+
+# Importing modules
+import argparse
+import os
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+# pylint: disable=wrong-import-position
+from app.calculator import Calculator
+from app.history import HistoryStore
+
+
+def main():
+    """ Run the benchmark and print the cost of recording and looking up the history
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--entries', type=int, default=1000000,
+                        help='entries stored before measuring the lookups')
+    parser.add_argument('--number', type=int, default=20000, help='operations timed')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'history.db')
+        with HistoryStore(path) as history:
+            plain = Calculator()
+            recorded = Calculator(history=history)
+            for name, cal in (('no history', plain), ('history', recorded)):
+                elapsed = min(timeit.repeat(lambda cal=cal: cal.perform_operation('+', '3', '2'),
+                                            number=args.number, repeat=3))
+                print('{:<28}{:>12.2f} us/op'.format(name, elapsed / args.number * 1e6))
+
+            # Bulk recording of the entries, memory stays bounded by the batch size
+            result = (5, 'Operation Performed: 3+2=5')
+            operators = '+-*/'
+            tracemalloc.start()
+            start = time.perf_counter()
+            for index in range(args.entries):
+                history.record(operators[index % 4], '3', '2', None, result, 'float')
+            history.flush()
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print('{:<28}{:>12,.0f} entries/s  (peak {:.1f} MiB)'.format(
+                'record', args.entries / elapsed, peak / 2 ** 20))
+            print('{:<28}{:>12.1f} MiB'.format('database size',
+                                               os.path.getsize(path) / 2 ** 20))
+
+            since = time.time() - 60
+            lookups = [
+                ('recent(20)', lambda: history.recent(20)),
+                ('query(operator, limit=20)', lambda: history.query(operator='*', limit=20)),
+                ('query(since, limit=20)', lambda: history.query(since=since, limit=20)),
+            ]
+            for name, lookup in lookups:
+                elapsed = min(timeit.repeat(lookup, number=1000, repeat=3))
+                print('{:<28}{:>12.1f} us'.format(name, elapsed / 1000 * 1e6))
+
+
+if __name__ == '__main__':
+    main()
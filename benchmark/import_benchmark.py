@@ -0,0 +1,117 @@
+""" Startup benchmark measuring the import cost of the calculator modules with
+    python -X importtime, each import running in a fresh interpreter. The results use
+    the JSON format of the benchmark suite, so runs can be compared over time.
+
+    Usage:
+        python benchmark/import_benchmark.py -o imports.json
+        python benchmark/import_benchmark.py --compare baseline.json --threshold 0.2
+"""
+
+# Importing modules
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from benchmark.run_benchmarks import compare_results  # pylint: disable=wrong-import-position
+
+ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# Modules imported by the command line tools and the UI entry point
+MODULES = ['app.calculator', 'app.batch', 'app.calculator_ui']
+
+
+def import_time(module):
+    """ Import the module in a fresh interpreter and get its cumulative import time
+        in nanoseconds, along with the number of modules it imported
+
+        Args:
+            module(str): dotted name of the imported module
+    """
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import {}'.format(module)],
+        cwd=ROOT, capture_output=True, text=True, check=True)
+
+    # Lines look like "import time:  self [us] | cumulative | imported package"
+    count = 0
+    cumulative = None
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, total, name = line[len('import time:'):].split('|')
+        count += 1
+        if name.strip() == module:
+            cumulative = int(total) * 1000
+    if cumulative is None:
+        raise RuntimeError('No import time reported for {}'.format(module))
+    return cumulative, count
+
+
+def run(modules=None, repeat=5):
+    """ Measure the import time of each module and get the results by name
+
+        Args:
+            modules(list): dotted names of the imported modules
+            repeat(int): number of fresh interpreters per module
+    """
+    results = {}
+    for module in modules or MODULES:
+        timings = []
+        for _ in range(repeat):
+            cumulative, count = import_time(module)
+            timings.append(cumulative)
+        name = 'import[{}]'.format(module)
+        results[name] = {
+            'calls': repeat,
+            'modules': count,
+            'min_ns': min(timings),
+            'median_ns': statistics.median(timings),
+        }
+        print('{:<32}{:>10.1f} ms{:>8} modules'.format(
+            name, results[name]['min_ns'] / 1e6, count), flush=True)
+    return results
+
+
+def main(argv=None):
+    """ Run the startup benchmark, write the JSON results and compare them with the baseline
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('modules', nargs='*', help='modules to import (default: {})'.format(
+        ', '.join(MODULES)))
+    parser.add_argument('-o', '--output', help='JSON file receiving the results')
+    parser.add_argument('--compare', help='JSON results of a previous run')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed relative slowdown before failing (default: 0.2)')
+    parser.add_argument('--repeat', type=int, default=5, help='interpreters per module')
+    args = parser.parse_args(argv)
+
+    results = run(args.modules, args.repeat)
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)['results']
+        regressions = compare_results(results, baseline, args.threshold)
+        for name, baseline_ns, current_ns, change in regressions:
+            print('REGRESSION {}: {:.1f} ms -> {:.1f} ms (+{:.0%})'.format(
+                name, baseline_ns / 1e6, current_ns / 1e6, change))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,42 @@
+""" Benchmark comparing the throughput of the arithmetic operations in the float,
+    decimal and fraction numeric modes of the calculator.
+
+    Usage:
+        python benchmark/numeric_mode_benchmark.py [--number 50000]
+"""
+
+# Importing modules
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app.calculator import Calculator, NUMERIC_MODES  # pylint: disable=wrong-import-position
+
+OPERANDS = ('1234.5678', '0.0975')
+
+
+def main():
+    """ Run the benchmark and print the operations per second of each numeric mode
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=50000, help='calls per operator')
+    args = parser.parse_args()
+
+    print('{:<10}{:>8}{:>16}{:>12}'.format('mode', 'op', 'ops/sec', 'vs float'))
+    for operator in Calculator.get_operators():
+        float_rate = None
+        for numeric_mode in NUMERIC_MODES:
+            cal = Calculator(numeric_mode=numeric_mode)
+            elapsed = min(timeit.repeat(
+                lambda: cal.perform_operation(operator, *OPERANDS),  # pylint: disable=cell-var-from-loop
+                number=args.number, repeat=3))
+            rate = args.number / elapsed
+            float_rate = float_rate or rate
+            print('{:<10}{:>8}{:>16,.0f}{:>11.2f}x'.format(
+                numeric_mode, operator, rate, rate / float_rate))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+""" Scaling benchmark of the parallel executor across 1/2/4/8 worker processes,
+    compared with the sequential path over the same scientific operations.
+
+    Usage:
+        python benchmark/parallel_benchmark.py [--rows 200000] [--chunk-size 10000]
+"""
+
+# Importing modules
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+# pylint: disable=wrong-import-position
+from app.batch import process_row
+from app.calculator import ScientificCalculator
+from app.parallel import ParallelExecutor
+
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def generate_rows(count, seed=0):
+    """ Generate rows of two-input scientific operations
+    """
+    generator = random.Random(seed)
+    functions = ('sin', 'cos', 'tan', 'log')
+    operators = ('+', '-', '*', '/')
+    return [(generator.choice(functions),
+             str(generator.uniform(1, 100)),
+             str(generator.uniform(1, 100)),
+             generator.choice(operators)) for _ in range(count)]
+
+
+def main():
+    """ Run the benchmark and print the rows per second and speedup of each worker count
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=200000, help='number of rows')
+    parser.add_argument('--chunk-size', type=int, default=10000, help='rows per shard')
+    args = parser.parse_args()
+
+    rows = generate_rows(args.rows)
+
+    calculator = ScientificCalculator()
+    start_time = time.perf_counter()
+    expected = [process_row(calculator, row) for row in rows]
+    sequential = time.perf_counter() - start_time
+    print('{:<12}{:>14}{:>10}'.format('workers', 'rows/sec', 'speedup'))
+    print('{:<12}{:>14,.0f}{:>9.2f}x'.format('sequential', args.rows / sequential, 1))
+
+    for workers in WORKER_COUNTS:
+        with ParallelExecutor(workers=workers, chunk_size=args.chunk_size) as executor:
+            # Start the worker processes before measuring
+            executor.map_rows(rows[:workers])
+            start_time = time.perf_counter()
+            results = executor.map_rows(rows)
+            elapsed = time.perf_counter() - start_time
+        if results != expected:
+            raise AssertionError('Parallel results differ from the sequential path')
+        print('{:<12}{:>14,.0f}{:>9.2f}x'.format(workers, args.rows / elapsed,
+                                                 sequential / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+""" Micro-benchmark comparing the per-call cost of the strict operand parser with
+    the former regex validation and convert_number decorator path.
+
+    Usage:
+        python benchmark/parser_benchmark.py [--number 200000]
+"""
+
+# Importing modules
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app.calculator import parse_operand  # pylint: disable=wrong-import-position
+
+OPERANDS = ['3', '1250', '3.14159', '-2.5e-3']
+
+
+def legacy_parse(text):
+    """ Former path: uncompiled regex validation followed by the isdigit based conversion
+    """
+    if text and not re.search(r'[^ a-zA-z\s\t.(){}]+', text):
+        raise ValueError(text)
+    return int(text) if text.isdigit() else float(text)
+
+
+def main():
+    """ Run the benchmark and print the cost per call of both paths
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=200000, help='calls per operand')
+    args = parser.parse_args()
+
+    print('{:<12}{:>14}{:>14}{:>10}'.format('operand', 'legacy ns', 'parser ns', 'speedup'))
+    for operand in OPERANDS:
+        legacy = min(timeit.repeat(lambda: legacy_parse(operand), number=args.number, repeat=3))
+        strict = min(timeit.repeat(lambda: parse_operand(operand), number=args.number, repeat=3))
+        print('{:<12}{:>14.1f}{:>14.1f}{:>9.2f}x'.format(
+            operand,
+            legacy / args.number * 1e9,
+            strict / args.number * 1e9,
+            legacy / strict,
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+""" Reproducible benchmark suite of the calculator core and the UI slots. The results
+    are written to JSON and can be compared with a previous run, failing when a case
+    is slower than the baseline beyond the given threshold.
+
+    Usage:
+        python benchmark/run_benchmarks.py -o results.json
+        python benchmark/run_benchmarks.py --compare baseline.json --threshold 0.2
+"""
+
+# Importing modules
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+# pylint: disable=wrong-import-position
+from app import logging_config
+from app.calculator import Calculator, ScientificCalculator, convert_number, parse_operand
+
+# Qt application of the UI cases, which has to outlive their windows
+_qt = {}
+
+
+def core_cases():
+    """ Get the benchmark cases of the calculator core, as (name, callable) pairs
+    """
+    calculator = ScientificCalculator()
+    converted_add = convert_number(lambda first, second: first + second)
+    cases = []
+    for operator in calculator.get_operators():
+        cases.append(('perform_operation[{}]'.format(operator),
+                      lambda operator=operator: calculator.perform_operation(operator, '3.5', '2')))
+    for operator in calculator.get_scientific_operators():
+        cases.append(('perform_scientific_operation[{}]'.format(operator),
+                      lambda operator=operator: calculator.perform_scientific_operation(
+                          operator, '3.5')))
+    cases.extend([
+        ('perform_scientific_operation[sin,+]',
+         lambda: calculator.perform_scientific_operation('sin', '3.5', '2', '+')),
+        ('calculate[+]', lambda: calculator.calculate('+', '3.5', '2')),
+        ('calculate_scientific[sin]', lambda: calculator.calculate_scientific('sin', '3.5')),
+        ('invalid_input[perform_operation]',
+         lambda: calculator.perform_operation('+', 'a', '2')),
+        ('invalid_input[perform_scientific_operation]',
+         lambda: calculator.perform_scientific_operation('sin', '3)')),
+        ('convert_number', lambda: converted_add('3.5', '2')),
+        ('parse_operand', lambda: parse_operand('3.5')),
+    ])
+    return cases
+
+
+def logging_cases(directory):
+    """ Get the benchmark cases measuring the operations with the logging configured
+
+        Args:
+            directory(str): directory of the temporary log files
+    """
+    calculator = Calculator()
+    log_file = os.path.join(directory, 'logFile.log')
+
+    def logged(queued, summary_only=False):
+        def setup():
+            logging_config.configure_logging(log_file, queued=queued, summary_only=summary_only)
+        return setup
+
+    def operation():
+        calculator.perform_operation('+', '3.5', '2')
+
+    return [
+        ('logging[direct]', operation, logged(queued=False)),
+        ('logging[queued]', operation, logged(queued=True)),
+        ('logging[queued,summary_only]', operation, logged(queued=True, summary_only=True)),
+    ]
+
+
+def ui_cases():
+    """ Get the benchmark cases driving the UI slots offscreen, or no case
+        when PyQt5 is not installed
+    """
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    try:
+        from PyQt5 import QtWidgets  # pylint: disable=import-outside-toplevel
+        from app.calculator_window import CalulatorUi  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return []
+
+    _qt['application'] = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    window = CalulatorUi()
+    window.first_input_text.setText('3.5')
+
+    # The operations run on the worker thread, each case waits for its result
+    def scientific():
+        window.second_input_text.setText('')
+        window.sin_btn.click()
+        window.wait_for_result()
+
+    def arithmetic():
+        window.second_input_text.setText('2')
+        window.add_btn.click()
+        window.wait_for_result()
+
+    return [
+        ('ui.display_operation', arithmetic),
+        ('ui.display_scientific_operation', scientific),
+    ]
+
+
+def measure(function, repeat, min_time):
+    """ Measure the cost per call of the function in nanoseconds
+
+        Args:
+            function(callable): function called without arguments
+            repeat(int): number of timed rounds
+            min_time(float): minimum duration of a round in seconds
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    timings = [elapsed / number * 1e9 for elapsed in timer.repeat(repeat, number)]
+    return {
+        'calls': number,
+        'min_ns': min(timings),
+        'median_ns': statistics.median(timings),
+    }
+
+
+def run(selected=None, repeat=5, min_time=0.2):
+    """ Run the benchmark cases and get their results by name
+
+        Args:
+            selected(str): run only the cases containing this text
+            repeat(int): number of timed rounds of each case
+            min_time(float): minimum duration of a round in seconds
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        cases = [case + (None,) for case in core_cases() + ui_cases()]
+        cases += logging_cases(directory)
+        for name, function, setup in cases:
+            if selected and selected not in name:
+                continue
+            if setup is not None:
+                setup()
+            try:
+                results[name] = measure(function, repeat, min_time)
+            finally:
+                logging_config.shutdown_logging()
+            print('{:<48}{:>12.1f} ns'.format(name, results[name]['min_ns']), flush=True)
+    return results
+
+
+def compare_results(results, baseline, threshold):
+    """ Get the cases which are slower than the baseline beyond the threshold
+
+        Args:
+            results(dict): current results by case name
+            baseline(dict): baseline results by case name
+            threshold(float): allowed relative slowdown, e.g. 0.2 for 20%
+
+        Returns:
+            list: (name, baseline ns, current ns, relative change) of the regressions
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        change = result['min_ns'] / baseline[name]['min_ns'] - 1
+        if change > threshold:
+            regressions.append((name, baseline[name]['min_ns'], result['min_ns'], change))
+    return regressions
+
+
+def main(argv=None):
+    """ Run the suite, write the JSON results and compare them with the baseline
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-o', '--output', help='JSON file receiving the results')
+    parser.add_argument('--compare', help='JSON results of a previous run')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed relative slowdown before failing (default: 0.2)')
+    parser.add_argument('-k', '--select', help='run only the cases containing this text')
+    parser.add_argument('--repeat', type=int, default=5, help='timed rounds of each case')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='minimum duration of a round in seconds')
+    args = parser.parse_args(argv)
+
+    results = run(args.select, args.repeat, args.min_time)
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(report, output_file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)['results']
+        regressions = compare_results(results, baseline, args.threshold)
+        for name, baseline_ns, current_ns, change in regressions:
+            print('REGRESSION {}: {:.1f} ns -> {:.1f} ns (+{:.0%})'.format(
+                name, baseline_ns, current_ns, change))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
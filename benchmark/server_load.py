@@ -0,0 +1,92 @@
+""" Load generator for the asyncio calculation service, reporting the p50/p99 latency
+    and the requests per second. A local server is started in-process unless the
+    address of a running instance is given.
+
+    Usage:
+        python benchmark/server_load.py [--clients 16] [--requests 2000] [--port 8765]
+"""
+
+# Importing modules
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+# pylint: disable=wrong-import-position
+from app.server import CalculationClient, CalculationServer
+
+OPERATIONS = (
+    ('+', None), ('-', None), ('*', None), ('/', None),
+    ('sin', '+'), ('cos', '-'), ('tan', '*'), ('log', '/'),
+)
+
+
+def percentile(values, fraction):
+    """ Get the value below which the given fraction of the sorted values falls
+    """
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+async def run_client(client, requests, latencies, seed):
+    """ Send the requests of a client, keeping a window of pipelined requests in flight
+    """
+    generator = random.Random(seed)
+
+    async def send_one():
+        operator, arith_operator = generator.choice(OPERATIONS)
+        start_time = time.perf_counter()
+        await client.calculate(operator, generator.uniform(1, 100),
+                               generator.uniform(1, 100), arith_operator)
+        latencies.append(time.perf_counter() - start_time)
+
+    for start in range(0, requests, 8):
+        await asyncio.gather(*(send_one() for _ in range(min(8, requests - start))))
+
+
+async def run_load(args):
+    """ Start the clients against the server and print the latency and throughput
+    """
+    server = None
+    host, port, path = args.host, args.port, args.unix_socket
+    if not args.port and not args.unix_socket:
+        server = CalculationServer(max_batch_size=args.max_batch_size)
+        host, port = await server.start('127.0.0.1', 0)
+
+    clients = [await CalculationClient().connect(host, port, path) for _ in range(args.clients)]
+    latencies = []
+    start_time = time.perf_counter()
+    await asyncio.gather(*(run_client(client, args.requests, latencies, seed)
+                           for seed, client in enumerate(clients)))
+    elapsed = time.perf_counter() - start_time
+
+    for client in clients:
+        await client.close()
+    if server is not None:
+        await server.close()
+
+    latencies.sort()
+    print('requests:     {:,}'.format(len(latencies)))
+    print('requests/sec: {:,.0f}'.format(len(latencies) / elapsed))
+    print('p50 latency:  {:.3f} ms'.format(percentile(latencies, 0.50) * 1000))
+    print('p99 latency:  {:.3f} ms'.format(percentile(latencies, 0.99) * 1000))
+
+
+def main():
+    """ Parse the arguments and run the load generator
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--clients', type=int, default=16, help='concurrent connections')
+    parser.add_argument('--requests', type=int, default=2000, help='requests per client')
+    parser.add_argument('--host', default='127.0.0.1', help='host of a running server')
+    parser.add_argument('--port', type=int, help='port of a running server')
+    parser.add_argument('--unix-socket', help='Unix socket path of a running server')
+    parser.add_argument('--max-batch-size', type=int, default=1024,
+                        help='batch size of the in-process server')
+    asyncio.run(run_load(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
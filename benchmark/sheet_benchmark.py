@@ -0,0 +1,83 @@
+""" Benchmark of the reactive sheet, comparing the cost of an update which affects a fixed
+    number of cells with the recomputation of every cell through the calculator, for
+    sheets of increasing size.
+
+    Usage:
+        python benchmark/sheet_benchmark.py [--sizes 1000 10000 100000] [--depth 10]
+"""
+
+# Importing modules
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+# pylint: disable=wrong-import-position
+from app.calculator import ScientificCalculator
+from app.sheet import Sheet
+
+
+def build_sheet(size, depth):
+    """ Build a sheet of independent groups, each one an input cell X feeding a chain of
+        depth cells C1 = sin(X+1), Ck = C(k-1)/log(X+2)
+
+        Args:
+            size(int): total number of cells
+            depth(int): number of formula cells depending on each input
+    """
+    sheet = Sheet()
+    groups = size // (depth + 1)
+    sheet.update({'X{}'.format(group): group for group in range(groups)})
+    for group in range(groups):
+        sheet.set_formula('C{}_1'.format(group), 'sin(X{}+1)'.format(group))
+        for level in range(2, depth + 1):
+            sheet.set_formula('C{}_{}'.format(group, level),
+                              'C{0}_{1}/log(X{0}+2)'.format(group, level - 1))
+    return sheet, groups
+
+
+def recompute_all(calculator, groups, depth):
+    """ Recompute every cell with one calculator operation per cell, as without the sheet
+    """
+    for group in range(groups):
+        value, _ = calculator.perform_scientific_operation('sin', str(group), '1', '+')
+        for _ in range(2, depth + 1):
+            logarithm, _ = calculator.perform_scientific_operation('log', str(group), '2', '+')
+            value, _ = calculator.perform_operation('/', str(value), str(logarithm))
+
+
+def main():
+    """ Run the benchmark and print the cost of an update for each sheet size
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='number of cells of the sheets')
+    parser.add_argument('--depth', type=int, default=10, help='cells depending on an input')
+    parser.add_argument('--number', type=int, default=200, help='updates timed')
+    args = parser.parse_args()
+
+    calculator = ScientificCalculator()
+    print('{:>10}{:>12}{:>16}{:>14}{:>18}'.format('cells', 'build s', 'update us',
+                                                  'evaluations', 'recompute all ms'))
+    for size in args.sizes:
+        start = time.perf_counter()
+        sheet, groups = build_sheet(size, args.depth)
+        build = time.perf_counter() - start
+
+        sheet.evaluations = 0
+        start = time.perf_counter()
+        for index in range(args.number):
+            sheet.set_value('X{}'.format(index % groups), index + 0.5)
+        update = (time.perf_counter() - start) / args.number
+        evaluations = sheet.evaluations / args.number
+
+        start = time.perf_counter()
+        recompute_all(calculator, groups, args.depth)
+        recompute = time.perf_counter() - start
+        print('{:>10,}{:>12.2f}{:>16.1f}{:>14.1f}{:>18.1f}'.format(
+            groups * (args.depth + 1), build, update * 1e6, evaluations, recompute * 1e3))
+
+
+if __name__ == '__main__':
+    main()
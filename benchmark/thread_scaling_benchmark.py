@@ -0,0 +1,88 @@
+""" Benchmark of one calculator shared by several threads, reporting the throughput of
+    the operations and its scaling with the number of threads. The operations only scale
+    on the free-threaded CPython builds, with the GIL they measure the contention cost.
+
+    Usage:
+        python benchmark/thread_scaling_benchmark.py [--operations 200000] [--threads 1 2 4 8]
+                                                     [--log-level WARNING]
+"""
+
+# Importing modules
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+# pylint: disable=wrong-import-position
+from app.calculator import ScientificCalculator
+from app.metrics import OperationMetrics
+
+
+def run(function, threads, operations):
+    """ Split the operations between the threads, started together, and get the
+        elapsed seconds
+    """
+    barrier = threading.Barrier(threads + 1)
+    share = operations // threads
+
+    def work():
+        barrier.wait()
+        for index in range(share):
+            function(index)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def main():
+    """ Run the benchmark and print the throughput of each case per number of threads
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--operations', type=int, default=200000,
+                        help='operations performed by all the threads together')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--log-level', default='INFO',
+                        help='level of the calculator logger, WARNING skips the records')
+    args = parser.parse_args()
+    logging.getLogger('calculatorLogs').setLevel(args.log_level)
+
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print('Python {} ({}), {} CPUs'.format(
+        sys.version.split()[0], 'GIL enabled' if gil_enabled else 'free-threaded',
+        os.cpu_count()))
+
+    calculator = ScientificCalculator()
+    instrumented = ScientificCalculator(metrics=OperationMetrics())
+    cached = ScientificCalculator(cache_size=1024)
+    cases = [
+        ('perform_operation', lambda index: calculator.perform_operation(
+            '+', '3', '2')),
+        ('perform_scientific_operation', lambda index: calculator.perform_scientific_operation(
+            'sin', '3', '2', '+')),
+        ('perform_operation (metrics)', lambda index: instrumented.perform_operation(
+            '*', '3', '2')),
+        ('perform_operation (cache)', lambda index: cached.perform_operation(
+            '-', str(index % 512), '2')),
+    ]
+
+    print('{:<34}{:>8}{:>14}{:>9}'.format('case', 'threads', 'ops/s', 'scaling'))
+    for name, function in cases:
+        single = None
+        for threads in args.threads:
+            elapsed = run(function, threads, args.operations)
+            rate = args.operations // threads * threads / elapsed
+            single = single or rate
+            print('{:<34}{:>8}{:>14,.0f}{:>8.2f}x'.format(name, threads, rate, rate / single))
+
+
+if __name__ == '__main__':
+    main()
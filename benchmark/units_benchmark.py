@@ -0,0 +1,107 @@
+""" Benchmark of the unit-aware expressions against the plain float expressions, and of
+    the complex mode against the float mode of the calculator. The units are checked
+    when the expressions are compiled, so only their scale factors cost at evaluation.
+
+    Usage:
+        python benchmark/units_benchmark.py [--calls 200000] [--size 1000000]
+"""
+
+# Importing modules
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+# pylint: disable=wrong-import-position
+from app.calculator import ScientificCalculator
+from app.expression import compile_expression
+from app.units import compile_unit_expression
+
+FORMULA = "v * t + a * t**2 / 2"
+SI_UNITS = {'v': 'm/s', 'a': 'm/s^2', 't': 's'}
+OTHER_UNITS = {'v': 'km/h', 'a': 'm/s^2', 't': 'min'}
+
+
+def timed(function):
+    """ Call the function and get its result along with the elapsed seconds
+    """
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def report(cases, count, unit):
+    """ Time each case and print its throughput relative to the first one
+    """
+    print('{:<38}{:>14}{:>10}'.format('', unit, 'relative'))
+    baseline = None
+    for name, function in cases:
+        _, elapsed = timed(function)
+        baseline = baseline or elapsed
+        print('{:<38}{:>14,.0f}{:>9.2f}x'.format(name, count / elapsed, baseline / elapsed))
+
+
+def main():
+    """ Run the benchmark and print the throughput of each path
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=200000, help='scalar evaluations')
+    parser.add_argument('--size', type=int, default=1000000, help='array length')
+    args = parser.parse_args()
+    logging.getLogger('calculatorLogs').setLevel(logging.WARNING)
+
+    plain = compile_expression(FORMULA)
+    si_units = compile_unit_expression(FORMULA, SI_UNITS)
+    other_units = compile_unit_expression(FORMULA, OTHER_UNITS, to='km')
+    print(FORMULA)
+    print('{} -> {}'.format(OTHER_UNITS, other_units.unit))
+    print(other_units.function.code)
+
+    generator = np.random.default_rng(0)
+    values = generator.uniform(1, 10, (3, args.calls)).tolist()
+    arguments = list(zip(*values))
+
+    def scalars(expression):
+        function = expression.function
+        return lambda: [function(*row) for row in arguments]
+
+    report([('plain floats', scalars(plain)),
+            ('units in SI', scalars(si_units)),
+            ('units converted (km/h, min -> km)', scalars(other_units)),
+            ('plain floats, keywords', lambda: [plain(a=a, t=t, v=v) for a, t, v in arguments]),
+            ('units converted, keywords',
+             lambda: [other_units(a=a, t=t, v=v) for a, t, v in arguments])],
+           args.calls, 'formulas/s')
+
+    a, t, v = generator.uniform(1, 10, (3, args.size))
+    print()
+    report([('plain float arrays', lambda: plain(a=a, t=t, v=v)),
+            ('units converted arrays', lambda: other_units(a=a, t=t, v=v))],
+           args.size, 'values/s')
+
+    # Complex mode against the float mode, on scalars and arrays
+    real = ScientificCalculator()
+    complex_mode = ScientificCalculator(numeric_mode='complex')
+    operands = [repr(value) for value in values[0][:args.calls // 10]]
+    first = generator.uniform(-10, 10, args.size)
+    second = first + 1j * generator.uniform(-10, 10, args.size)
+    print()
+    report([('perform_scientific_operation float',
+             lambda: [real.perform_scientific_operation('sqrt', text) for text in operands]),
+            ('perform_scientific_operation complex',
+             lambda: [complex_mode.perform_scientific_operation('sqrt', text)
+                      for text in operands])],
+           len(operands), 'operations/s')
+    print()
+    report([('sqrt batch float', lambda: real.calculate_scientific_batch('sqrt', first)),
+            ('sqrt batch complex',
+             lambda: complex_mode.calculate_scientific_batch('sqrt', second))],
+           args.size, 'values/s')
+
+
+if __name__ == '__main__':
+    main()
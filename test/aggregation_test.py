@@ -0,0 +1,129 @@
+""" Test cases for the streaming aggregation of operands
+"""
+
+# Importing modules
+import math
+import os
+import statistics
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app import calculator
+from app.aggregation import (NeumaierSum, QuantileSketch, RunningMoments, StreamingStatistics,
+                             aggregate)
+
+
+class TestAggregation(unittest.TestCase):
+    """ Test cases for the single-pass statistics
+    """
+    def test_compensated_sum(self):
+        """ Test the compensated sum keeps the small values lost by the plain sum
+        """
+        values = [1e16, 1.0, -1e16] * 1000 + [0.1] * 10
+        plain = 0.0
+        compensated = NeumaierSum()
+        for value in values:
+            plain += value
+            compensated.add(value)
+        self.assertEqual(compensated.value, math.fsum(values))
+        self.assertNotEqual(plain, math.fsum(values))
+
+        chunked = NeumaierSum()
+        for start in range(0, len(values), 7):
+            chunked.add_array(np.array(values[start:start + 7]))
+        self.assertAlmostEqual(chunked.value, math.fsum(values), places=9)
+
+    def test_moments(self):
+        """ Test the variance is accurate for values with a large offset, where the
+            sum of squares formula cancels
+        """
+        values = [1e9 + offset for offset in (4.0, 7.0, 13.0, 16.0)] * 100
+        moments = RunningMoments()
+        for value in values:
+            moments.add(value)
+        self.assertAlmostEqual(moments.squares / moments.count, 22.5, places=6)
+        chunked = RunningMoments()
+        chunked.add_array(np.array(values[:150]))
+        chunked.add_array(np.array(values[150:]))
+        self.assertAlmostEqual(chunked.mean, 1e9 + 10)
+        self.assertAlmostEqual(chunked.squares / chunked.count, 22.5, places=6)
+
+    def test_statistics(self):
+        """ Test the statistics of a stream of numbers and strings, the invalid operands
+            being counted and skipped
+        """
+        values = ['3', 5, '0x10', 'abc', -2.5, float('nan'), '1e1']
+        stats = aggregate(iter(values), chunk_size=3)
+        numbers = [3, 5, 16, -2.5, 10]
+        self.assertEqual(stats.count, 5)
+        self.assertEqual(stats.invalid, 2)
+        self.assertEqual(stats.sum, math.fsum(numbers))
+        self.assertAlmostEqual(stats.mean, statistics.mean(numbers))
+        self.assertAlmostEqual(stats.variance(), statistics.pvariance(numbers))
+        self.assertAlmostEqual(stats.std(ddof=1), statistics.stdev(numbers))
+        self.assertEqual((stats.minimum, stats.maximum), (-2.5, 16))
+
+        scalar = StreamingStatistics()
+        for value in values:
+            scalar.update(value)
+        for key, value in stats.summary().items():
+            with self.subTest(key=key):
+                self.assertAlmostEqual(scalar.summary()[key], value)
+
+    def test_empty(self):
+        """ Test the statistics without any valid operand
+        """
+        summary = aggregate(['a', '']).summary()
+        self.assertEqual(summary['count'], 0)
+        self.assertEqual(summary['invalid'], 2)
+        self.assertIsNone(summary['mean'])
+        self.assertIsNone(summary['p50'])
+
+    def test_quantiles(self):
+        """ Test the quantiles are within the relative accuracy of the exact ones
+        """
+        values = np.random.default_rng(0).lognormal(0, 3, 100000)
+        values[::3] *= -1
+        stats = aggregate(values, relative_accuracy=0.01, chunk_size=10000)
+        for fraction in (0, 0.01, 0.25, 0.5, 0.9, 0.99, 1):
+            with self.subTest(fraction=fraction):
+                expected = np.quantile(values, fraction, method='lower')
+                self.assertLessEqual(abs(stats.quantile(fraction) - expected),
+                                     0.01 * abs(expected))
+        self.assertEqual(stats.percentile(50), stats.quantile(0.5))
+        with self.assertRaises(ValueError):
+            stats.quantile(1.5)
+
+    def test_bounded_buckets(self):
+        """ Test the sketch keeps a bounded number of buckets, merging the smallest ones
+        """
+        sketch = QuantileSketch(0.01, max_buckets=100)
+        sketch.add_array(10.0 ** np.linspace(-100, 100, 10000))
+        sketch.add(1e-200)
+        self.assertLessEqual(len(sketch._positive), 100)  # pylint: disable=protected-access
+        self.assertEqual(sketch.count, 10001)
+        self.assertAlmostEqual(sketch.quantile(1) / 1e100, 1, delta=0.01)
+
+    def test_merge(self):
+        """ Test merging the statistics of shards gives the statistics of the whole
+        """
+        values = np.random.default_rng(1).normal(50, 10, 30000)
+        whole = aggregate(values)
+        merged = aggregate(values[:10000]).merge(aggregate(values[10000:]))
+        self.assertEqual(merged.count, whole.count)
+        self.assertAlmostEqual(merged.sum, whole.sum, places=6)
+        self.assertAlmostEqual(merged.variance(), whole.variance())
+        self.assertEqual(merged.quantile(0.5), whole.quantile(0.5))
+
+    def test_calculator_aggregate(self):
+        """ Test the calculator entry point of the aggregation
+        """
+        summary = calculator.Calculator.aggregate(['1', '2', '3', '4']).summary()
+        self.assertEqual((summary['sum'], summary['mean'], summary['max']), (10, 2.5, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+""" Test cases for the headless batch processing of calculator operations
+"""
+
+# Importing modules
+import io
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.append(ROOT_DIRECTORY)
+from app import batch
+from app import calculator
+
+
+class TestBatch(unittest.TestCase):
+    """ Test cases for streaming rows through the calculator
+    """
+    def setUp(self):
+        """ Setup function for initializing the instance for scientific calculator
+        """
+        super().__init__()
+        self.cal = calculator.ScientificCalculator()
+
+    def test_process_row(self):
+        """ Test the rows are dispatched to the arithmetic and scientific operations
+        """
+        self.assertEqual(batch.process_row(self.cal, ('+', '3', '2')),
+                         self.cal.perform_operation('+', '3', '2'))
+        self.assertEqual(batch.process_row(self.cal, ('sin', '3', '2', '+')),
+                         self.cal.perform_scientific_operation('sin', '3', '2', '+'))
+        self.assertEqual(batch.process_row(self.cal, ('sin', '3', '')),
+                         self.cal.perform_scientific_operation('sin', '3', ''))
+
+    def test_invalid_rows(self):
+        """ Test the invalid rows are reported with the invalid input message
+        """
+        for row in (('+', '3'), ('//', '3', '2'), ('sin', '3', '2'), ('+', 'a', '2'),
+                    ('+', '3', '2', '-')):
+            self.assertEqual(batch.process_row(self.cal, row),
+                             ('', "Please provide valid input."))
+
+    def test_run_batch_csv(self):
+        """ Test the CSV rows are processed in chunks and written with their results
+        """
+        input_stream = io.StringIO('operator,first,second\n+,3,2\n/,7,0\nlog,3,\n+,a\n')
+        output_stream = io.StringIO()
+        processed_rows = batch.run_batch(input_stream, output_stream, chunk_size=2)
+        lines = output_stream.getvalue().splitlines()
+        self.assertEqual(processed_rows, 4)
+        self.assertEqual(lines[0], 'operator,first,second,arith_operator,output,message')
+        self.assertEqual(lines[1], '+,3,2,,5,Operation Performed: 3+2=5')
+        self.assertEqual(lines[2], "/,7,0,,,Number 2 can't be zero. Please provide correct input.")
+        self.assertTrue(lines[3].startswith('log,3,,,1.0986122886681098,'))
+        self.assertEqual(lines[4], '+,a,,,,Please provide valid input.')
+
+    def test_run_batch_jsonl(self):
+        """ Test the JSON lines rows are processed and written as JSON lines
+        """
+        input_stream = io.StringIO('{"operator": "sin", "first": 3, "second": 2, '
+                                   '"arith_operator": "+"}\nnot json\n')
+        output_stream = io.StringIO()
+        batch.run_batch(input_stream, output_stream, input_format='jsonl')
+        records = [json.loads(line) for line in output_stream.getvalue().splitlines()]
+        self.assertEqual(records[0]['output'], -0.9589242746631385)
+        self.assertEqual(records[1]['message'], "Please provide valid input.")
+
+    def test_run_batch_jsonl_infinite_output(self):
+        """ Test the infinite outputs are written as null to keep the lines valid JSON
+        """
+        input_stream = io.StringIO('{"operator": "*", "first": "1e308", "second": "10"}\n')
+        output_stream = io.StringIO()
+        batch.run_batch(input_stream, output_stream, input_format='jsonl')
+        record = json.loads(output_stream.getvalue(), parse_constant=self.fail)
+        self.assertIsNone(record['output'])
+
+    def test_command_line(self):
+        """ Test the batch command reads stdin and reports the rows per second
+        """
+        completed = subprocess.run(
+            [sys.executable, '-m', 'app.calculator', 'batch'],
+            input='*,3,2\n', capture_output=True, text=True, cwd=ROOT_DIRECTORY, check=True)
+        self.assertIn('*,3,2,,6,Operation Performed: 3*2=6', completed.stdout)
+        self.assertIn('rows/sec', completed.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+""" Test cases for the benchmark suite runner
+"""
+
+# Importing modules
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from benchmark import import_benchmark, run_benchmarks
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """ Test cases for running the suite and comparing with a baseline
+    """
+    def test_compare_results(self):
+        """ Test only the cases slower than the threshold are reported as regressions
+        """
+        baseline = {'a': {'min_ns': 100.0}, 'b': {'min_ns': 100.0}}
+        results = {'a': {'min_ns': 115.0}, 'b': {'min_ns': 130.0}, 'c': {'min_ns': 1.0}}
+        regressions = run_benchmarks.compare_results(results, baseline, 0.2)
+        self.assertEqual([name for name, *_ in regressions], ['b'])
+
+    def test_json_output_and_regression(self):
+        """ Test the results are written to JSON and a regression fails the run
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'results.json')
+            arguments = ['-k', 'parse_operand', '--repeat', '1', '--min-time', '0.01']
+            self.assertEqual(run_benchmarks.main(arguments + ['-o', output]), 0)
+            with open(output, encoding='utf-8') as output_file:
+                report = json.load(output_file)
+            self.assertEqual(list(report['results']), ['parse_operand'])
+
+            # A baseline ten times faster than the current run is a regression
+            report['results']['parse_operand']['min_ns'] /= 10
+            baseline = os.path.join(directory, 'baseline.json')
+            with open(baseline, 'w', encoding='utf-8') as baseline_file:
+                json.dump(report, baseline_file)
+            self.assertEqual(run_benchmarks.main(arguments + ['--compare', baseline]), 1)
+
+    def test_import_time(self):
+        """ Test the import time of a module is measured in a fresh interpreter
+        """
+        results = import_benchmark.run(['app.cache'], repeat=1)
+        result = results['import[app.cache]']
+        self.assertGreater(result['min_ns'], 0)
+        self.assertGreaterEqual(result['modules'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+""" Test cases for the bulk processing of memory-mapped operand columns
+"""
+
+# Importing modules
+import os
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+import unittest
+
+import numpy as np
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+sys.path.append(ROOT_DIRECTORY)
+from app import bulk
+from app import calculator
+
+
+class TestBulk(unittest.TestCase):
+    """ Test cases for evaluating the operations over memory-mapped files
+    """
+    def setUp(self):
+        """ Setup function creating a directory for the operand and result files
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.cal = calculator.ScientificCalculator()
+
+    def path(self, name):
+        """ Get the path of a file of the test directory
+        """
+        return os.path.join(self.directory.name, name)
+
+    def test_arithmetic_operation(self):
+        """ Test the outputs and error codes match the batch operation, over several chunks
+        """
+        first = np.array([3.0, 7.0, np.nan, -8.0, 1.5] * 10)
+        second = np.array([2.0, 0.0, 1.0, 0.5, 2.0] * 10)
+        np.save(self.path('first.npy'), first)
+        np.save(self.path('second.npy'), second)
+        result = bulk.run_bulk('^', self.path('first.npy'), self.path('second.npy'),
+                               self.path('output.npy'), errors_path=self.path('errors.npy'),
+                               memory_limit=7 * bulk.ROW_BYTES)
+        self.assertEqual(result, bulk.BulkResult(50, 20))
+
+        expected, messages = self.cal.perform_operation_batch('^', first, second)
+        np.testing.assert_array_equal(np.load(self.path('output.npy')), expected)
+        codes = np.load(self.path('errors.npy'))
+        self.assertEqual(list(codes[:5]), [0, 0, 1, 3, 0])
+        self.assertEqual(list(codes[codes > 0]),
+                         [bulk.ERROR_CODES[message] for message in messages if message])
+
+        bulk.run_bulk('/', self.path('first.npy'), self.path('second.npy'),
+                      self.path('output.npy'), errors_path=self.path('errors.npy'))
+        self.assertEqual(np.load(self.path('errors.npy'))[1], 2)
+
+    def test_raw_files(self):
+        """ Test the raw int64 operands and the scientific functions
+        """
+        np.arange(10, dtype=np.int64).tofile(self.path('first.bin'))
+        np.full(10, 2, dtype=np.int64).tofile(self.path('second.bin'))
+        bulk.run_bulk('sqrt', self.path('first.bin'), self.path('second.bin'),
+                      self.path('output.bin'), arith_operator='*', dtype='int64',
+                      memory_limit=3 * bulk.ROW_BYTES)
+        np.testing.assert_allclose(np.fromfile(self.path('output.bin')),
+                                   np.sqrt(np.arange(10) * 2))
+
+        bulk.run_bulk('log', self.path('first.bin'), output_path=self.path('output.bin'),
+                      dtype='int64')
+        output = np.fromfile(self.path('output.bin'))
+        self.assertTrue(np.isnan(output[0]))
+        np.testing.assert_allclose(output[1:], np.log(np.arange(1, 10)))
+
+    def test_invalid_arguments(self):
+        """ Test the unsupported operators and mismatched columns are rejected
+        """
+        np.save(self.path('first.npy'), np.ones(3))
+        np.save(self.path('second.npy'), np.ones(4))
+        for operator, second in (('gamma', None), ('+', None), ('+', 'second.npy')):
+            with self.subTest(operator=operator, second=second):
+                with self.assertRaises(ValueError):
+                    bulk.run_bulk(operator, self.path('first.npy'),
+                                  second and self.path(second), self.path('output.npy'))
+
+    def test_memory_limit(self):
+        """ Test a file larger than the memory limit is processed without holding it
+            in memory
+        """
+        rows = 2 * 2 ** 20
+        memory_limit = 2 * 2 ** 20
+        first = np.lib.format.open_memmap(self.path('first.npy'), mode='w+', dtype=np.float64,
+                                          shape=(rows,))
+        first[:] = np.arange(rows)
+        first.flush()
+        del first
+        self.assertGreater(os.path.getsize(self.path('first.npy')), 4 * memory_limit)
+
+        tracemalloc.start()
+        try:
+            result = bulk.run_bulk('+', self.path('first.npy'), self.path('first.npy'),
+                                   self.path('output.npy'), memory_limit=memory_limit)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(result.rows, rows)
+        self.assertLess(peak, memory_limit)
+
+        output = np.load(self.path('output.npy'), mmap_mode='r')
+        self.assertEqual(output[-1], 2.0 * (rows - 1))
+        self.assertEqual(output[rows // 2], float(rows))
+
+    def test_command_line(self):
+        """ Test the bulk command writes the outputs and reports the rows per second
+        """
+        np.save(self.path('first.npy'), np.array([0.0, 90.0]))
+        completed = subprocess.run(
+            [sys.executable, '-m', 'app.calculator', 'bulk', 'sin', self.path('first.npy'),
+             '-o', self.path('output.npy'), '--angle-mode', 'deg'],
+            capture_output=True, text=True, cwd=ROOT_DIRECTORY, check=True)
+        np.testing.assert_allclose(np.load(self.path('output.npy')), [0.0, 1.0])
+        self.assertIn('rows/sec', completed.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
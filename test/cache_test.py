@@ -0,0 +1,103 @@
+""" Test cases for the LRU result cache of the calculator
+"""
+
+# Importing modules
+import os
+import sys
+import threading
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app import calculator
+from app.cache import ResultCache
+
+
+class TestResultCache(unittest.TestCase):
+    """ Test cases for the bounded LRU cache
+    """
+    def test_lru_eviction(self):
+        """ Test the least recently used entry is evicted once the cache is full
+        """
+        cache = ResultCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.cache_info(), (3, 1, 1, 2, 2))
+
+    def test_cache_clear(self):
+        """ Test clearing the cache removes the entries and resets the counters
+        """
+        cache = ResultCache(2)
+        cache.put('a', 1)
+        cache.get('a')
+        cache.cache_clear()
+        self.assertEqual(cache.cache_info(), (0, 0, 0, 2, 0))
+
+    def test_invalid_size(self):
+        """ Test the cache size must be a positive number
+        """
+        with self.assertRaises(ValueError):
+            ResultCache(0)
+
+    def test_concurrent_access(self):
+        """ Test the counters stay consistent when the cache is shared across threads
+        """
+        cache = ResultCache(16)
+
+        def worker():
+            for index in range(1000):
+                if cache.get(index % 32) is None:
+                    cache.put(index % 32, index)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = cache.cache_info()
+        self.assertEqual(info.hits + info.misses, 8000)
+        self.assertLessEqual(info.currsize, 16)
+
+
+class TestCalculatorCache(unittest.TestCase):
+    """ Test cases for the calculator operations served from the cache
+    """
+    def setUp(self):
+        """ Setup function for initializing the calculator with the cache enabled
+        """
+        super().__init__()
+        self.cal = calculator.ScientificCalculator(cache_size=4)
+
+    def test_cached_operation(self):
+        """ Test the repeated operation returns the cached output and message
+        """
+        first = self.cal.perform_operation('+', '3', '2')
+        second = self.cal.perform_operation('+', '3', '2')
+        self.assertEqual(first, (5, 'Operation Performed: 3+2=5'))
+        self.assertEqual(second, first)
+        self.assertEqual(self.cal.cache_info().hits, 1)
+
+    def test_cached_scientific_operation(self):
+        """ Test the scientific operation is keyed on the arithmetic operator as well
+        """
+        added, _ = self.cal.perform_scientific_operation('sin', '3', '2', '+')
+        subtracted, _ = self.cal.perform_scientific_operation('sin', '3', '2', '-')
+        self.assertEqual(added, -0.9589242746631385)
+        self.assertNotEqual(added, subtracted)
+        self.cal.cache_clear()
+        self.assertEqual(self.cal.cache_info().currsize, 0)
+
+    def test_cache_disabled(self):
+        """ Test the cache is opt-in
+        """
+        cal = calculator.Calculator()
+        self.assertIsNone(cal.cache)
+        self.assertIsNone(cal.cache_info())
+
+
+if __name__ == '__main__':
+    unittest.main()
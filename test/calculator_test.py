@@ -2,9 +2,17 @@
 """
 
 # Importing modules
+import cmath
+import math
 import os
+import subprocess
 import sys
+import tempfile
 import unittest
+from decimal import Decimal
+from fractions import Fraction
+
+import numpy as np
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
 from app import calculator
@@ -62,6 +70,186 @@ class TestBasicCalculator(unittest.TestCase):
         self.assertEqual(message, "Number 2 can't be zero. Please provide correct input.")
 
 
+    def test_negative_operands(self):
+        """ Test the negative operands are converted as integers
+        """
+        result, message = self.cal.perform_operation('-', '-3', '2')
+        self.assertEqual(result, -5)
+        self.assertEqual(message, 'Operation Performed: -3-2=-5')
+
+    def test_invalid_characters(self):
+        """ Test the inputs with stray characters are rejected instead of raising
+        """
+        for invalid_input in ('3)', '[1]', '2^3', 'inf', '1__0'):
+            _, message = self.cal.perform_operation('+', invalid_input, '2')
+            self.assertEqual(message, "Please provide valid input.")
+
+
+class TestNumericModes(unittest.TestCase):
+    """ Test cases for the decimal and fraction numeric modes of basic calculator
+    """
+    def test_decimal_mode(self):
+        """ Test the decimal mode keeps the exact decimal value
+        """
+        cal = calculator.Calculator(numeric_mode='decimal')
+        result, message = cal.perform_operation('+', '0.1', '0.2')
+        self.assertEqual(result, Decimal('0.3'))
+        self.assertEqual(message, 'Operation Performed: 0.1+0.2=0.3')
+
+    def test_decimal_precision(self):
+        """ Test the decimal values are rounded to the precision of the instance
+        """
+        cal = calculator.Calculator(numeric_mode='decimal', precision=5)
+        result, _ = cal.perform_operation('/', '1', '3')
+        self.assertEqual(result, Decimal('0.33333'))
+
+    def test_fraction_mode(self):
+        """ Test the fraction mode performs exact rational division
+        """
+        cal = calculator.Calculator(numeric_mode='fraction')
+        result, _ = cal.perform_operation('/', '1', '3')
+        self.assertEqual(result, Fraction(1, 3))
+        result, _ = cal.perform_operation('*', '1/3', '0x3')
+        self.assertEqual(result, 1)
+
+    def test_fraction_mode_scientific(self):
+        """ Test the single input of a scientific operation is parsed in the numeric mode,
+            like the combined inputs
+        """
+        cal = calculator.ScientificCalculator(numeric_mode='fraction')
+        self.assertEqual(cal.perform_scientific_operation('sin', '1/3')[0], math.sin(1 / 3))
+        self.assertEqual(cal.perform_scientific_operation('sin', '1/3')[0],
+                         cal.perform_scientific_operation('sin', '1/3', '0', '+')[0])
+        self.assertEqual(cal.perform_scientific_operation('factorial', '5/2')[1],
+                         calculator.MATH_DOMAIN_MESSAGE)
+
+    def test_numeric_mode_per_call(self):
+        """ Test the numeric mode can be selected for a single operation
+        """
+        cal = calculator.Calculator()
+        result, _ = cal.perform_operation('+', '0.1', '0.2', numeric_mode='decimal')
+        self.assertEqual(result, Decimal('0.3'))
+        result, _ = cal.perform_operation('+', '0.1', '0.2')
+        self.assertEqual(result, 0.1 + 0.2)
+
+    def test_division_by_zero(self):
+        """ Test the division by zero message in the decimal and fraction modes
+        """
+        for numeric_mode in ('decimal', 'fraction'):
+            cal = calculator.Calculator(numeric_mode=numeric_mode)
+            _, message = cal.perform_operation('/', '7', '0')
+            self.assertEqual(message, "Number 2 can't be zero. Please provide correct input.")
+
+    def test_invalid_numeric_mode(self):
+        """ Test the unsupported numeric modes are rejected
+        """
+        with self.assertRaises(ValueError):
+            calculator.Calculator(numeric_mode='quaternion')
+
+
+class TestOperandParser(unittest.TestCase):
+    """ Test cases for the strict numeric operand parser
+    """
+    def test_valid_operands(self):
+        """ Test the supported number formats are converted to typed numbers
+        """
+        expected = {
+            '3': 3,
+            ' -3 ': -3,
+            '+4.5': 4.5,
+            '-1.5e-3': -0.0015,
+            '.5': 0.5,
+            '0x1F': 31,
+            '-0xff': -255,
+            '1_000': 1000,
+        }
+        for text, value in expected.items():
+            result = calculator.parse_operand(text)
+            self.assertEqual(result, value)
+            self.assertIs(type(result), type(value))
+
+    def test_invalid_operands(self):
+        """ Test the malformed numbers are rejected
+        """
+        for text in ('', 'a', 'nan', '1e', '0x', '_1', '1_', '3)', '[1]', '1.2.3', '1e400',
+                     '-1e400'):
+            with self.assertRaises(ValueError):
+                calculator.parse_operand(text)
+        with self.assertRaises(ValueError):
+            calculator.parse_operand('1e400j', 'complex')
+        self.assertEqual(calculator.Calculator().perform_operation('-', '1e400', '1e400'),
+                         ('', calculator.INVALID_INPUT_MESSAGE))
+
+    def test_too_long_operands(self):
+        """ Test the digit strings over the digit limit are rejected instead of being
+            converted into an infinite float
+        """
+        for text in ('9' * 5000, '-' + '9' * 5000):
+            with self.assertRaises(ValueError):
+                calculator.parse_operand(text)
+        self.assertEqual(calculator.Calculator().perform_operation('+', '9' * 5000, '1'),
+                         ('', calculator.INVALID_INPUT_MESSAGE))
+
+
+class TestBatchCalculator(unittest.TestCase):
+    """ Test cases for the batch operations of basic calculator
+    """
+    def setUp(self):
+        """ Setup function for initializing the instance for basic calculator
+        """
+        super().__init__()
+        self.cal = calculator.Calculator()
+
+    def test_batch_operations(self):
+        """ Test each operator over arrays of operands
+        """
+        first = np.array([3, 8, -1.5])
+        second = np.array([2, 4, 0.5])
+        expected = {
+            '+': [5, 12, -1],
+            '-': [1, 4, -2],
+            '*': [6, 32, -0.75],
+            '/': [1.5, 2, -3],
+        }
+        for operator, values in expected.items():
+            result, messages = self.cal.perform_operation_batch(operator, first, second)
+            np.testing.assert_array_equal(result, values)
+            self.assertEqual(list(messages), [None, None, None])
+
+    def test_batch_matches_scalar(self):
+        """ Test the batch output matches the scalar operation for string operands
+        """
+        first = ['3', '7.5', '10']
+        second = ['2', '0.5', '4']
+        result, _ = self.cal.perform_operation_batch('/', first, second)
+        for index, (first_num, second_num) in enumerate(zip(first, second)):
+            scalar_result, _ = self.cal.perform_operation('/', first_num, second_num)
+            self.assertEqual(result[index], scalar_result)
+
+    def test_batch_division_by_zero(self):
+        """ Test the rows dividing by zero are masked with the division message
+        """
+        result, messages = self.cal.perform_operation_batch('/', [7, 1], [0, 2])
+        self.assertTrue(np.isnan(result[0]))
+        self.assertEqual(result[1], 0.5)
+        self.assertEqual(messages[0], "Number 2 can't be zero. Please provide correct input.")
+        self.assertIsNone(messages[1])
+
+    def test_batch_invalid_input(self):
+        """ Test the invalid rows are reported without failing the whole batch
+        """
+        result, messages = self.cal.perform_operation_batch('+', ['a', '3', ''], ['1', '2', '3'])
+        self.assertEqual(result[1], 5)
+        self.assertEqual(messages[0], "Please provide valid input.")
+        self.assertEqual(messages[2], "Please provide valid input.")
+
+    def test_batch_broadcast_operand(self):
+        """ Test a single operand is applied to every row of the other column
+        """
+        result, _ = self.cal.perform_operation_batch('*', [1, 2, 3], 2)
+        np.testing.assert_array_equal(result, [2, 4, 6])
+
+
 class TestScientificCalculator(unittest.TestCase):
     """ Test cases for all potential scenarios for scientific calculator
     """
@@ -101,6 +289,13 @@ class TestScientificCalculator(unittest.TestCase):
         result, _ = self.cal.perform_scientific_operation('log', '3')
         self.assertEqual(result, 1.0986122886681098)
 
+    def test_operation_log_domain_error(self):
+        """ Test the logarithm of a negative number, which raises an exception
+        """
+        result, message = self.cal.perform_scientific_operation('log', '3', '5', '-')
+        self.assertEqual(result, '')
+        self.assertEqual(message, calculator.MATH_DOMAIN_MESSAGE)
+
     def test_empty_input(self):
         """ Test the scenario where both the inputs are empty
         """
@@ -114,5 +309,277 @@ class TestScientificCalculator(unittest.TestCase):
         self.assertEqual(message, "Please provide valid input.")
 
 
+class TestBatchScientificCalculator(unittest.TestCase):
+    """ Test cases for the batch operations of scientific calculator
+    """
+    def setUp(self):
+        """ Setup function for initializing the instance for scientific calculator
+        """
+        super().__init__()
+        self.cal = calculator.ScientificCalculator()
+
+    def test_batch_matches_scalar(self):
+        """ Test each scientific function over an array matches the scalar operation
+        """
+        inputs = ['3', '0.5', '2']
+        for operator in ('sin', 'cos', 'tan', 'log'):
+            result, messages = self.cal.perform_scientific_operation_batch(operator, inputs)
+            for index, input_num in enumerate(inputs):
+                scalar_result, _ = self.cal.perform_scientific_operation(operator, input_num)
+                self.assertAlmostEqual(result[index], scalar_result, places=12)
+                self.assertIsNone(messages[index])
+
+    def test_batch_arithmetic_operation_sin(self):
+        """ Test the sine of two columns, on which arithmetic addition is performed
+        """
+        result, _ = self.cal.perform_scientific_operation_batch('sin', [3, 1], [2, 2], '+')
+        self.assertAlmostEqual(result[0], -0.9589242746631385, places=12)
+        self.assertAlmostEqual(result[1], 0.1411200080598672, places=12)
+
+    def test_batch_domain_error(self):
+        """ Test the logarithm of non-positive values is reported per row
+        """
+        result, messages = self.cal.perform_scientific_operation_batch('log', [-1, 0, 1])
+        self.assertTrue(np.isnan(result[:2]).all())
+        self.assertEqual(result[2], 0)
+        self.assertEqual(messages[0], calculator.MATH_DOMAIN_MESSAGE)
+        self.assertEqual(messages[1], calculator.MATH_DOMAIN_MESSAGE)
+        self.assertIsNone(messages[2])
+
+    def test_batch_arithmetic_error(self):
+        """ Test the arithmetic errors are reported instead of the scientific output
+        """
+        _, messages = self.cal.perform_scientific_operation_batch('sin', ['a', 1], [1, 0], '/')
+        self.assertEqual(messages[0], "Please provide valid input.")
+        self.assertEqual(messages[1], "Number 2 can't be zero. Please provide correct input.")
+
+
+class TestExtendedOperations(unittest.TestCase):
+    """ Test cases for the operations added through the operation registry
+    """
+    def setUp(self):
+        self.cal = calculator.ScientificCalculator()
+
+    def test_power(self):
+        """ Test the power is exact for integers and fails without a real result
+        """
+        self.assertEqual(self.cal.perform_operation('^', '2', '10'),
+                         (1024, 'Operation Performed: 2^10=1024'))
+        self.assertEqual(self.cal.perform_operation('^', '-8', '0.5'),
+                         ('', calculator.MATH_DOMAIN_MESSAGE))
+        self.assertEqual(self.cal.perform_operation('^', '0', '-1'),
+                         ('', calculator.ZERO_DIVISION_MESSAGE))
+        self.assertEqual(self.cal.perform_operation('^', '10', '100000'),
+                         ('', calculator.MATH_DOMAIN_MESSAGE))
+
+    def test_large_exact_result(self):
+        """ Test the exact results too large to be displayed are out of the domain
+        """
+        self.assertEqual(self.cal.perform_operation('^', '99999', '1024'),
+                         ('', calculator.MATH_DOMAIN_MESSAGE))
+        self.assertEqual(self.cal.perform_operation('*', '9' * 3000, '9' * 3000),
+                         ('', calculator.MATH_DOMAIN_MESSAGE))
+        self.assertEqual(self.cal.perform_operation('^', '3', '1000')[0], 3 ** 1000)
+
+    def test_modulo(self):
+        """ Test the modulo follows the sign of the divisor and rejects zero
+        """
+        self.assertEqual(self.cal.perform_operation('%', '-7', '3')[0], 2)
+        self.assertEqual(self.cal.perform_operation('%', '7', '0'),
+                         ('', calculator.ZERO_DIVISION_MESSAGE))
+
+    def test_scientific_functions(self):
+        """ Test the extended scientific functions and their domains
+        """
+        cases = {
+            ('asin', '1'): math.pi / 2,
+            ('acos', '1'): 0.0,
+            ('atan', '1'): math.pi / 4,
+            ('sinh', '1'): math.sinh(1),
+            ('cosh', '1'): math.cosh(1),
+            ('tanh', '1'): math.tanh(1),
+            ('log10', '1000'): 3.0,
+            ('log2', '8'): 3.0,
+            ('exp', '1'): math.e,
+            ('sqrt', '16'): 4.0,
+            ('factorial', '5'): 120,
+        }
+        for (operator, operand), expected in cases.items():
+            with self.subTest(operator=operator):
+                self.assertAlmostEqual(
+                    self.cal.perform_scientific_operation(operator, operand)[0], expected)
+        for operator, operand in (('asin', '2'), ('sqrt', '-1'), ('log10', '0'),
+                                  ('exp', '1000'), ('factorial', '2.5'), ('factorial', '171')):
+            with self.subTest(operator=operator, operand=operand):
+                self.assertEqual(self.cal.perform_scientific_operation(operator, operand),
+                                 ('', calculator.MATH_DOMAIN_MESSAGE))
+
+    def test_unknown_operator(self):
+        """ Test the unknown operators are reported as invalid input
+        """
+        self.assertEqual(self.cal.perform_operation('//', '3', '2'),
+                         ('', calculator.INVALID_INPUT_MESSAGE))
+        self.assertEqual(self.cal.perform_scientific_operation('gamma', '3'),
+                         ('', calculator.INVALID_INPUT_MESSAGE))
+
+    def test_batch_matches_scalar(self):
+        """ Test the batch operations give the scalar results and errors
+        """
+        output_data, messages = self.cal.perform_operation_batch(
+            '^', ['2', '-8', '2'], ['3', '0.5', 'a'])
+        np.testing.assert_array_equal(output_data, [8.0, np.nan, np.nan])
+        self.assertEqual(list(messages), [None, calculator.MATH_DOMAIN_MESSAGE,
+                                          calculator.INVALID_INPUT_MESSAGE])
+        output_data, messages = self.cal.perform_scientific_operation_batch(
+            'factorial', [0, 5, 2.5, 171])
+        np.testing.assert_array_equal(output_data, [1.0, 120.0, np.nan, np.nan])
+        self.assertEqual(list(messages), [None, None] + [calculator.MATH_DOMAIN_MESSAGE] * 2)
+
+
+class TestAngleModes(unittest.TestCase):
+    """ Test cases for the angle mode of the trigonometric functions
+    """
+    def test_degrees(self):
+        """ Test the angles are read and returned in degrees
+        """
+        cal = calculator.ScientificCalculator(angle_mode='deg')
+        self.assertAlmostEqual(cal.perform_scientific_operation('sin', '30')[0], 0.5)
+        self.assertAlmostEqual(cal.perform_scientific_operation('cos', '360060')[0], 0.5)
+        self.assertAlmostEqual(cal.perform_scientific_operation('atan', '1')[0], 45.0)
+        output_data, _ = cal.perform_scientific_operation_batch('sin', ['90', '-90'])
+        np.testing.assert_allclose(output_data, [1.0, -1.0])
+        output_data, _ = cal.perform_scientific_operation_batch('asin', [1, 0.5])
+        np.testing.assert_allclose(output_data, [90.0, 30.0])
+
+    def test_grads(self):
+        """ Test the angles are read and returned in grads
+        """
+        cal = calculator.ScientificCalculator(angle_mode='grad')
+        self.assertAlmostEqual(cal.perform_scientific_operation('sin', '100')[0], 1.0)
+        self.assertAlmostEqual(cal.perform_scientific_operation('acos', '0')[0], 100.0)
+
+    def test_per_instance_state(self):
+        """ Test the angle mode belongs to each instance and is validated
+        """
+        radians = calculator.ScientificCalculator(cache_size=8)
+        degrees = calculator.ScientificCalculator(angle_mode='deg')
+        self.assertAlmostEqual(degrees.perform_scientific_operation('sin', '90')[0], 1.0)
+        self.assertAlmostEqual(radians.perform_scientific_operation('sin', '90')[0], math.sin(90))
+        # The cached results depend on the angle mode
+        radians.angle_mode = 'deg'
+        self.assertAlmostEqual(radians.perform_scientific_operation('sin', '90')[0], 1.0)
+        with self.assertRaises(ValueError):
+            calculator.ScientificCalculator(angle_mode='turns')
+
+
+class TestComplexMode(unittest.TestCase):
+    """ Test cases for the complex numeric mode of the scientific calculator
+    """
+    def setUp(self):
+        """ Setup function for initializing the calculator in the complex mode
+        """
+        super().__init__()
+        self.cal = calculator.ScientificCalculator(numeric_mode='complex')
+
+    def test_arithmetic(self):
+        """ Test the operands are parsed and combined as complex numbers
+        """
+        self.assertEqual(self.cal.perform_operation('*', '3+4j', '2j'),
+                         (-8 + 6j, 'Operation Performed: 3+4j*2j=(-8+6j)'))
+        self.assertEqual(self.cal.perform_operation('^', '1j', '2')[0], -1)
+        self.assertEqual(self.cal.perform_operation('/', '1j', '0')[1],
+                         calculator.ZERO_DIVISION_MESSAGE)
+        self.assertEqual(self.cal.perform_operation('%', '3', '2')[1],
+                         calculator.MATH_DOMAIN_MESSAGE)
+        self.assertEqual(self.cal.perform_operation('+', '3+', '2')[1],
+                         calculator.INVALID_INPUT_MESSAGE)
+
+    def test_scientific(self):
+        """ Test the scientific functions accept the inputs outside of the real domain
+        """
+        self.assertEqual(self.cal.perform_scientific_operation('log', '-1')[0], cmath.log(-1))
+        self.assertEqual(self.cal.perform_scientific_operation('sqrt', '-4')[0], 2j)
+        self.assertEqual(self.cal.perform_scientific_operation('sin', '1j', '2', '*')[0],
+                         cmath.sin(2j))
+        self.assertEqual(self.cal.perform_scientific_operation('log', '0')[1],
+                         calculator.MATH_DOMAIN_MESSAGE)
+        self.assertEqual(self.cal.perform_scientific_operation('factorial', '3')[1],
+                         calculator.MATH_DOMAIN_MESSAGE)
+        degrees = calculator.ScientificCalculator(numeric_mode='complex', angle_mode='deg')
+        self.assertAlmostEqual(degrees.perform_scientific_operation('sin', '90')[0], 1)
+        # The results depend on the numeric mode
+        cached = calculator.ScientificCalculator(cache_size=8)
+        self.assertEqual(cached.perform_scientific_operation('sqrt', '-4')[1],
+                         calculator.MATH_DOMAIN_MESSAGE)
+        cached.numeric_mode = 'complex'
+        self.assertEqual(cached.perform_scientific_operation('sqrt', '-4')[0], 2j)
+
+    def test_batch(self):
+        """ Test the batch operations evaluate complex arrays
+        """
+        result = self.cal.calculate_batch('/', ['3+4j', 1, 'a'], [1j, 0, 1])
+        self.assertEqual(result.values.dtype, np.complex128)
+        self.assertEqual(result.values[0], 4 - 3j)
+        self.assertEqual(list(result.status), [calculator.OK, calculator.ZERO_DIVISION,
+                                               calculator.INVALID_INPUT])
+        output_data, messages = self.cal.perform_scientific_operation_batch(
+            'log', np.array([-1, 1j, 0]))
+        np.testing.assert_allclose(output_data[:2], [cmath.log(-1), cmath.log(1j)])
+        self.assertEqual(list(messages), [None, None, calculator.MATH_DOMAIN_MESSAGE])
+
+    def test_undefined_operations(self):
+        """ Test the operations without a complex implementation are domain errors in
+            the scalar and batch operations alike
+        """
+        self.assertEqual(self.cal.perform_operation('%', '3', '2'),
+                         ('', calculator.MATH_DOMAIN_MESSAGE))
+        result = self.cal.calculate_batch('%', ['3', 'a'], [2, 1])
+        self.assertTrue(np.isnan(result.values).all())
+        self.assertEqual(list(result.status), [calculator.MATH_DOMAIN, calculator.INVALID_INPUT])
+        self.assertEqual(self.cal.perform_scientific_operation('factorial', '3'),
+                         ('', calculator.MATH_DOMAIN_MESSAGE))
+        output_data, messages = self.cal.perform_scientific_operation_batch('factorial', [1, 2])
+        self.assertTrue(np.isnan(output_data).all())
+        self.assertEqual(list(messages), [calculator.MATH_DOMAIN_MESSAGE] * 2)
+
+
+class TestImportSideEffects(unittest.TestCase):
+    """ Test cases for importing the calculator modules in a fresh interpreter
+    """
+    root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+    def run_python(self, code, cwd=None):
+        """ Run the code in a fresh interpreter finding the app package and get its output
+        """
+        environment = dict(os.environ, PYTHONPATH=self.root)
+        completed = subprocess.run([sys.executable, '-c', code], cwd=cwd or self.root,
+                                   env=environment, capture_output=True, text=True, check=True)
+        return completed.stdout.strip()
+
+    def test_import_creates_no_file(self):
+        """ Test importing and using the calculator core leaves the current directory empty
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            self.run_python('from app.calculator import Calculator; '
+                            'Calculator().perform_operation("+", "1", "2")', cwd=directory)
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_numpy_imported_lazily(self):
+        """ Test NumPy is only imported by the first batch operation
+        """
+        output = self.run_python(
+            'import sys; from app.calculator import Calculator; '
+            'print("numpy" in sys.modules); '
+            'Calculator().perform_operation_batch("+", [1], [2]); '
+            'print("numpy" in sys.modules)')
+        self.assertEqual(output.split(), ['False', 'True'])
+
+    def test_pyqt_imported_lazily(self):
+        """ Test the UI entry point module does not import PyQt5 until a window is needed
+        """
+        output = self.run_python('import sys, app.calculator_ui; print("PyQt5" in sys.modules)')
+        self.assertEqual(output, 'False')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,214 @@
+""" Test cases for the calculator window, run offscreen
+"""
+
+# Importing modules
+import os
+import sys
+import threading
+import time
+import unittest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt5 import QtCore, QtWidgets  # pylint: disable=wrong-import-position
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app.calculator_window import (  # pylint: disable=wrong-import-position
+    CALCULATION_ERROR_MESSAGE, CalulatorUi)
+from app.history import HistoryStore  # pylint: disable=wrong-import-position
+
+
+def heavy_operation(operator, first_input, second_input):
+    """ Calculator stand-in computing in pure Python for about half a second
+    """
+    deadline = time.perf_counter() + 0.5
+    total = 0
+    while time.perf_counter() < deadline:
+        total += sum(i * i for i in range(1000))
+    return total, '{} {} {}'.format(first_input, operator, second_input)
+
+
+class TestCalculatorWindow(unittest.TestCase):
+    """ Test cases for the background evaluation of the window
+    """
+    @classmethod
+    def setUpClass(cls):
+        cls.application = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def setUp(self):
+        self.window = CalulatorUi()
+        self.window.first_input_text.setText('3')
+        self.window.second_input_text.setText('2')
+
+    def tearDown(self):
+        self.window.cancel_calculation()
+        self.window.thread_pool.waitForDone()
+        self.window.deleteLater()
+
+    def wait_until_idle(self, timeout=5.0):
+        """ Run the event loop until the window has no calculation in progress
+        """
+        deadline = time.perf_counter() + timeout
+        while self.window.is_calculating() and time.perf_counter() < deadline:
+            self.application.processEvents(QtCore.QEventLoop.AllEvents, 10)
+
+    def test_result_displayed(self):
+        """ Test the result of the background calculation is displayed
+        """
+        self.window.add_btn.click()
+        self.wait_until_idle()
+        self.assertEqual(self.window.output_text.text(), '5')
+        self.assertEqual(self.window.disp_operation_lbl.text(), 'Operation Performed: 3+2=5')
+
+    def test_latest_operation_wins(self):
+        """ Test rapid clicks only display the result of the last operation
+        """
+        for button in (self.window.add_btn, self.window.sub_btn, self.window.mul_btn):
+            button.click()
+        self.wait_until_idle()
+        self.assertEqual(self.window.output_text.text(), '6')
+
+    def test_repeated_clicks_coalesced(self):
+        """ Test clicking the running operation again does not queue another calculation
+        """
+        calls = []
+
+        def counted_operation(*args):
+            calls.append(args)
+            time.sleep(0.05)
+            return 5, '3 + 2'
+
+        self.window.calculator.perform_operation = counted_operation
+        for _ in range(10):
+            self.window.add_btn.click()
+        self.wait_until_idle()
+        self.assertEqual(len(calls), 1)
+
+    def test_responsive_during_heavy_calculation(self):
+        """ Test the event loop keeps processing timer events while a heavy
+            calculation runs, and shows the progress and cancel button
+        """
+        self.window.calculator.perform_operation = heavy_operation
+        ticks = []
+        timer = QtCore.QTimer()
+        timer.setInterval(10)
+        timer.timeout.connect(lambda: ticks.append(time.perf_counter()))
+        timer.start()
+
+        start = time.perf_counter()
+        self.window.add_btn.click()
+        # The click returns immediately, the calculation runs on the worker thread
+        self.assertLess(time.perf_counter() - start, 0.1)
+        self.wait_until_idle()
+        timer.stop()
+
+        gaps = [later - earlier for earlier, later in zip(ticks, ticks[1:])]
+        self.assertGreater(len(ticks), 10)
+        self.assertLess(max(gaps), 0.2)
+        self.assertTrue(self.window.output_text.text())
+        self.assertFalse(self.window.progress_bar.isVisible())
+
+    def test_cancel(self):
+        """ Test a cancelled calculation does not display its result
+        """
+        started = threading.Event()
+
+        def slow_operation(*args):
+            started.set()
+            time.sleep(0.3)
+            return 5, '3 + 2'
+
+        self.window.calculator.perform_operation = slow_operation
+        self.window.show()
+        self.window.add_btn.click()
+        started.wait(1)
+        deadline = time.perf_counter() + 1
+        while not self.window.cancel_btn.isVisible() and time.perf_counter() < deadline:
+            self.application.processEvents(QtCore.QEventLoop.AllEvents, 10)
+        self.assertTrue(self.window.cancel_btn.isVisible())
+
+        self.window.cancel_btn.click()
+        self.window.wait_for_result()
+        self.assertFalse(self.window.is_calculating())
+        self.assertEqual(self.window.output_text.text(), '')
+        self.assertFalse(self.window.cancel_btn.isVisible())
+
+    def test_replace_finished_calculation(self):
+        """ Test an operation replacing a calculation which finished, but whose result
+            is not displayed yet, is performed
+        """
+        self.window.add_btn.click()
+        self.window.thread_pool.waitForDone()
+        self.window.mul_btn.click()
+        self.wait_until_idle()
+        self.assertEqual(self.window.output_text.text(), '6')
+        # The finished task is released once replaced
+        self.assertEqual(len(self.window._tasks), 1)  # pylint: disable=protected-access
+
+    def test_calculation_error(self):
+        """ Test an error raised by the calculation is displayed instead of aborting
+            the application, and the pool keeps performing the next calculations
+        """
+        def failing_operation(*args):
+            raise ValueError('unexpected error')
+
+        self.window.calculator.perform_operation = failing_operation
+        with self.assertLogs('calculatorLogs', 'ERROR'):
+            self.window.add_btn.click()
+            self.wait_until_idle()
+        self.assertEqual(self.window.disp_operation_lbl.text(), CALCULATION_ERROR_MESSAGE)
+        self.assertEqual(self.window.output_text.text(), '')
+        del self.window.calculator.perform_operation
+        self.window.mul_btn.click()
+        self.wait_until_idle()
+        self.assertEqual(self.window.output_text.text(), '6')
+
+    def test_buttons_from_registry(self):
+        """ Test a button is generated for each registered operation and the angle
+            mode selector changes the unit of the calculator
+        """
+        self.assertEqual(list(self.window.operation_buttons),
+                         list(self.window.calculator.registry.binary)
+                         + list(self.window.calculator.registry.unary))
+        self.assertIs(self.window.fact_btn, self.window.operation_buttons['factorial'])
+
+        self.window.second_input_text.setText('')
+        self.window.first_input_text.setText('5')
+        self.window.fact_btn.click()
+        self.wait_until_idle()
+        self.assertEqual(self.window.output_text.text(), '120')
+
+        self.window.angle_mode_combo.setCurrentText('deg')
+        self.assertEqual(self.window.calculator.angle_mode, 'deg')
+        self.window.first_input_text.setText('90')
+        self.window.sin_btn.click()
+        self.wait_until_idle()
+        self.assertEqual(self.window.output_text.text(), '1.0')
+
+    def test_history_panel(self):
+        """ Test the history panel lists the stored and the new calculations, and
+            restores the inputs of a double-clicked one
+        """
+        with HistoryStore() as history:
+            calculator = CalulatorUi(history).calculator
+            calculator.perform_operation('*', '4', '5')
+            window = CalulatorUi(history)
+            self.assertEqual(window.history_list.item(0).text(), 'Operation Performed: 4*5=20')
+
+            window.first_input_text.setText('3')
+            window.second_input_text.setText('2')
+            window.add_btn.click()
+            while window.is_calculating():
+                self.application.processEvents(QtCore.QEventLoop.AllEvents, 10)
+            self.assertEqual(window.history_list.count(), 2)
+            self.assertEqual(window.history_list.item(0).text(), 'Operation Performed: 3+2=5')
+            self.assertEqual(len(history), 2)
+
+            window.restore_history_item(window.history_list.item(1))
+            self.assertEqual(window.first_input_text.text(), '4')
+            self.assertEqual(window.second_input_text.text(), '5')
+            window.thread_pool.waitForDone()
+            window.deleteLater()
+
+
+if __name__ == '__main__':
+    unittest.main()
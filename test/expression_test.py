@@ -0,0 +1,192 @@
+""" Test cases for the expression engine
+"""
+
+# Importing modules
+import math
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app import calculator
+from app import expression
+
+
+class TestExpression(unittest.TestCase):
+    """ Test cases for parsing, folding and evaluating expressions
+    """
+    def setUp(self):
+        """ Setup function for initializing the instance for scientific calculator
+        """
+        super().__init__()
+        self.cal = calculator.ScientificCalculator()
+
+    def test_evaluate_scalar(self):
+        """ Test the evaluation of an expression with scalar variables
+        """
+        result = self.cal.evaluate("sin(3+2)*log(x)/y", x=3, y=2)
+        self.assertEqual(result, math.sin(5) * math.log(3) / 2)
+
+    def test_matches_scientific_operation(self):
+        """ Test the expression matches the scientific operation of the calculator
+        """
+        result = self.cal.evaluate("sin(x+y)", x=3, y=2)
+        scientific_result, _ = self.cal.perform_scientific_operation('sin', '3', '2', '+')
+        self.assertEqual(result, scientific_result)
+
+    def test_angle_modes(self):
+        """ Test the expressions use the angle mode of the calculator like the scientific
+            operations
+        """
+        for angle_mode in ('deg', 'grad'):
+            cal = calculator.ScientificCalculator(angle_mode=angle_mode)
+            with self.subTest(angle_mode=angle_mode):
+                self.assertEqual(cal.evaluate("sin(x)", x=90),
+                                 cal.perform_scientific_operation('sin', '90')[0])
+                self.assertEqual(cal.evaluate("asin(x)", x=1),
+                                 cal.perform_scientific_operation('asin', '1')[0])
+                np.testing.assert_array_equal(
+                    cal.evaluate("cos(x)", x=[0.0, 60.0]),
+                    cal.perform_scientific_operation_batch('cos', [0.0, 60.0])[0])
+        degrees = calculator.ScientificCalculator(angle_mode='deg')
+        with self.assertRaises(ValueError):
+            degrees.evaluate(expression.compile_expression("sin(x)"), x=90)
+
+    def test_evaluate_array(self):
+        """ Test the evaluation of an expression with array variables
+        """
+        x = np.array([1.0, 2.0, 3.0])
+        result = self.cal.evaluate("-cos(x)*2 - x/4", x=x)
+        np.testing.assert_allclose(result, -np.cos(x) * 2 - x / 4)
+
+    def test_constant_folding(self):
+        """ Test the constant sub-expressions are evaluated once at compile time
+        """
+        compiled = expression.compile_expression("sin(3+2)*x")
+        self.assertIsInstance(compiled.tree.operands[0], expression.Number)
+        self.assertEqual(compiled.variables, {'x'})
+        self.assertEqual(compiled(x=2), math.sin(5) * 2)
+        self.assertEqual(compiled(x=4), math.sin(5) * 4)
+
+    def test_invalid_expression(self):
+        """ Test the unsupported syntax and unknown functions are rejected
+        """
+        for source in ("3 +", "__import__('os')", "gamma(2)", "x // 2", "'a' + 1"):
+            with self.assertRaises(expression.ExpressionError):
+                expression.compile_expression(source)
+
+    def test_missing_variable(self):
+        """ Test the evaluation fails when a variable has no value
+        """
+        with self.assertRaises(expression.ExpressionError):
+            self.cal.evaluate("x + y", x=1)
+
+    def test_division_by_zero(self):
+        """ Test the scalar division by zero is raised on evaluation, not on compilation
+        """
+        compiled = expression.compile_expression("1/0 + x")
+        with self.assertRaises(ZeroDivisionError):
+            compiled(x=1)
+
+
+def interpret(node, variables, functions):
+    """ Evaluate the expression tree by walking it, one function call per operation
+    """
+    if isinstance(node, expression.Number):
+        return node.value
+    if isinstance(node, expression.Variable):
+        return variables[node.name]
+    return functions[node.method](*(interpret(operand, variables, functions)
+                                    for operand in node.operands))
+
+
+class TestCompiledExpression(unittest.TestCase):
+    """ Test cases for the generated functions and kernels of the expressions
+    """
+    SOURCES = (
+        "sin(x+y)",
+        "-cos(x)*2 - x/4 + sin(x+y)*log(x)/y",
+        "sqrt(x)**y % 7 + exp(-y) - tanh(x*y)",
+        "log10(x) * log2(y) / (atan(x) + asin(y/10) - acos(y/10))",
+        "(x - y) * (x + y) / (x * y) - sinh(y/10) + cosh(x/100) - tan(y)",
+        "1e308*10 + x",
+    )
+
+    def setUp(self):
+        self.cal = calculator.ScientificCalculator()
+        generator = np.random.default_rng(0)
+        self.x = generator.uniform(0.1, 50, 40000)
+        self.y = generator.uniform(-5, 5, 40000)
+
+    def test_bit_identical_scalars(self):
+        """ Test the generated function returns exactly the values of the operations
+            applied one by one
+        """
+        functions = expression._scalar_functions()  # pylint: disable=protected-access
+        for source in self.SOURCES:
+            compiled = expression.compile_expression(source)
+            with self.subTest(source=source):
+                for x, y in zip(self.x[:200].tolist(), self.y[:200].tolist()):
+                    try:
+                        expected = interpret(compiled.tree, {'x': x, 'y': y}, functions)
+                    except (ArithmeticError, ValueError) as error:
+                        with self.assertRaises(type(error)):
+                            compiled(x=x, y=y)
+                        continue
+                    self.assertEqual(repr(compiled(x=x, y=y)), repr(expected))
+
+    def test_bit_identical_scientific_operation(self):
+        """ Test the compiled formula returns exactly the scientific operation output
+        """
+        compiled = expression.compile_expression("sin(x+y)")
+        for x, y in zip(self.x[:500].tolist(), self.y[:500].tolist()):
+            output_data, _ = self.cal.perform_scientific_operation('sin', repr(x), repr(y), '+')
+            self.assertEqual(compiled.function(x, y), output_data)
+
+    def test_bit_identical_arrays(self):
+        """ Test the fused kernel returns exactly the values of the unfused NumPy
+            functions, including nan and inf, across several chunks
+        """
+        functions = expression._array_functions()  # pylint: disable=protected-access
+        for source in self.SOURCES:
+            compiled = expression.compile_expression(source)
+            with self.subTest(source=source), np.errstate(all='ignore'):
+                expected = interpret(compiled.tree, {'x': self.x, 'y': self.y}, functions)
+                np.testing.assert_array_equal(compiled(x=self.x, y=self.y), expected)
+                np.testing.assert_array_equal(compiled(x=self.x, y=2.5),
+                                              interpret(compiled.tree, {'x': self.x, 'y': 2.5},
+                                                        functions))
+        np.testing.assert_array_equal(self.cal.evaluate("factorial(x) + 1", x=[0, 3, 1.5, -1]),
+                                      [2, 7, np.nan, np.nan])
+
+    def test_broadcasting(self):
+        """ Test the kernel broadcasts the variables to the shape of the output
+        """
+        compiled = expression.compile_expression("x * y + 1")
+        x = np.arange(6.0).reshape(2, 3)
+        y = np.array([1.0, 2.0, 3.0])
+        np.testing.assert_array_equal(compiled(x=x, y=y), x * y + 1)
+        np.testing.assert_array_equal(compiled(x=x.T, y=[[1.0], [2.0], [3.0]]),
+                                      x.T * [[1.0], [2.0], [3.0]] + 1)
+        self.assertEqual(compiled(x=[], y=1).shape, (0,))
+        self.assertEqual(expression.compile_expression("3")(x=[1, 2]), 3)
+
+    def test_cache(self):
+        """ Test the compiled expressions are reused by text, within the size bound
+        """
+        cache = expression.expression_cache
+        cache.cache_clear()
+        self.assertIs(expression.compile_expression("x + 1"),
+                      expression.compile_expression("x + 1"))
+        self.assertEqual(self.cal.evaluate("x + 1", x=2), 3)
+        self.assertEqual(cache.cache_info().hits, 2)
+        for index in range(cache.maxsize + 10):
+            expression.compile_expression("x + {}".format(index))
+        self.assertEqual(cache.cache_info().currsize, cache.maxsize)
+        self.assertGreater(cache.cache_info().evictions, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
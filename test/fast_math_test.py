@@ -0,0 +1,111 @@
+""" Test cases for the fast approximate scientific functions
+"""
+
+# Importing modules
+import math
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app import calculator
+from app.fast_math import FastMath
+
+
+class TestFastMath(unittest.TestCase):
+    """ Test cases for the error bounds of the lookup tables against the exact functions
+    """
+    generator = np.random.default_rng(7)
+    angles = np.concatenate([
+        generator.uniform(-1000, 1000, 200000),
+        np.arange(-64, 65) * (math.pi / 4),
+        [0.0, -0.0, 1e-300, 5e-324],
+    ])
+    positives = np.concatenate([
+        10 ** generator.uniform(-300, 300, 200000),
+        generator.uniform(0.5, 2, 100000),
+        [5e-324, 2.2e-308, 1.0, 0.5, 2.0, 1.7e308],
+    ])
+
+    def test_error_bounds(self):
+        """ Test the absolute error of sin, cos and log stays within the accuracy target
+            for both interpolations and several targets
+        """
+        for interpolation in ('cubic', 'linear'):
+            for accuracy in (1e-4, 1e-7, 1e-10):
+                with self.subTest(interpolation=interpolation, accuracy=accuracy):
+                    fast = FastMath(accuracy, interpolation)
+                    for function, exact, values in ((fast.sin, np.sin, self.angles),
+                                                    (fast.cos, np.cos, self.angles),
+                                                    (fast.log, np.log, self.positives)):
+                        error = np.max(np.abs(function(values) - exact(values)))
+                        self.assertLessEqual(error, accuracy)
+
+    def test_tangent_error(self):
+        """ Test the tangent error scales with 1 + tan(x)**2 away from the poles
+        """
+        fast = FastMath(1e-7)
+        values = self.angles[np.abs(np.cos(self.angles)) > 0.1]
+        exact = np.tan(values)
+        error = np.abs(fast.tan(values) - exact)
+        self.assertTrue(np.all(error <= 2e-7 * (1 + exact ** 2)))
+
+    def test_special_values(self):
+        """ Test the values outside of the domains yield the same nan and inf as NumPy
+        """
+        fast = FastMath()
+        special = np.array([0.0, -1.0, np.inf, -np.inf, np.nan])
+        with np.errstate(all='ignore'):
+            np.testing.assert_array_equal(fast.log(special), np.log(special))
+            np.testing.assert_array_equal(fast.sin(special[2:]), np.sin(special[2:]))
+        self.assertIsInstance(fast.sin(3.0), float)
+
+    def test_table_memory(self):
+        """ Test the table memory is reported and grows with the accuracy target
+        """
+        info = FastMath(1e-7).table_info()
+        self.assertEqual(FastMath(1e-7).nbytes, sum(table['bytes'] for table in info.values()))
+        self.assertLess(FastMath(1e-7).nbytes, 8 * 1024)
+        self.assertLess(FastMath(1e-4).nbytes, FastMath(1e-7).nbytes)
+        self.assertLess(FastMath(1e-7).nbytes, FastMath(1e-7, 'linear').nbytes)
+        self.assertTrue(all(table['error_bound'] <= 1e-7 for table in info.values()))
+
+    def test_invalid_arguments(self):
+        """ Test the unsupported interpolation and accuracy are rejected
+        """
+        with self.assertRaises(ValueError):
+            FastMath(interpolation='quadratic')
+        with self.assertRaises(ValueError):
+            FastMath(accuracy=0)
+        with self.assertRaises(ValueError):
+            FastMath(functions=('sin', 'exp'))
+
+    def test_calculator_batch(self):
+        """ Test the batch operations of the calculator use the tables, keeping the
+            domain errors and the invalid inputs of the exact path
+        """
+        exact = calculator.ScientificCalculator()
+        fast = calculator.ScientificCalculator(fast_math=FastMath(1e-7))
+        operands = ['0.5', '-1', 'a', '3', '0']
+        for operator in ('sin', 'cos', 'tan', 'log'):
+            with self.subTest(operator=operator):
+                exact_output, exact_messages = exact.perform_scientific_operation_batch(
+                    operator, operands)
+                fast_output, fast_messages = fast.perform_scientific_operation_batch(
+                    operator, operands)
+                self.assertEqual(list(fast_messages), list(exact_messages))
+                np.testing.assert_allclose(fast_output, exact_output, rtol=0, atol=1e-6)
+
+        # The functions which are not approximated use the exact NumPy functions
+        partial = calculator.ScientificCalculator(fast_math=FastMath(1e-7, functions=('sin',)))
+        np.testing.assert_array_equal(partial.perform_scientific_operation_batch('log', operands)[0],
+                                      exact.perform_scientific_operation_batch('log', operands)[0])
+
+        # The scalar operations stay exact
+        self.assertEqual(fast.perform_scientific_operation('sin', '0.5')[0], math.sin(0.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
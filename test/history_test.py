@@ -0,0 +1,111 @@
+""" Test cases for the persistent calculation history
+"""
+
+# Importing modules
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app import calculator
+from app.history import HistoryStore
+
+
+class TestHistoryStore(unittest.TestCase):
+    """ Test cases for recording, querying and replaying the history
+    """
+    def setUp(self):
+        self.history = HistoryStore(batch_size=10)
+        self.cal = calculator.ScientificCalculator(history=self.history)
+
+    def tearDown(self):
+        self.history.close()
+
+    def test_operations_recorded(self):
+        """ Test the operations are recorded newest first, with their inputs and results
+        """
+        self.cal.perform_operation('+', '3', '2')
+        self.cal.perform_scientific_operation('sin', '0')
+        self.cal.perform_operation('/', '1', '0')
+        entries = self.history.recent()
+        self.assertEqual([entry.operator for entry in entries], ['/', 'sin', '+'])
+        self.assertEqual(entries[2].first, '3')
+        self.assertEqual(entries[2].output, '5')
+        self.assertEqual(entries[2].numeric_mode, 'float')
+        self.assertEqual(entries[2].message, 'Operation Performed: 3+2=5')
+        self.assertEqual(entries[0].message, calculator.ZERO_DIVISION_MESSAGE)
+
+    def test_combined_scientific_operation_recorded_once(self):
+        """ Test the arithmetic operation combining the operands of a scientific
+            function is not recorded on its own
+        """
+        self.cal.perform_scientific_operation('sin', '3', '2', '+')
+        entries = self.history.recent()
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0].arith_operator, '+')
+
+    def test_batched_commits(self):
+        """ Test the entries are only written once the batch is full or on a query
+        """
+        for _ in range(9):
+            self.cal.perform_operation('+', '1', '1')
+        self.assertEqual(len(self.history._pending), 9)  # pylint: disable=protected-access
+        self.cal.perform_operation('+', '1', '1')
+        self.assertEqual(len(self.history._pending), 0)  # pylint: disable=protected-access
+        self.cal.perform_operation('+', '1', '1')
+        self.assertEqual(len(self.history), 11)
+
+    def test_query_filters(self):
+        """ Test the entries are filtered by operator and timestamp
+        """
+        for operator in '+-+*':
+            self.cal.perform_operation(operator, '6', '3')
+        middle = time.time()
+        time.sleep(0.01)
+        self.cal.perform_operation('+', '6', '3')
+        self.assertEqual(len(self.history.query(operator='+')), 3)
+        self.assertEqual(len(self.history.query(operator='+', since=middle)), 1)
+        self.assertEqual(len(self.history.query(until=middle)), 4)
+        self.assertEqual(len(self.history.query(limit=2)), 2)
+
+    def test_replay(self):
+        """ Test replaying the history performs the calculations again in order,
+            without replaying the entries recorded by the replay itself
+        """
+        self.cal.perform_operation('*', '6', '3')
+        self.cal.perform_scientific_operation('log', '1')
+        replayed = list(self.history.replay(self.cal))
+        self.assertEqual([entry.operator for entry, _ in replayed], ['*', 'log'])
+        self.assertEqual([result[0] for _, result in replayed], [18, 0.0])
+        self.assertEqual(len(self.history), 4)
+
+    def test_persistence(self):
+        """ Test the entries are kept in the database file across the stores
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'history.db')
+            with HistoryStore(path) as history:
+                calculator.Calculator(history=history).perform_operation('-', '5', '2')
+            with HistoryStore(path) as history:
+                self.assertEqual([entry.output for entry in history.recent()], ['3'])
+
+    def test_concurrent_recording(self):
+        """ Test the operations of several threads are all recorded
+        """
+        def worker():
+            for _ in range(100):
+                self.cal.perform_operation('+', '1', '2')
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.history), 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
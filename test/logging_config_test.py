@@ -0,0 +1,107 @@
+""" Test cases for the explicit logging setup of the calculator
+"""
+
+# Importing modules
+import logging
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app import calculator
+from app import logging_config
+
+
+class TestLoggingConfig(unittest.TestCase):
+    """ Test cases for the direct and queued logging modes
+    """
+    def setUp(self):
+        """ Setup function for creating a temporary log directory
+        """
+        super().__init__()
+        self.directory = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.directory.name, 'logFile.log')
+        self.cal = calculator.Calculator()
+
+    def tearDown(self):
+        """ Remove the handlers and the temporary log directory
+        """
+        logging_config.shutdown_logging()
+        self.directory.cleanup()
+
+    def read_log(self):
+        """ Read the lines written to the log file
+        """
+        with open(self.log_file, encoding='utf-8') as log_file:
+            return log_file.read().splitlines()
+
+    def test_queued_logging(self):
+        """ Test the queued records are written once the logging is shut down
+        """
+        logging_config.configure_logging(self.log_file, queued=True)
+        self.cal.perform_operation('+', '3', '2')
+        logging_config.shutdown_logging()
+        lines = self.read_log()
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(lines[-1].endswith('Operation Performed: 3+2=5'))
+
+    def test_queued_records_are_not_formatted(self):
+        """ Test the queued records keep their arguments, which are formatted by the
+            listener thread
+        """
+        logger = logging_config.configure_logging(self.log_file, queued=True)
+        queued_handler = logger.handlers[-1]
+        self.assertIsInstance(queued_handler, logging_config.RecordQueueHandler)
+        record = logging.LogRecord('calculatorLogs', logging.INFO, __file__, 0,
+                                   'Output: %s', (5,), None)
+        self.assertIs(queued_handler.prepare(record), record)
+        self.assertEqual(record.args, (5,))
+        logger.handle(record)
+        logging_config.shutdown_logging()
+        self.assertTrue(self.read_log()[-1].endswith('Output: 5'))
+
+    def test_direct_logging(self):
+        """ Test the records are written directly without the queue
+        """
+        logging_config.configure_logging(self.log_file, queued=False)
+        self.cal.perform_operation('/', '7', '0')
+        self.assertIn("WARNING : calculatorLogs : Number 2 can't be zero.", self.read_log()[-1])
+
+    def test_summary_only(self):
+        """ Test the per-input details are skipped in the summary only mode
+        """
+        logging_config.configure_logging(self.log_file, summary_only=True)
+        self.cal.perform_operation('+', '3', '2')
+        self.cal.perform_operation('+', 'a', '2')
+        logging_config.shutdown_logging()
+        lines = self.read_log()
+        self.assertEqual(len(lines), 2)
+        self.assertIn('Operation Performed: 3+2=5', lines[0])
+        self.assertIn('Please provide valid input.', lines[1])
+
+    def test_rotating_file(self):
+        """ Test the log file is rotated once it reaches the maximum size
+        """
+        logging_config.configure_logging(self.log_file, queued=False, max_bytes=500,
+                                         backup_count=2)
+        for _ in range(20):
+            self.cal.perform_operation('+', '3', '2')
+        self.assertLessEqual(os.path.getsize(self.log_file), 500)
+        self.assertTrue(os.path.exists(self.log_file + '.1'))
+        self.assertFalse(os.path.exists(self.log_file + '.3'))
+
+    def test_no_log_file_without_configuration(self):
+        """ Test the operations do not create a log file unless logging is configured
+        """
+        current_directory = os.getcwd()
+        os.chdir(self.directory.name)
+        try:
+            self.cal.perform_operation('+', '3', '2')
+        finally:
+            os.chdir(current_directory)
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
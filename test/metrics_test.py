@@ -0,0 +1,109 @@
+""" Test cases for the instrumentation of the calculator operations
+"""
+
+# Importing modules
+import os
+import sys
+import tempfile
+import unittest
+import urllib.request
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app import calculator
+from app.metrics import INVALID_OPERATOR, OperationMetrics
+
+
+class TestOperationMetrics(unittest.TestCase):
+    """ Test cases for the counts, latencies and exports of the metrics
+    """
+    def setUp(self):
+        """ Setup function for initializing the calculator with the metrics enabled
+        """
+        super().__init__()
+        self.metrics = OperationMetrics()
+        self.cal = calculator.ScientificCalculator(metrics=self.metrics)
+
+    def test_counts(self):
+        """ Test the calls and each type of error are counted per operator
+        """
+        self.cal.perform_operation('+', '3', '2')
+        self.cal.perform_operation('+', 'a', '2')
+        self.cal.perform_operation('/', '7', '0')
+        self.cal.perform_scientific_operation('log', '-1')
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot['calls'], {'+': 2, '/': 1, 'log': 1})
+        self.assertEqual(snapshot['errors'], {
+            '+': {'invalid_input': 1},
+            '/': {'zero_division': 1},
+            'log': {'math_domain': 1},
+        })
+
+    def test_combined_inputs(self):
+        """ Test a scientific operation combining two inputs is counted once, under the
+            scientific function
+        """
+        self.cal.perform_scientific_operation('sin', '3', '2', '+')
+        self.cal.perform_scientific_operation('sin', '3', '0', '/')
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot['calls'], {'sin': 2})
+        self.assertEqual(snapshot['errors'], {'sin': {'zero_division': 1}})
+
+    def test_invalid_operators(self):
+        """ Test the unregistered operators share a single label
+        """
+        for operator in ('pow', '//', 'x' * 100):
+            self.cal.perform_operation(operator, '3', '2')
+        self.cal.perform_scientific_operation('cbrt', '8')
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot['calls'], {INVALID_OPERATOR: 4})
+        self.assertEqual(snapshot['errors'], {INVALID_OPERATOR: {'invalid_input': 4}})
+
+    def test_phase_latencies(self):
+        """ Test the latency of each phase is recorded once per call
+        """
+        self.cal.perform_operation('*', '3', '2')
+        self.cal.perform_operation('*', '4', '2')
+        latency = self.metrics.snapshot()['latency']['*']
+        self.assertEqual(set(latency), {'logging', 'parse', 'operation', 'total'})
+        for histogram in latency.values():
+            self.assertEqual(histogram['count'], 2)
+            self.assertEqual(histogram['buckets'][float('inf')], 2)
+        self.assertLessEqual(latency['parse']['sum'], latency['total']['sum'])
+
+    def test_prometheus_export(self):
+        """ Test the metrics are exported to a file in the Prometheus text format
+        """
+        self.cal.perform_operation('/', '7', '0')
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'calculator.prom')
+            self.metrics.write_prometheus(path)
+            with open(path, encoding='utf-8') as metrics_file:
+                text = metrics_file.read()
+        self.assertIn('calculator_operations_total{operator="/"} 1', text)
+        self.assertIn('calculator_errors_total{operator="/",error="zero_division"} 1', text)
+        self.assertIn('calculator_phase_seconds_bucket{operator="/",phase="total",le="+Inf"} 1',
+                      text)
+        self.assertIn('# TYPE calculator_phase_seconds histogram', text)
+
+    def test_serve(self):
+        """ Test the metrics are served over HTTP
+        """
+        self.cal.perform_scientific_operation('sin', '3')
+        server = self.metrics.serve(port=0)
+        try:
+            url = 'http://127.0.0.1:{}/metrics'.format(server.server_address[1])
+            with urllib.request.urlopen(url, timeout=5) as response:
+                text = response.read().decode()
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertIn('calculator_operations_total{operator="sin"} 1', text)
+
+    def test_disabled_by_default(self):
+        """ Test the instrumentation is opt-in
+        """
+        self.assertIsNone(calculator.Calculator().metrics)
+
+
+if __name__ == '__main__':
+    unittest.main()
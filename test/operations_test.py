@@ -0,0 +1,93 @@
+""" Test cases for the operation registry
+"""
+
+# Importing modules
+import math
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app import calculator
+from app.operations import REGISTRY, OperationRegistry, from_radians, to_radians
+
+
+class TestOperationRegistry(unittest.TestCase):
+    """ Test cases for registering and looking up the operations
+    """
+    def test_metadata(self):
+        """ Test the built-in operations are registered with their metadata
+        """
+        self.assertEqual(list(REGISTRY.binary), ['+', '-', '*', '/', '^', '%'])
+        self.assertIn('factorial', REGISTRY.unary)
+        self.assertEqual(REGISTRY['/'].arity, 2)
+        self.assertTrue(REGISTRY['%'].nonzero_divisor)
+        self.assertEqual(REGISTRY['sqrt'].domain, 'x >= 0')
+        self.assertEqual(REGISTRY['sin'].angle, 'input')
+        self.assertEqual(REGISTRY['atan'].angle, 'output')
+        self.assertIs(REGISTRY['exp'].vectorized(), np.exp)
+
+    def test_precomputed_tables(self):
+        """ Test the operator mappings are built once, not on every call
+        """
+        self.assertIs(calculator.Calculator.get_operators(), calculator.Calculator.get_operators())
+        self.assertEqual(calculator.Calculator.get_operators()['/'], '_division')
+        self.assertEqual(calculator.ScientificCalculator.get_scientific_operators()['sin'], '_sin')
+
+    def test_operation_methods(self):
+        """ Test the method names of the operator mappings resolve on the calculators
+        """
+        cal = calculator.ScientificCalculator()
+        for operator, method in cal.get_operators().items():
+            with self.subTest(operator=operator):
+                self.assertIsNone(getattr(cal, method)('7', '2')[1])
+        self.assertEqual(getattr(cal, cal.get_operators()['/'])('3', '2'), (1.5, None))
+        self.assertEqual(calculator.Calculator._add('3', '2'), (5, None))
+        self.assertEqual(calculator.Calculator._division('3', '0'),
+                         ('', calculator.ZERO_DIVISION_MESSAGE))
+        self.assertEqual(getattr(cal, cal.get_scientific_operators()['sqrt'])(16), 4.0)
+        self.assertEqual(calculator.ScientificCalculator._sin(0), 0.0)
+        self.assertFalse(hasattr(cal, '_unknown'))
+        self.assertFalse(hasattr(calculator.Calculator, '_unknown'))
+
+    def test_register_operation(self):
+        """ Test an operation registered on a custom registry is performed by the
+            calculators using it, in the scalar and batch paths
+        """
+        custom = OperationRegistry()
+        custom.register('+', lambda first, second: first + second, 2, 'add', name='add')
+        custom.register('cbrt', lambda value: math.copysign(abs(value) ** (1 / 3), value), 1,
+                          'cbrt')
+
+        class CustomCalculator(calculator.ScientificCalculator):
+            """ Calculator performing the operations of the custom registry
+            """
+            registry = custom
+
+        cal = CustomCalculator()
+        self.assertEqual(cal.get_scientific_operators(), {'cbrt': '_cbrt'})
+        self.assertAlmostEqual(cal.perform_scientific_operation('cbrt', '-8')[0], -2.0)
+        output_data, _ = cal.perform_scientific_operation_batch('cbrt', [27, 64])
+        np.testing.assert_allclose(output_data, [3.0, 4.0])
+        self.assertEqual(cal.perform_operation('-', '3', '2'), ('', 'Please provide valid input.'))
+
+        with self.assertRaises(ValueError):
+            custom.register('cbrt', abs, 1)
+        custom.unregister('cbrt')
+        self.assertNotIn('cbrt', custom)
+        self.assertEqual(custom.unary_methods, {})
+
+    def test_angle_conversion(self):
+        """ Test the angles are converted between the angle modes
+        """
+        self.assertAlmostEqual(to_radians(180, 'deg'), math.pi)
+        self.assertAlmostEqual(to_radians(-100, 'grad'), 1.5 * math.pi)
+        self.assertEqual(to_radians(1e6, 'rad'), 1e6)
+        self.assertAlmostEqual(from_radians(math.pi / 2, 'deg'), 90.0)
+        self.assertAlmostEqual(from_radians(math.pi / 2, 'grad'), 100.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
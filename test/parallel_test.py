@@ -0,0 +1,104 @@
+""" Test cases for the multi-core execution of calculation batches
+"""
+
+# Importing modules
+import os
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app import batch
+from app import calculator
+from app.parallel import ParallelExecutor
+
+ROWS = [
+    ('+', '3', '2'),
+    ('/', '7', '0'),
+    ('sin', '3', '2', '+'),
+    ('log', '3', ''),
+    ('tan', 'a', ''),
+    ('*', '1.5', '-4'),
+    ('+', '3'),
+] * 5
+
+
+class TestParallelExecutor(unittest.TestCase):
+    """ Test cases comparing the parallel results with the sequential path
+    """
+    @classmethod
+    def setUpClass(cls):
+        """ Start a pool of two workers with small shards shared by the test cases
+        """
+        cls.executor = ParallelExecutor(workers=2, chunk_size=3)
+
+    @classmethod
+    def tearDownClass(cls):
+        """ Shut down the worker processes
+        """
+        cls.executor.close()
+
+    def test_map_rows(self):
+        """ Test the rows give the same ordered results as the sequential path
+        """
+        cal = calculator.ScientificCalculator()
+        expected = [batch.process_row(cal, row) for row in ROWS]
+        self.assertEqual(self.executor.map_rows(ROWS), expected)
+
+    def test_map_file(self):
+        """ Test the rows of a CSV file are streamed through the workers
+        """
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as input_file:
+            input_file.write('+,3,2\nsin,3,\n/,1,0\n')
+        try:
+            results = list(self.executor.map_file(input_file.name))
+        finally:
+            os.remove(input_file.name)
+        self.assertEqual(results[0], (('+', '3', '2'), 5, 'Operation Performed: 3+2=5'))
+        self.assertEqual(results[1][1], 0.1411200080598672)
+        self.assertEqual(results[2][2], "Number 2 can't be zero. Please provide correct input.")
+
+    def test_map_batch(self):
+        """ Test the sharded columns give the same arrays as the sequential batch
+        """
+        cal = calculator.ScientificCalculator()
+        first = np.linspace(-5, 5, 20)
+        second = np.arange(20) % 4
+        output_data, messages = self.executor.map_batch('/', first, second)
+        expected_data, expected_messages = cal.perform_operation_batch('/', first, second)
+        np.testing.assert_array_equal(output_data, expected_data)
+        self.assertEqual(list(messages), list(expected_messages))
+
+        output_data, messages = self.executor.map_batch('log', first, 2, '*')
+        expected_data, expected_messages = cal.perform_scientific_operation_batch(
+            'log', first, 2, '*')
+        np.testing.assert_array_equal(output_data, expected_data)
+        self.assertEqual(list(messages), list(expected_messages))
+
+    def test_map_batch_in_flight_shards(self):
+        """ Test only a bounded number of shards of the columns is submitted at once
+        """
+        pool = self.executor.pool
+        submit = pool.submit
+        futures = []
+        in_flight = []
+
+        def record_submit(*args):
+            in_flight.append(sum(not future.done() for future in futures) + 1)
+            futures.append(submit(*args))
+            return futures[-1]
+
+        pool.submit = record_submit
+        try:
+            output_data, _ = self.executor.map_batch('+', np.arange(60), 1)
+        finally:
+            del pool.submit
+        np.testing.assert_array_equal(output_data, np.arange(60) + 1)
+        self.assertEqual(len(futures), 20)
+        self.assertLessEqual(max(in_flight), 2 * self.executor.workers)
+
+
+if __name__ == '__main__':
+    unittest.main()
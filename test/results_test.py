@@ -0,0 +1,97 @@
+""" Test cases for the result types of the calculator operations
+"""
+
+# Importing modules
+import logging
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app import calculator
+from app import results
+
+
+class TestOperationResult(unittest.TestCase):
+    """ Test cases for the result of a single operation
+    """
+    def setUp(self):
+        self.cal = calculator.ScientificCalculator()
+
+    def test_fields(self):
+        """ Test the result holds the value, the status and the inputs of the operation
+        """
+        result = self.cal.calculate('+', '3', '2')
+        self.assertEqual((result.value, result.status, result.operator, result.operands),
+                         (5, results.OK, '+', ('3', '2')))
+        self.assertTrue(result.ok)
+        failed = self.cal.calculate('/', '3', '0')
+        self.assertEqual((failed.value, failed.status), (None, results.ZERO_DIVISION))
+        self.assertFalse(failed.ok)
+        self.assertEqual(failed.output_data, '')
+        with self.assertRaises(AttributeError):
+            result.extra = 1
+
+    def test_lazy_message(self):
+        """ Test the display message is rendered on first access only, when no
+            logging handler formats it
+        """
+        logging.disable(logging.WARNING)
+        self.addCleanup(logging.disable, logging.NOTSET)
+        result = self.cal.calculate_scientific('sin', '3', '2', '+')
+        self.assertIsNone(result._message)  # pylint: disable=protected-access
+        self.assertEqual(result.message, 'Operation Performed: sin3+2={}'.format(result.value))
+        self.assertIs(result.message, result.message)
+        self.assertEqual(self.cal.calculate_scientific('log', '', '1').message,
+                         'Operation Performed: log1=0.0')
+        self.assertEqual(self.cal.calculate_scientific('log', '-1').message,
+                         calculator.MATH_DOMAIN_MESSAGE)
+
+    def test_message_rendered_by_logging(self):
+        """ Test the message is logged when a handler formats the records
+        """
+        with self.assertLogs('calculatorLogs', logging.INFO) as logs:
+            self.cal.calculate('*', '3', '2')
+        self.assertIn('INFO:calculatorLogs:Operation Performed: 3*2=6', logs.output)
+
+    def test_tuple_compatibility(self):
+        """ Test the result unpacks and compares like the (output, message) tuple
+        """
+        result = self.cal.calculate('-', '3', '2')
+        output_data, message = result
+        self.assertEqual((output_data, message), (1, 'Operation Performed: 3-2=1'))
+        self.assertEqual(result, (1, 'Operation Performed: 3-2=1'))
+        self.assertEqual(result[1], message)
+        self.assertEqual(self.cal.perform_operation('-', '3', '2'), result.as_tuple())
+        self.assertIsInstance(self.cal.perform_operation('-', '3', '2'), tuple)
+        self.assertIsInstance(self.cal.perform_scientific_operation('sin', 'a'), tuple)
+
+
+class TestBatchResult(unittest.TestCase):
+    """ Test cases for the result of a batch operation
+    """
+    def test_status_codes(self):
+        """ Test the batch result holds a status code per row and builds the messages
+            on demand
+        """
+        cal = calculator.ScientificCalculator()
+        result = cal.calculate_batch('/', ['6', 'a', '1'], [3, 1, 0])
+        self.assertEqual(result.status.dtype, np.uint8)
+        self.assertEqual(list(result.status), [results.OK, results.INVALID_INPUT,
+                                               results.ZERO_DIVISION])
+        self.assertEqual(list(result.ok), [True, False, False])
+        self.assertEqual(result.failed_rows, 2)
+        self.assertEqual(list(result.messages), [None, calculator.INVALID_INPUT_MESSAGE,
+                                                 calculator.ZERO_DIVISION_MESSAGE])
+
+        output_data, messages = cal.perform_scientific_operation_batch('log', [1, -1])
+        scientific = cal.calculate_scientific_batch('log', [1, -1])
+        np.testing.assert_array_equal(output_data, scientific.values)
+        self.assertEqual(list(messages), list(scientific.messages))
+        self.assertEqual(list(scientific.status), [results.OK, results.MATH_DOMAIN])
+
+
+if __name__ == '__main__':
+    unittest.main()
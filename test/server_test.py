@@ -0,0 +1,118 @@
+""" Test cases for the asyncio calculation service and its client
+"""
+
+# Importing modules
+import asyncio
+import json
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app.calculator import ScientificCalculator
+from app.server import EVALUATION_ERROR_MESSAGE, CalculationClient, CalculationServer
+
+
+class TestCalculationServer(unittest.IsolatedAsyncioTestCase):
+    """ Test cases for the requests served over a local TCP socket
+    """
+    async def asyncSetUp(self):
+        """ Start the server on a free port and connect a client to it
+        """
+        self.server = CalculationServer(max_delay=0.005)
+        self.host, self.port = await self.server.start('127.0.0.1', 0)
+        self.client = await CalculationClient().connect(self.host, self.port)
+
+    async def asyncTearDown(self):
+        """ Close the client and the server
+        """
+        await self.client.close()
+        await self.server.close()
+
+    async def test_operations(self):
+        """ Test the arithmetic and scientific operations of the service
+        """
+        self.assertEqual(await self.client.calculate('+', '3', '2'), (5.0, None))
+        self.assertEqual(await self.client.calculate('sin', 3, 2, '+'),
+                         (-0.9589242746631385, None))
+        self.assertEqual(await self.client.calculate('log', '3'), (1.0986122886681098, None))
+
+    async def test_errors(self):
+        """ Test the invalid requests are answered with the error message
+        """
+        self.assertEqual(await self.client.calculate('/', '7', '0'),
+                         (None, "Number 2 can't be zero. Please provide correct input."))
+        self.assertEqual(await self.client.calculate('+', 'a', '2'),
+                         (None, "Please provide valid input."))
+        self.assertEqual(await self.client.calculate('pow', '2', '3'),
+                         (None, "Please provide valid input."))
+        self.assertEqual(await self.client.calculate('*', '1e308', '10'), (None, None))
+
+    async def test_failed_batch(self):
+        """ Test a batch failing to be evaluated is answered with an error, and the
+            next batches are still evaluated
+        """
+        evaluate_batch = self.server.evaluate_batch
+
+        def fail_once(batch):
+            self.server.evaluate_batch = evaluate_batch
+            raise RuntimeError('evaluation failed')
+
+        self.server.evaluate_batch = fail_once
+        with self.assertLogs('calculatorLogs', 'ERROR'):
+            self.assertEqual(await self.client.calculate('+', '3', '2'),
+                             (None, EVALUATION_ERROR_MESSAGE))
+        self.assertEqual(await self.client.calculate('+', '3', '2'), (5.0, None))
+
+    async def test_pipelined_requests_are_batched(self):
+        """ Test the concurrent requests are evaluated together and answered in order
+        """
+        evaluated_batches = []
+        evaluate_batch = self.server.evaluate_batch
+
+        def record_batch(batch):
+            evaluated_batches.append(len(batch))
+            evaluate_batch(batch)
+
+        self.server.evaluate_batch = record_batch
+        results = await asyncio.gather(*(self.client.calculate('*', index, 2)
+                                         for index in range(100)))
+        self.assertEqual([output for output, _ in results], [index * 2.0 for index in range(100)])
+        self.assertLess(len(evaluated_batches), 100)
+
+    async def test_raw_protocol(self):
+        """ Test the line-delimited JSON protocol, including a malformed line
+        """
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        writer.write(b'not json\n{"id": "a", "operator": "-", "first": 3, "second": 5}\n')
+        await writer.drain()
+        first = json.loads(await reader.readline())
+        second = json.loads(await reader.readline())
+        writer.close()
+        await writer.wait_closed()
+        self.assertEqual(first['error'], "Please provide valid input.")
+        self.assertEqual(second, {'id': 'a', 'output': -2.0, 'error': None})
+
+    async def test_line_too_long(self):
+        """ Test a request line over the limit of the reader is answered with an error
+            and closes the connection
+        """
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        writer.write(b'{"first": "' + b'1' * 100000 + b'"}\n')
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        self.assertEqual(response['error'], "Please provide valid input.")
+        self.assertEqual(await reader.read(), b'')
+        writer.close()
+        await writer.wait_closed()
+        self.assertEqual(await self.client.calculate('+', '3', '2'), (5.0, None))
+
+    def test_complex_mode_rejected(self):
+        """ Test a calculator in the complex mode is rejected
+        """
+        with self.assertRaises(ValueError):
+            CalculationServer(ScientificCalculator(numeric_mode='complex'))
+
+
+if __name__ == '__main__':
+    unittest.main()
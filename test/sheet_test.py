@@ -0,0 +1,138 @@
+""" Test cases for the reactive sheet
+"""
+
+# Importing modules
+import math
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app import calculator
+from app.expression import ExpressionError
+from app.sheet import CycleError, Sheet
+
+
+class TestSheet(unittest.TestCase):
+    """ Test cases for the incremental evaluation of the cells
+    """
+    def setUp(self):
+        """ Setup function creating the sheet C = sin(A+B), D = C/log(E)
+        """
+        self.sheet = Sheet()
+        self.sheet.update({'A': 1, 'B': 2, 'E': 3})
+        self.sheet.set_formula('C', 'sin(A+B)')
+        self.sheet.set_formula('D', 'C/log(E)')
+
+    def test_values(self):
+        """ Test the formulas are evaluated from the referenced cells
+        """
+        self.assertEqual(self.sheet['C'], math.sin(3))
+        self.assertEqual(self.sheet['D'], math.sin(3) / math.log(3))
+        self.assertIsNone(self.sheet.error('D'))
+        self.assertEqual(len(self.sheet), 5)
+
+    def test_only_dependents_recomputed(self):
+        """ Test a change evaluates the cells depending on it only
+        """
+        self.sheet.set_formula('F', 'E*2')
+        self.sheet.evaluations = 0
+        self.sheet.set_value('A', 2)
+        self.assertEqual(self.sheet.evaluations, 2)
+        self.assertEqual(self.sheet['D'], math.sin(4) / math.log(3))
+        self.sheet.evaluations = 0
+        self.sheet.set_value('E', 4)
+        self.assertEqual(self.sheet.evaluations, 2)
+        self.assertEqual(self.sheet['F'], 8)
+
+    def test_diamond_evaluated_once(self):
+        """ Test a cell reached by several paths is evaluated once, after its inputs
+        """
+        self.sheet.set_formula('L', 'A+1')
+        self.sheet.set_formula('R', 'L*2')
+        self.sheet.set_formula('S', 'L+R+A')
+        self.sheet.evaluations = 0
+        self.sheet.set_value('A', 10)
+        self.assertEqual(self.sheet['S'], 11 + 22 + 10)
+        # C, D, L, R and S
+        self.assertEqual(self.sheet.evaluations, 5)
+
+    def test_early_cutoff(self):
+        """ Test the propagation stops at the cells whose value did not change
+        """
+        self.sheet.set_formula('P', 'A % 2')
+        self.sheet.set_formula('Q', 'P * 10')
+        self.sheet.evaluations = 0
+        self.sheet.set_value('A', 3)
+        # C, D and P are evaluated, Q is not as P is still 1
+        self.assertEqual(self.sheet.evaluations, 3)
+        self.assertEqual(self.sheet['Q'], 10)
+        self.sheet.evaluations = 0
+        self.sheet.set_value('A', 3)
+        self.assertEqual(self.sheet.evaluations, 0)
+
+    def test_errors(self):
+        """ Test the errors are reported and propagated to the dependent cells
+        """
+        self.sheet.set_value('E', 1)
+        self.assertEqual(self.sheet.error('D'), calculator.ZERO_DIVISION_MESSAGE)
+        self.sheet.set_value('E', -1)
+        self.assertEqual(self.sheet.error('D'), calculator.MATH_DOMAIN_MESSAGE)
+        self.sheet.set_formula('G', 'D+1')
+        self.assertEqual(self.sheet.error('G'), calculator.MATH_DOMAIN_MESSAGE)
+        self.sheet.set_value('E', 3)
+        self.assertIsNone(self.sheet.error('G'))
+
+        self.sheet.set_formula('H', 'missing*2')
+        self.assertEqual(self.sheet.error('H'), calculator.INVALID_INPUT_MESSAGE)
+        self.sheet.set_value('missing', 4)
+        self.assertEqual(self.sheet['H'], 8)
+        self.sheet.remove('missing')
+        self.assertEqual(self.sheet.error('H'), calculator.INVALID_INPUT_MESSAGE)
+        with self.assertRaises(ExpressionError):
+            self.sheet.set_formula('H', 'A +')
+
+    def test_cycles(self):
+        """ Test the circular references are rejected and leave the sheet unchanged
+        """
+        with self.assertRaises(CycleError):
+            self.sheet.set_formula('A', 'D+1')
+        with self.assertRaises(CycleError):
+            self.sheet.set_formula('X', 'X+1')
+        self.assertNotIn('X', self.sheet)
+        self.assertEqual(self.sheet['A'], 1)
+        self.sheet.set_value('A', 2)
+        self.assertEqual(self.sheet['C'], math.sin(4))
+
+    def test_formula_changes(self):
+        """ Test changing the references of a formula updates the evaluation order
+        """
+        self.sheet.set_formula('M1', 'E+1')
+        self.sheet.set_formula('M2', 'M1+1')
+        self.sheet.set_formula('M3', 'M2+1')
+        self.sheet.set_formula('C', 'sin(A+M3)')
+        self.sheet.evaluations = 0
+        self.sheet.set_value('E', 5)
+        # M1, M2, M3, C and D: C and D are evaluated after M3, once each
+        self.assertEqual(self.sheet.evaluations, 5)
+        self.assertEqual(self.sheet['C'], math.sin(9))
+        self.assertEqual(self.sheet['D'], math.sin(9) / math.log(5))
+
+    def test_long_chain(self):
+        """ Test a chain of tens of thousands of cells, deeper than the recursion limit
+        """
+        sheet = Sheet()
+        sheet.set_value('X0', 0)
+        for index in range(1, 20001):
+            sheet.set_formula('X{}'.format(index), 'X{}+1'.format(index - 1))
+        self.assertEqual(sheet['X20000'], 20000)
+        sheet.evaluations = 0
+        sheet.set_value('X19990', 0)
+        self.assertEqual(sheet.evaluations, 10)
+        self.assertEqual(sheet['X20000'], 10)
+        sheet.set_value('X0', 1)
+        self.assertEqual(sheet['X19989'], 19990)
+
+
+if __name__ == '__main__':
+    unittest.main()
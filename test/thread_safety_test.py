@@ -0,0 +1,151 @@
+""" Test cases for sharing a calculator instance between threads
+"""
+
+# Importing modules
+import math
+import os
+import random
+import sys
+import threading
+import unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app import calculator
+from app.metrics import OperationMetrics
+
+# Number of threads performing the operations at the same time
+THREADS = 8
+
+# Operations performed by each thread, covering the results and all the errors
+OPERATIONS = (
+    [('operation', ('+', str(index), str(index * 3))) for index in range(20)]
+    + [('operation', ('/', str(index), str(index % 4))) for index in range(20)]
+    + [('operation', ('^', '2', str(index))) for index in range(10)]
+    + [('operation', ('*', 'a', '2')), ('operation', ('%', '7.5', '2'))]
+    + [('scientific', ('sin', str(index), None, None)) for index in range(20)]
+    + [('scientific', ('log', str(index - 5), str(index), '+')) for index in range(20)]
+    + [('scientific', ('sqrt', '-4', None, None)), ('scientific', ('exp', '', '', None))]
+)
+
+
+def run_threads(target, count=THREADS):
+    """ Start the threads on the target, released together, and wait for them
+    """
+    barrier = threading.Barrier(count)
+
+    def run(index):
+        barrier.wait()
+        target(index)
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestThreadSafety(unittest.TestCase):
+    """ Test cases for a calculator shared by many threads
+    """
+    def setUp(self):
+        # Switch between the threads as often as possible to expose the races
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+    @staticmethod
+    def perform(cal, kind, args):
+        """ Perform one operation of the workload
+        """
+        if kind == 'operation':
+            return cal.perform_operation(*args)
+        return cal.perform_scientific_operation(*args)
+
+    def test_shared_calculator(self):
+        """ Test the threads get the results of the sequential operations, with and
+            without the cache, and the metrics count every call
+        """
+        sequential_metrics = OperationMetrics()
+        sequential = calculator.ScientificCalculator(metrics=sequential_metrics)
+        expected = [self.perform(sequential, kind, args) for kind, args in OPERATIONS]
+
+        metrics = OperationMetrics()
+        shared = calculator.ScientificCalculator(metrics=metrics)
+        # The cache hits skip the operations, and their metrics
+        cached = calculator.ScientificCalculator(cache_size=32)
+        repeats = 20
+        mismatches = []
+
+        def work(index):
+            order = list(range(len(OPERATIONS))) * repeats
+            random.Random(index).shuffle(order)
+            for position in order:
+                kind, args = OPERATIONS[position]
+                for cal in (shared, cached):
+                    if self.perform(cal, kind, args) != expected[position]:
+                        mismatches.append(OPERATIONS[position])
+
+        run_threads(work)
+        self.assertEqual(mismatches, [])
+        snapshot = metrics.snapshot()
+        sequential_snapshot = sequential_metrics.snapshot()
+        for operator, count in sequential_snapshot['calls'].items():
+            self.assertEqual(snapshot['calls'][operator], count * repeats * THREADS)
+        for operator, errors in sequential_snapshot['errors'].items():
+            for error, count in errors.items():
+                self.assertEqual(snapshot['errors'][operator][error],
+                                 count * repeats * THREADS)
+        self.assertEqual(snapshot['latency']['+']['total']['count'],
+                         snapshot['calls']['+'])
+
+    def test_angle_mode_change(self):
+        """ Test changing the angle mode while other threads calculate never mixes
+            both modes in a result nor caches a result under the other mode
+        """
+        # Distinct operand texts of the same angle, each one cached separately
+        operands = ['90.' + '0' * index for index in range(300)]
+        cal = calculator.ScientificCalculator(cache_size=2 * len(operands))
+        radians, degrees = math.sin(90), 1.0
+        unexpected = []
+        done = threading.Event()
+
+        def work(index):
+            if index == 0:
+                while not done.is_set():
+                    cal.angle_mode = 'deg'
+                    cal.angle_mode = 'rad'
+                return
+            for operand in operands[index - 1::3]:
+                value, _ = cal.perform_scientific_operation('sin', operand)
+                if value not in (radians, degrees):
+                    unexpected.append(value)
+            if index == 3:
+                done.set()
+
+        run_threads(work, 4)
+        self.assertEqual(unexpected, [])
+        for angle_mode, expected in (('deg', degrees), ('rad', radians)):
+            cal.angle_mode = angle_mode
+            for operand in operands:
+                self.assertEqual(cal.perform_scientific_operation('sin', operand)[0], expected)
+
+    def test_metrics_shards(self):
+        """ Test each thread records into its own shard, the shards of the finished
+            threads being merged
+        """
+        metrics = OperationMetrics()
+        run_threads(lambda index: [metrics.record('+', {'total': 1e-6}) for _ in range(1000)])
+        run_threads(lambda index: metrics.record('-', {'total': 1e-6}, 'zero_division'))
+        # pylint: disable=protected-access
+        self.assertLessEqual(len(metrics._shards), THREADS + 1)
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot['calls'], {'+': 1000 * THREADS, '-': THREADS})
+        self.assertEqual(snapshot['errors'], {'-': {'zero_division': THREADS}})
+        self.assertEqual(snapshot['latency']['+']['total']['count'], 1000 * THREADS)
+        self.assertEqual(metrics._shards, [])
+        metrics.reset()
+        self.assertEqual(metrics.snapshot()['calls'], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+""" Test cases for the unit-aware evaluation of the expressions
+"""
+
+# Importing modules
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+from app import calculator
+from app import expression
+from app.units import UnitError, compile_unit_expression, parse_unit
+
+
+class TestUnits(unittest.TestCase):
+    """ Test cases for the units, their dimensions and their conversions
+    """
+    def test_parse_unit(self):
+        """ Test the named, prefixed and composed units are resolved into SI units
+        """
+        self.assertEqual(str(parse_unit('N*m')), 'kg*m^2/s^2')
+        self.assertTrue(parse_unit('J').same_dimensions(parse_unit('kW*h')))
+        self.assertAlmostEqual(parse_unit('kW*h').scale, 3.6e6)
+        self.assertAlmostEqual(parse_unit('km/h').scale, 1 / 3.6)
+        self.assertEqual(str(parse_unit('m^0.5')), 'm^(1/2)')
+        self.assertTrue(parse_unit('deg').dimensionless)
+        self.assertEqual(parse_unit(''), parse_unit('1'))
+        for text in ('furlong', 'm^s', 'm +', "__import__('os')"):
+            with self.subTest(text=text), self.assertRaises(UnitError):
+                parse_unit(text)
+
+    def test_conversions(self):
+        """ Test the variables are converted from their units and the result into the
+            output unit
+        """
+        speed = compile_unit_expression('d / t', {'d': 'km', 't': 'h'}, to='m/s')
+        self.assertEqual(speed(d=36, t=1), 10.0)
+        self.assertEqual(str(speed.unit), 'm/s')
+        energy = compile_unit_expression('0.5 * m * v**2', {'m': 'g', 'v': 'km/h'}, to='J')
+        self.assertAlmostEqual(energy(m=2000, v=36), 100.0)
+        area = compile_unit_expression('sqrt(a * b)', {'a': 'm^2', 'b': 'cm^2'})
+        self.assertEqual(str(area.unit), 'm^2')
+        self.assertAlmostEqual(area(a=1, b=1e4), 1.0)
+        angle = compile_unit_expression('sin(x)', {'x': 'deg'})
+        np.testing.assert_allclose(angle(x=np.array([30.0, 90.0])), [0.5, 1.0])
+
+    def test_incompatible_dimensions(self):
+        """ Test the operations mixing incompatible dimensions are rejected at compile time
+        """
+        for source, units, to in (('x + y', {'x': 'm', 'y': 's'}, None),
+                                  ('x + 1', {'x': 'm'}, None),
+                                  ('log(x)', {'x': 'm'}, None),
+                                  ('x ** y', {'x': 'm'}, None),
+                                  ('x', {'x': 'm'}, 's')):
+            with self.subTest(source=source), self.assertRaises(UnitError):
+                compile_unit_expression(source, units, to)
+        self.assertTrue(issubclass(UnitError, expression.ExpressionError))
+
+    def test_pure_arithmetic(self):
+        """ Test the SI units compile to the same code as the plain expression, and
+            the other units to a single scale factor per variable
+        """
+        source = 'v * t + a * t**2 / 2'
+        plain = expression.compile_expression(source)
+        si_units = compile_unit_expression(source, {'v': 'm/s', 'a': 'm/s^2', 't': 's'})
+        self.assertEqual(si_units.function.code, plain.function.code)
+        scaled = compile_unit_expression('d / t', {'d': 'km', 't': 's'})
+        self.assertEqual(scaled.function.code.count('*'), 1)
+        self.assertEqual(si_units(v=2, a=4, t=3), plain(v=2, a=4, t=3))
+
+    def test_calculator_evaluate(self):
+        """ Test the calculator evaluates the unit expressions and caches them
+        """
+        cal = calculator.ScientificCalculator()
+        compiled = compile_unit_expression('f / m', {'f': 'kN', 'm': 'kg'})
+        self.assertIs(compiled, compile_unit_expression('f / m', {'f': 'kN', 'm': 'kg'}))
+        self.assertEqual(cal.evaluate(compiled, f=2, m=4), 500.0)
+        np.testing.assert_array_equal(cal.evaluate(compiled, f=[1, 2], m=1), [1000.0, 2000.0])
+
+
+if __name__ == '__main__':
+    unittest.main()